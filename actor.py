@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/actor.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) class DeviceActor
+#          (2) command classes Call, GetOption, Measure, Stop
+#
+# input: --
+# output: --
+#
+# created 2026-10-18
+
+"""
+This module provides a device actor, which owns an EyeOne object on one
+thread and executes commands from a queue, so that many threads can share
+one i1 Pro safely.
+
+"""
+
+import threading
+from concurrent.futures import Future
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+
+class Command(object):
+    """
+    Base class of all commands. future receives the result.
+
+    """
+    def __init__(self):
+        self.future = Future()
+
+
+class Call(Command):
+    """
+    Calls the function name (e.g. "I1_SetOption") of the EyeOne object
+    with args.
+
+    """
+    def __init__(self, name, args):
+        Command.__init__(self)
+        self.name = name
+        self.args = args
+
+
+class GetOption(Command):
+    """
+    Calls I1_GetOption(key). Adjacent GetOption commands with the same key
+    are answered by one call.
+
+    """
+    def __init__(self, key):
+        Command.__init__(self)
+        self.key = key
+
+
+class Measure(Command):
+    """
+    Triggers a measurement and fetches fields with EyeOne.measure. Trigger
+    and fetches are executed together, so no other command can get in
+    between.
+
+    """
+    def __init__(self, fields):
+        Command.__init__(self)
+        self.fields = fields
+
+
+class Stop(Command):
+    """
+    Stops the owner thread after all commands queued before it.
+
+    """
+    pass
+
+
+class DeviceActor(object):
+    """
+    Owns an EyeOne object on a dedicated thread.
+
+    Every I1_* function of the EyeOne object is available on the actor
+    with the same arguments, but returns a concurrent.futures.Future
+    instead of the result. The commands are executed one after another in
+    the order they were submitted. Commands, which are waiting in the queue
+    at the same time, are coalesced where this does not change the
+    results: adjacent I1_GetOption calls with the same key are executed
+    only once.
+
+    Example:
+
+    >>> actor = DeviceActor(eyeone.EyeOne(dummy=True))
+    >>> future = actor.I1_GetOption(constants.COLOR_SPACE_KEY)
+    >>> measurement = actor.measure().result()
+    >>> actor.close()
+
+    """
+
+    def __init__(self, eyeone):
+        self.eyeone = eyeone
+        self.executed_calls = 0
+        self.coalesced_calls = 0
+        self._queue = queue.Queue()
+        # submit checks and sets _closed and puts under the lock, so no
+        # command is put after the Stop
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run,
+                name="DeviceActor")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def __getattr__(self, name):
+        if not name.startswith("I1_"):
+            raise AttributeError(name)
+        if name == "I1_GetOption":
+            return self.get_option
+        def call(*args):
+            return self.submit(Call(name, args))
+        return call
+
+    def submit(self, command):
+        """
+        Puts command in the queue and returns its future. Raises
+        RuntimeError, if the actor is stopped or stopping.
+
+        """
+        with self._lock:
+            if self._closed or not self._thread.is_alive():
+                raise RuntimeError("DeviceActor is stopped.")
+            if isinstance(command, Stop):
+                self._closed = True
+            self._queue.put(command)
+        return command.future
+
+    def get_option(self, key):
+        """
+        Returns a future for I1_GetOption(key).
+
+        """
+        return self.submit(GetOption(key))
+
+    def measure(self, fields=("spectrum", "tristimulus")):
+        """
+        Returns a future for EyeOne.measure(fields).
+
+        """
+        return self.submit(Measure(fields))
+
+    def close(self):
+        """
+        Executes all pending commands and stops the owner thread.
+
+        """
+        try:
+            self.submit(Stop()).result()
+        except RuntimeError:
+            # stopped or stopping already
+            pass
+        self._thread.join()
+
+    def _run(self):
+        """
+        Loop of the owner thread.
+
+        """
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not self._execute(batch):
+                break
+        # fail commands, which are still queued
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                command = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            command.future.set_exception(
+                    RuntimeError("DeviceActor is stopped."))
+
+    def _execute(self, batch):
+        """
+        Executes a batch of commands and returns False after a Stop.
+
+        """
+        i = 0
+        while i < len(batch):
+            command = batch[i]
+            if isinstance(command, Stop):
+                command.future.set_result(None)
+                for rest in batch[i + 1:]:
+                    rest.future.set_exception(
+                            RuntimeError("DeviceActor is stopped."))
+                return False
+            group = [command]
+            if isinstance(command, GetOption):
+                while (i + len(group) < len(batch) and
+                        isinstance(batch[i + len(group)], GetOption) and
+                        batch[i + len(group)].key == command.key):
+                    group.append(batch[i + len(group)])
+            i += len(group)
+            try:
+                if isinstance(command, GetOption):
+                    result = self.eyeone.I1_GetOption(command.key)
+                elif isinstance(command, Measure):
+                    result = self.eyeone.measure(command.fields)
+                else:
+                    result = getattr(self.eyeone, command.name)(
+                            *command.args)
+            except Exception as err:
+                for member in group:
+                    member.future.set_exception(err)
+            else:
+                for member in group:
+                    member.future.set_result(result)
+            self.executed_calls += 1
+            self.coalesced_calls += len(group) - 1
+        return True
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/asynceyeone.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) class AsyncEyeOne
+#
+# input: --
+# output: --
+#
+# created 2026-10-18
+
+"""
+This module provides an asyncio front-end for the EyeOne class. It needs
+python 3.7 or newer.
+
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent import futures
+
+try:
+    from . import constants
+    from .eyeone import EyeOne
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import constants
+    from eyeone import EyeOne
+
+
+class AsyncEyeOne(object):
+    """
+    Runs all calls of an EyeOne object on one dedicated thread and makes
+    them awaitable.
+
+    All I1_* functions of the wrapped EyeOne are available as coroutine
+    functions with the same arguments. Additionally, there are:
+
+        calibrate: sets measurement mode and color space and calibrates
+        wait_for_key: waits for a key press without blocking the loop
+        measure: triggers a measurement and fetches it
+        get_scan: fetches all samples of a scan
+
+    Example:
+
+    >>> async def main():
+    ...     async with AsyncEyeOne(dummy=True) as eo:
+    ...         await eo.calibrate(final_prompt=None)
+    ...         measurement = await eo.measure()
+    ...         print(measurement["spectrum"])
+    >>> asyncio.run(main())
+
+    """
+
+    def __init__(self, eyeone=None, dummy=False):
+        """
+        Wraps eyeone. If eyeone is None, a new EyeOne(dummy=dummy) is
+        created on the executor thread.
+
+        """
+        self._executor = futures.ThreadPoolExecutor(max_workers=1)
+        if eyeone is None:
+            eyeone = self._executor.submit(EyeOne, dummy=dummy).result()
+        self.eyeone = eyeone
+
+    def __getattr__(self, name):
+        if not name.startswith("I1_"):
+            raise AttributeError(name)
+        func = getattr(self.eyeone, name)
+        async def call(*args):
+            return await self._run(func, *args)
+        call.__doc__ = func.__doc__
+        return call
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Shuts down the executor thread.
+
+        """
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, func, *args, **kwargs):
+        """
+        Runs func on the executor thread and returns its result.
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor,
+                functools.partial(func, *args, **kwargs))
+
+    async def _run_waiting(self, func, *args):
+        """
+        Runs func, which waits for the key, on the executor thread and
+        returns its result.
+
+        If the task is cancelled, while func is running, the key wait of
+        func is cancelled, as soon as it runs (see KeyWaiter.cancel).
+
+        """
+        future = self._executor.submit(func, *args)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if not future.cancel():
+                threading.Thread(target=self._cancel_key_wait,
+                        args=(future,), daemon=True).start()
+            raise
+
+    def _cancel_key_wait(self, future):
+        """
+        Cancels the key waits of the running future until it is done.
+
+        """
+        waiter = self.eyeone.key_waiter
+        while not future.done():
+            waiter.cancel()
+            futures.wait([future], waiter.fast_interval)
+
+    async def wait_for_key(self, timeout=None, callback=None, event=None):
+        """
+        Waits until the key on the i1 Pro is pressed and returns a
+        keywait.KeyPress.
+
+        EyeOne.wait_for_key runs on the executor thread, while the event
+        loop keeps running. See there for the parameters and exceptions;
+        eyeone.key_waiter.notify reports device messages to the wait. The
+        wait can be cancelled like every other task.
+
+        """
+        return await self._run_waiting(self.eyeone.wait_for_key, timeout,
+                callback, event)
+
+    async def calibrate(self, measurement_mode=constants.I1_SINGLE_EMISSION,
+            color_space=constants.COLOR_SPACE_CIExyY,
+            final_prompt="\nPlease put i1 Pro in measurement position "
+            + "and hit button to start measurement."):
+        """
+        Runs EyeOne.calibrate on the executor thread. See there for the
+        parameters and the result.
+
+        Other than EyeOne.calibrate, the event loop keeps running, while
+        waiting for the key presses. Cancelling the task cancels the key
+        wait, which is running or, during I1_Calibrate, the next one.
+
+        """
+        return await self._run_waiting(self.eyeone.calibrate,
+                measurement_mode, color_space, final_prompt)
+
+    async def measure(self, fields=("spectrum", "tristimulus")):
+        """
+        Triggers a measurement and fetches it. See EyeOne.measure.
+
+        """
+        return await self._run(self.eyeone.measure, fields)
+
+    async def get_scan(self, fields=("spectrum", "tristimulus",
+            "densities")):
+        """
+        Fetches all samples of a scan. See EyeOne.get_scan.
+
+        """
+        return await self._run(self.eyeone.get_scan, fields)
@@ -0,0 +1,320 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/benchmark.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) benchmarks of the hot paths of the wrapper
+#          (2) comparison against a baseline
+#
+# input: baseline json file (optional)
+# output: json file with the results (optional)
+#
+# created 2026-10-18
+
+"""
+Benchmarks the python layer of the wrapper.
+
+The default backend (null) does nothing in its I1_* functions, so only
+the costs of the wrapper itself are measured. The simulated backend (all
+latencies set to zero) adds the colorimetry of the simulator to every
+fetch, the dummy its own python code.
+
+Usage:
+
+    python benchmark.py --output results.json
+    python benchmark.py --baseline results.json --tolerance 0.2
+
+With --baseline the script exits with status 1, if any result is more
+than tolerance (relative) worse than in the baseline.
+
+"""
+
+from __future__ import print_function, division
+
+import argparse
+import json
+import sys
+import time
+from ctypes import c_float
+
+import numpy
+
+try:
+    from . import colorimetry
+    from . import constants
+    from . import eyeone
+    from . import simulator
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import colorimetry
+    import constants
+    import eyeone
+    import simulator
+
+# wall clock with the highest resolution
+_timer = getattr(time, "perf_counter", time.time)
+
+
+class NullBackend(object):
+    """
+    Backend, whose I1_* functions return at once without filling buffers.
+    Options are kept in a dict; a scan has strip_length samples.
+
+    """
+
+    def __init__(self, strip_length=200):
+        self.strip_length = strip_length
+        self.options = dict()
+
+    def I1_IsConnected(self):
+        return constants.eNoError
+
+    def I1_KeyPressed(self):
+        return constants.eNoError
+
+    def I1_GetNumberOfAvailableSamples(self):
+        return self.strip_length
+
+    def I1_Calibrate(self):
+        return constants.eNoError
+
+    def I1_TriggerMeasurement(self):
+        return constants.eNoError
+
+    def I1_GetSpectrum(self, spectrum, index):
+        return constants.eNoError
+
+    def I1_GetTriStimulus(self, tri_stimulus, index):
+        return constants.eNoError
+
+    def I1_GetDensities(self, densities, index):
+        return constants.eNoError
+
+    def I1_SetSubstrate(self, substrate_spectrum):
+        return constants.eNoError
+
+    def I1_SetOption(self, option, value):
+        self.options[option] = value
+        return constants.eNoError
+
+    def I1_GetOption(self, option):
+        return self.options.get(option, constants.UNDEFINED.encode("ascii"))
+
+
+def _best_time(func, number, repeat=3):
+    """
+    Returns the best time per call of func in seconds out of repeat runs
+    of number calls.
+
+    """
+    best = None
+    for i in range(repeat):
+        start = _timer()
+        for j in range(number):
+            func()
+        elapsed = (_timer() - start) / number
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def make_eyeone(backend="null", strip_length=200):
+    """
+    Returns a calibrated EyeOne with zero latencies.
+
+    """
+    if backend == "dummy":
+        eo = eyeone.EyeOne(dummy=True)
+    elif backend == "null":
+        eo = eyeone.EyeOne(backend=NullBackend(strip_length))
+    else:
+        eo = eyeone.EyeOne(backend=simulator.SimulatedBackend(seed=0,
+            time_scale=0.0, strip_length=strip_length, noise=0.0))
+    eo.set_option(constants.I1_MEASUREMENT_MODE,
+            constants.I1_SINGLE_EMISSION)
+    eo.I1_Calibrate()
+    eo.I1_TriggerMeasurement()
+    return eo
+
+
+def bench_call_overhead(eo, number=2000):
+    """
+    Time per call of every I1_* function in microseconds.
+
+    """
+    spectrum = (c_float * constants.SPECTRUM_SIZE)()
+    tri_stimulus = (c_float * constants.TRISTIMULUS_SIZE)()
+    densities = (c_float * constants.DENSITY_SIZE)()
+    eo.I1_SetSubstrate(spectrum)
+    calls = {
+            "I1_IsConnected": (),
+            "I1_KeyPressed": (),
+            "I1_GetNumberOfAvailableSamples": (),
+            "I1_Calibrate": (),
+            "I1_TriggerMeasurement": (),
+            "I1_GetSpectrum": (spectrum, 0),
+            "I1_GetTriStimulus": (tri_stimulus, 0),
+            "I1_GetDensities": (densities, 0),
+            "I1_SetSubstrate": (spectrum,),
+            "I1_SetOption": (constants.COLOR_SPACE_KEY.encode("ascii"),
+                constants.COLOR_SPACE_CIELab.encode("ascii")),
+            "I1_GetOption": (constants.COLOR_SPACE_KEY.encode("ascii"),),
+            }
+    results = dict()
+    for name, args in sorted(calls.items()):
+        func = getattr(eo, name)
+        results["call." + name] = (_best_time(lambda: func(*args),
+            number) * 1e6, "us", False)
+    return results
+
+
+def bench_single_shot(eo, number=500):
+    """
+    Time of trigger plus fetch of spectrum and tri stimulus.
+
+    """
+    return {"single_shot.measure": (_best_time(eo.measure, number) * 1e6,
+        "us", False)}
+
+
+def bench_scan(eo, number=20):
+    """
+    Samples per second fetched by get_scan.
+
+    """
+    eo.set_option(constants.I1_MEASUREMENT_MODE,
+            constants.I1_SCANNING_REFLECTANCE)
+    eo.I1_Calibrate()
+    eo.I1_TriggerMeasurement()
+    samples = eo.I1_GetNumberOfAvailableSamples()
+    samples = int(getattr(samples, "value", samples))
+    per_scan = _best_time(lambda: eo.get_scan(("spectrum", "tristimulus")),
+            number)
+    eo.set_option(constants.I1_MEASUREMENT_MODE,
+            constants.I1_SINGLE_EMISSION)
+    eo.I1_Calibrate()
+    eo.I1_TriggerMeasurement()
+    return {"scan.get_scan": (samples / per_scan, "samples/s", True)}
+
+
+def bench_options(eo, number=5000):
+    """
+    Rates of cached and uncached option sets and gets.
+
+    """
+    spaces = [constants.COLOR_SPACE_CIELab, constants.COLOR_SPACE_CIEXYZ]
+    state = [0]
+
+    def toggle():
+        state[0] ^= 1
+        eo.set_option(constants.COLOR_SPACE_KEY, spaces[state[0]])
+
+    def get_uncached():
+        eo.option_cache.invalidate(constants.COLOR_SPACE_KEY)
+        eo.get_option(constants.COLOR_SPACE_KEY)
+
+    return {
+        "options.set_changed": (1 / _best_time(toggle, number), "calls/s",
+            True),
+        "options.set_unchanged": (1 / _best_time(lambda: eo.set_option(
+            constants.COLOR_SPACE_KEY, spaces[state[0]]), number),
+            "calls/s", True),
+        "options.get_cached": (1 / _best_time(lambda: eo.get_option(
+            constants.COLOR_SPACE_KEY), number), "calls/s", True),
+        "options.get_uncached": (1 / _best_time(get_uncached, number),
+            "calls/s", True),
+        }
+
+
+def bench_conversion(n_spectra=100000, number=3):
+    """
+    Spectra per second converted into all color spaces.
+
+    """
+    spectra = numpy.random.RandomState(0).uniform(0, 1,
+            (n_spectra, constants.SPECTRUM_SIZE)).astype(numpy.float32)
+    single = _best_time(lambda: colorimetry.convert(spectra,
+        constants.COLOR_SPACE_CIELab), number)
+    every = _best_time(lambda: colorimetry.convert_all(spectra), number)
+    return {"conversion.lab": (n_spectra / single, "spectra/s", True),
+            "conversion.all": (n_spectra / every, "spectra/s", True)}
+
+
+def run(backend="null", quick=False):
+    """
+    Runs all benchmarks and returns a dict, which maps the name of every
+    result to a dict with value, unit and higher_is_better.
+
+    """
+    scale = 10 if quick else 1
+    eo = make_eyeone(backend)
+    results = dict()
+    results.update(bench_call_overhead(eo, 2000 // scale))
+    results.update(bench_single_shot(eo, 500 // scale))
+    if backend != "dummy":
+        # the dummy has no scanning mode
+        results.update(bench_scan(eo, max(20 // scale, 1)))
+    results.update(bench_options(eo, 5000 // scale))
+    results.update(bench_conversion(100000 // scale))
+    return dict((name, {"value": value, "unit": unit,
+        "higher_is_better": higher}) for name, (value, unit, higher) in
+        results.items())
+
+
+def compare(results, baseline, tolerance=0.2):
+    """
+    Returns a list of (name, value, baseline value) of all results, which
+    are more than tolerance worse than in baseline.
+
+    """
+    regressions = list()
+    for name, result in sorted(results.items()):
+        if name not in baseline:
+            continue
+        value = result["value"]
+        old = baseline[name]["value"]
+        if result["higher_is_better"]:
+            worse = value < old * (1 - tolerance)
+        else:
+            worse = value > old * (1 + tolerance)
+        if worse:
+            regressions.append((name, value, old))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backend", choices=("null", "simulator", "dummy"),
+            default="null")
+    parser.add_argument("--output", help="write results to this json file")
+    parser.add_argument("--baseline", help="compare against this json file")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+            help="allowed relative slow down (default 0.2)")
+    parser.add_argument("--quick", action="store_true",
+            help="run fewer iterations")
+    args = parser.parse_args(argv)
+
+    results = run(args.backend, args.quick)
+    for name, result in sorted(results.items()):
+        print("%-40s %14.2f %s" % (name, result["value"], result["unit"]))
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(results, baseline, args.tolerance)
+        for name, value, old in regressions:
+            print("REGRESSION %s: %.2f (baseline %.2f)" % (name, value, old),
+                    file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
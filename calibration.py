@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/calibration.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) class CalibrationManager
+#
+# input: state file (optional)
+# output: state file (optional)
+#
+# created 2026-10-18
+
+"""
+This module keeps track of the calibration of an i1 Pro, so that a still
+valid calibration is reused across jobs and processes and the user is only
+asked to calibrate, if it is necessary.
+
+"""
+
+from __future__ import print_function
+
+import json
+import os
+import time
+
+try:
+    from . import constants
+    from .errors import EyeOneError
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import constants
+    from errors import EyeOneError
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class CalibrationManager(object):
+    """
+    Decides when an i1 Pro has to be (re)calibrated.
+
+    A calibration is valid for the measurement mode it was made in and for
+    max_age seconds. The age is taken from I1_LAST_CALIBRATION_TIME, if
+    the i1 Pro reports it, otherwise from the time recorded in the state.
+    If state_file is given, the state (per serial number and measurement
+    mode: time and I1_CALIBRATION_COUNT) is saved there and read by the
+    next process.
+
+    Example:
+
+    >>> manager = CalibrationManager(eo, max_age=3 * 3600,
+    ...         state_file="i1_calibration.json")
+    >>> manager.ensure()
+    >>> measurement = manager.run(eo.measure)
+
+    Attributes:
+        epoch: integer, which changes with every calibration, e.g. to
+            invalidate cached measurements
+        calibrations: number of calibrations done by this manager
+
+    """
+
+    def __init__(self, eyeone, max_age=3600, state_file=None,
+            prompt="\nPlease put i1 Pro on calibration plate and "
+            "press key to start calibration.", retries=1):
+        self.eyeone = eyeone
+        self.max_age = max_age
+        self.state_file = state_file
+        self.prompt = prompt
+        self.retries = retries
+        self.calibrations = 0
+        self._state = self._load()
+
+    def _load(self):
+        if self.state_file is None or not os.path.exists(self.state_file):
+            return dict()
+        try:
+            with open(self.state_file) as state_file:
+                return json.load(state_file)
+        except (IOError, OSError, ValueError):
+            return dict()
+
+    def _save(self):
+        if self.state_file is None:
+            return
+        temp_path = "%s.%i.tmp" % (self.state_file, os.getpid())
+        with open(temp_path, "w") as temp_file:
+            json.dump(self._state, temp_file, indent=2, sort_keys=True)
+        os.rename(temp_path, self.state_file)
+
+    def _record(self):
+        """
+        Returns the state of the current device and measurement mode.
+
+        """
+        serial = self.eyeone.get_option(constants.I1_SERIAL_NUMBER)
+        mode = self.eyeone.get_option(constants.I1_MEASUREMENT_MODE)
+        return self._state.setdefault(serial, dict()).setdefault(mode,
+                dict())
+
+    @property
+    def epoch(self):
+        # time of the calibration in ms, so that it also differs between
+        # processes, which do not share a state file
+        return int(self._record().get("time", 0) * 1000)
+
+    def age(self):
+        """
+        Returns the seconds since the last calibration in the current
+        measurement mode or None, if unknown.
+
+        """
+        record = self._record()
+        if "time" not in record:
+            return None
+        seconds = _to_int(self.eyeone.get_option(
+            constants.I1_LAST_CALIBRATION_TIME))
+        if seconds is None:
+            seconds = time.time() - record["time"]
+        return seconds
+
+    def is_valid(self):
+        """
+        Returns True, if the last calibration can still be used.
+
+        """
+        record = self._record()
+        if "time" not in record:
+            return False
+        count = _to_int(self.eyeone.get_option(
+            constants.I1_CALIBRATION_COUNT))
+        if (count is not None and record.get("count") is not None and
+                count != record["count"]):
+            # calibrated by somebody else meanwhile, e.g. in another mode
+            return False
+        age = self.age()
+        return age is not None and age < self.max_age
+
+    def calibrate(self):
+        """
+        Asks for the calibration plate, waits for the key and calibrates.
+        Raises EyeOneError, if the calibration fails.
+
+        """
+        self.eyeone.is_calibrated = False
+        if self.prompt:
+            print(self.prompt)
+            self.eyeone.wait_for_key()
+        error = self.eyeone.I1_Calibrate()
+        if error != constants.eNoError:
+            raise self.eyeone.error(error, "calibration failed.")
+        record = self._record()
+        record["time"] = time.time()
+        record["count"] = _to_int(self.eyeone.get_option(
+            constants.I1_CALIBRATION_COUNT))
+        self._save()
+        self.calibrations += 1
+        self.eyeone.is_calibrated = True
+
+    def ensure(self):
+        """
+        Calibrates, if the last calibration is not valid anymore. Returns
+        True, if it calibrated.
+
+        """
+        if self.is_valid():
+            self.eyeone.is_calibrated = True
+            return False
+        self.calibrate()
+        return True
+
+    def invalidate(self):
+        """
+        Forgets the calibration of the current measurement mode.
+
+        """
+        self._record().pop("time", None)
+        self.eyeone.is_calibrated = False
+        self._save()
+
+    def run(self, func, *args, **kwargs):
+        """
+        Calls func(*args, **kwargs). If it fails with eDeviceNotCalibrated,
+        either as EyeOneError or as int return value, the i1 Pro is
+        recalibrated and func is called again (up to retries times).
+
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                result = func(*args, **kwargs)
+            except EyeOneError as err:
+                if (err.error_code != constants.eDeviceNotCalibrated or
+                        attempt == self.retries):
+                    raise
+            else:
+                # only I1_* functions return error codes, others e.g. arrays
+                if (not isinstance(result, int) or
+                        result != constants.eDeviceNotCalibrated or
+                        attempt == self.retries):
+                    return result
+            self.invalidate()
+            self.calibrate()
+
+    def measure(self, fields=("spectrum", "tristimulus")):
+        """
+        Calibrates if necessary and returns EyeOne.measure(fields), which
+        is repeated after a recalibration, if the i1 Pro is not calibrated.
+
+        """
+        self.ensure()
+        return self.run(self.eyeone.measure, fields)
@@ -0,0 +1,409 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/cietables.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: tables of the CIE standard observers and illuminants
+#
+# input: --
+# output: --
+#
+# created 2026-10-18
+
+"""
+CIE colour matching functions and relative spectral power distributions of
+the illuminants, which can be set with ILLUMINATION_KEY, tabulated in
+10 nm steps from 380 nm to 780 nm.
+
+The colour matching functions are the CIE 1931 2 degree and the CIE 1964
+10 degree standard observers. The illuminants are the CIE tables of A, B,
+C, D50, D55, D65, D75, F2, F7 and F11.
+
+The density tables are the red, green and blue spectral products of the
+density standards, which can be set with DENSITY_STANDARD_KEY, given as
+log10 of the spectral product with a peak of 5.0 like in ISO 5-3. None
+means a spectral product of zero.
+
+"""
+
+try:
+    from . import constants
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import constants
+
+WAVELENGTHS = tuple(range(380, 781, 10))
+
+TWO_DEGREE_X = (
+    0.001368, 0.004243, 0.014310, 0.043510, 0.134380, 0.283900, 0.348280,
+    0.336200, 0.290800, 0.195360, 0.095640, 0.032010, 0.004900, 0.009300,
+    0.063270, 0.165500, 0.290400, 0.433450, 0.594500, 0.762100, 0.916300,
+    1.026300, 1.062200, 1.002600, 0.854450, 0.642400, 0.447900, 0.283500,
+    0.164900, 0.087400, 0.046770, 0.022700, 0.011359, 0.005790, 0.002899,
+    0.001440, 0.000690, 0.000332, 0.000166, 0.000083, 0.000042,
+    )
+
+TWO_DEGREE_Y = (
+    0.000039, 0.000120, 0.000396, 0.001210, 0.004000, 0.011600, 0.023000,
+    0.038000, 0.060000, 0.090980, 0.139020, 0.208020, 0.323000, 0.503000,
+    0.710000, 0.862000, 0.954000, 0.994950, 0.995000, 0.952000, 0.870000,
+    0.757000, 0.631000, 0.503000, 0.381000, 0.265000, 0.175000, 0.107000,
+    0.061000, 0.032000, 0.017000, 0.008210, 0.004102, 0.002091, 0.001047,
+    0.000520, 0.000249, 0.000120, 0.000060, 0.000030, 0.000015,
+    )
+
+TWO_DEGREE_Z = (
+    0.006450, 0.020050, 0.067850, 0.207400, 0.645600, 1.385600, 1.747060,
+    1.772110, 1.669200, 1.287640, 0.812950, 0.465180, 0.272000, 0.158200,
+    0.078250, 0.042160, 0.020300, 0.008750, 0.003900, 0.002100, 0.001650,
+    0.001100, 0.000800, 0.000340, 0.000190, 0.000050, 0.000020, 0.000000,
+    0.000000, 0.000000, 0.000000, 0.000000, 0.000000, 0.000000, 0.000000,
+    0.000000, 0.000000, 0.000000, 0.000000, 0.000000, 0.000000,
+    )
+
+TEN_DEGREE_X = (
+    0.000160, 0.002362, 0.019110, 0.084736, 0.204492, 0.314679, 0.383734,
+    0.370702, 0.302273, 0.195618, 0.080507, 0.016172, 0.003816, 0.037465,
+    0.117749, 0.236491, 0.376772, 0.529826, 0.705224, 0.878655, 1.014160,
+    1.118520, 1.123990, 1.030480, 0.856297, 0.647467, 0.431567, 0.268329,
+    0.152568, 0.081261, 0.040851, 0.019941, 0.009577, 0.004553, 0.002175,
+    0.001045, 0.000508, 0.000251, 0.000126, 0.000065, 0.000033,
+    )
+
+TEN_DEGREE_Y = (
+    0.000017, 0.000253, 0.002004, 0.008756, 0.021391, 0.038676, 0.062077,
+    0.089456, 0.128201, 0.185190, 0.253589, 0.339133, 0.460777, 0.606741,
+    0.761757, 0.875211, 0.961988, 0.991761, 0.997340, 0.955552, 0.868934,
+    0.777405, 0.658341, 0.527963, 0.398057, 0.283493, 0.179828, 0.107633,
+    0.060281, 0.031800, 0.015905, 0.007749, 0.003718, 0.001768, 0.000846,
+    0.000407, 0.000199, 0.000098, 0.000050, 0.000025, 0.000013,
+    )
+
+TEN_DEGREE_Z = (
+    0.000705, 0.010482, 0.086011, 0.389366, 0.972542, 1.553480, 1.967280,
+    1.994800, 1.745370, 1.317560, 0.772125, 0.415254, 0.218502, 0.112044,
+    0.060709, 0.030451, 0.013676, 0.003988, -0.000000, 0.000000, 0.000000,
+    0.000000, 0.000000, 0.000000, 0.000000, 0.000000, 0.000000, 0.000000,
+    0.000000, 0.000000, 0.000000, 0.000000, 0.000000, 0.000000, 0.000000,
+    0.000000, 0.000000, 0.000000, 0.000000, 0.000000, 0.000000,
+    )
+
+ILLUMINANT_A = (
+    9.80, 12.09, 14.71, 17.68, 21.00, 24.67, 28.70, 33.09,
+    37.81, 42.87, 48.24, 53.91, 59.86, 66.06, 72.50, 79.13,
+    85.95, 92.91, 100.00, 107.18, 114.44, 121.73, 129.04, 136.35,
+    143.62, 150.84, 157.98, 165.03, 171.96, 178.77, 185.43, 191.93,
+    198.26, 204.41, 210.37, 216.12, 221.67, 227.00, 232.12, 237.01,
+    241.68,
+    )
+
+ILLUMINANT_B = (
+    22.40, 31.30, 41.30, 52.10, 63.20, 73.10, 80.80, 85.40,
+    88.30, 92.00, 95.20, 96.50, 94.20, 90.70, 89.50, 92.20,
+    96.90, 101.00, 102.80, 102.60, 101.00, 99.20, 98.00, 98.50,
+    99.70, 101.00, 102.20, 103.90, 105.00, 104.90, 103.90, 101.60,
+    99.10, 96.20, 92.90, 89.40, 86.90, 85.20, 84.70, 85.40,
+    87.00,
+    )
+
+ILLUMINANT_C = (
+    33.00, 47.40, 63.30, 80.60, 98.10, 112.40, 121.50, 124.00,
+    123.10, 123.80, 123.90, 120.70, 112.10, 102.30, 96.90, 98.00,
+    102.10, 105.20, 105.30, 102.30, 97.80, 93.20, 89.70, 88.40,
+    88.10, 88.00, 87.80, 88.20, 87.90, 86.30, 84.00, 80.20,
+    76.30, 72.40, 68.30, 64.40, 61.50, 59.20, 58.10, 58.20,
+    59.10,
+    )
+
+ILLUMINANT_D50 = (
+    24.49, 29.87, 49.31, 56.51, 60.03, 57.82, 74.83, 87.25,
+    90.61, 91.37, 95.11, 91.96, 95.72, 96.61, 97.13, 102.10,
+    100.75, 102.32, 100.00, 97.73, 98.92, 93.50, 97.69, 99.27,
+    99.04, 95.72, 98.86, 95.67, 98.19, 103.00, 99.13, 87.38,
+    91.60, 92.89, 76.85, 86.51, 92.58, 78.23, 57.69, 82.92,
+    78.27,
+    )
+
+ILLUMINANT_D55 = (
+    32.58, 38.09, 60.95, 68.55, 71.58, 67.91, 85.61, 97.99,
+    100.46, 99.91, 102.74, 98.08, 100.68, 100.69, 99.99, 104.21,
+    102.10, 102.97, 100.00, 97.22, 97.75, 91.43, 94.42, 95.14,
+    94.22, 90.45, 92.33, 88.85, 90.32, 93.95, 89.96, 79.68,
+    82.84, 84.84, 70.23, 79.30, 84.99, 71.88, 52.79, 75.93,
+    71.82,
+    )
+
+ILLUMINANT_D65 = (
+    49.98, 54.65, 82.75, 91.49, 93.43, 86.68, 104.86, 117.01,
+    117.81, 114.86, 115.92, 108.81, 109.35, 107.80, 104.79, 107.69,
+    104.41, 104.05, 100.00, 96.33, 95.79, 88.69, 90.01, 89.60,
+    87.70, 83.29, 83.70, 80.03, 80.21, 82.28, 78.28, 69.72,
+    71.61, 74.35, 61.60, 69.89, 75.09, 63.59, 46.42, 66.81,
+    63.38,
+    )
+
+ILLUMINANT_D75 = (
+    66.70, 69.96, 101.93, 111.89, 112.80, 103.09, 121.20, 133.01,
+    132.35, 127.32, 126.80, 117.78, 116.59, 113.70, 108.66, 110.44,
+    106.29, 104.90, 100.00, 95.62, 94.21, 87.00, 87.23, 86.14,
+    83.58, 78.75, 78.43, 74.80, 74.32, 75.42, 71.58, 63.85,
+    65.08, 68.07, 56.44, 64.24, 69.15, 58.63, 42.62, 61.35,
+    58.32,
+    )
+
+ILLUMINANT_F2 = (
+    1.18, 1.84, 3.44, 3.85, 4.19, 5.06, 11.81, 6.63,
+    7.19, 7.54, 7.65, 7.62, 7.28, 7.05, 7.16, 8.04,
+    10.01, 16.64, 16.16, 18.62, 22.79, 18.66, 16.54, 13.80,
+    10.95, 8.40, 6.31, 4.68, 3.45, 2.55, 1.89, 1.53,
+    1.10, 0.88, 0.68, 0.56, 0.51, 0.47, 0.46, 0.40,
+    0.27,
+    )
+
+ILLUMINANT_F7 = (
+    2.56, 3.84, 6.15, 7.37, 7.71, 9.15, 17.52, 12.00,
+    13.08, 13.71, 13.95, 13.82, 13.43, 13.08, 12.78, 12.44,
+    12.26, 17.05, 12.58, 12.83, 16.75, 12.67, 12.19, 11.60,
+    11.12, 10.76, 10.11, 10.02, 9.87, 7.27, 5.83, 5.04,
+    4.12, 3.46, 2.73, 2.25, 1.90, 1.62, 1.45, 1.17,
+    0.81,
+    )
+
+ILLUMINANT_F11 = (
+    0.91, 0.46, 1.29, 1.59, 2.46, 4.49, 12.13, 7.19,
+    6.72, 5.46, 5.66, 14.96, 4.72, 1.47, 0.89, 1.18,
+    39.59, 32.61, 2.83, 1.67, 11.28, 12.73, 7.33, 55.27,
+    13.18, 12.26, 2.07, 3.58, 2.48, 1.54, 1.46, 2.00,
+    1.35, 5.58, 0.57, 0.23, 0.24, 0.20, 0.32, 0.16,
+    0.09,
+    )
+
+OBSERVERS = {
+        constants.OBSERVER_TWO_DEGREE: (TWO_DEGREE_X, TWO_DEGREE_Y,
+            TWO_DEGREE_Z),
+        constants.OBSERVER_TEN_DEGREE: (TEN_DEGREE_X, TEN_DEGREE_Y,
+            TEN_DEGREE_Z),
+        }
+
+ILLUMINANTS = {
+        constants.ILLUMINATION_A: ILLUMINANT_A,
+        constants.ILLUMINATION_B: ILLUMINANT_B,
+        constants.ILLUMINATION_C: ILLUMINANT_C,
+        constants.ILLUMINATION_D50: ILLUMINANT_D50,
+        constants.ILLUMINATION_D55: ILLUMINANT_D55,
+        constants.ILLUMINATION_D65: ILLUMINANT_D65,
+        constants.ILLUMINATION_D75: ILLUMINANT_D75,
+        constants.ILLUMINATION_F2: ILLUMINANT_F2,
+        constants.ILLUMINATION_F7: ILLUMINANT_F7,
+        constants.ILLUMINATION_F11: ILLUMINANT_F11,
+        }
+
+# Spectral products of the density standards (illuminant A, filter and
+# detector). Status A, E, I and T follow ISO 5-3, DIN and DIN NB DIN
+# 16536-2, SPI the SPI narrow band filters. The values are
+# modelled from peak wavelength and bandwidth of every filter; replace
+# them with the tables of the standards, where exact status densities are
+# needed.
+
+DENSITY_DIN = (  # red, green, blue
+    (
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None, 1.526, 3.046, 4.131, 4.783,
+        5.000, 4.965, 4.861, 4.687, 4.444, 4.131, 3.749, 3.298,
+        2.776, 2.186, 1.526, 0.796,  None,  None,  None,  None,
+         None,
+    ),
+    (
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None, 0.844, 1.946, 2.879, 3.643, 4.237, 4.661, 4.915,
+        5.000, 4.946, 4.783, 4.511, 4.131, 3.643, 3.046, 2.340,
+        1.526, 0.603,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,
+    ),
+    (
+        1.012, 2.230, 3.227, 4.003, 4.557, 4.889, 5.000, 4.915,
+        4.661, 4.237, 3.643, 2.879, 1.946, 0.844,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,
+    ),
+    )
+
+DENSITY_DINNB = (  # red, green, blue
+    (
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None, 3.643,
+        5.000, 3.643,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,
+    ),
+    (
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None, 3.643, 5.000,
+        3.643,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,
+    ),
+    (
+         None,  None,  None,  None,  None,  None,  None, 3.643,
+        5.000, 3.643,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,
+    ),
+    )
+
+DENSITY_ANSIA = (  # red, green, blue
+    (
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None, 1.946,
+        3.643, 4.661, 5.000, 4.972, 4.889, 4.751, 4.557, 4.308,
+        4.003, 3.643, 3.227, 2.757, 2.230, 1.649, 1.012, 0.319,
+         None,
+    ),
+    (
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None, 1.230, 2.587, 3.643, 4.397, 4.849, 5.000,
+        4.946, 4.783, 4.511, 4.131, 3.643, 3.046, 2.340, 1.526,
+        0.603,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,
+    ),
+    (
+         None, 1.230, 2.587, 3.643, 4.397, 4.849, 5.000, 4.915,
+        4.661, 4.237, 3.643, 2.879, 1.946, 0.844,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,
+    ),
+    )
+
+DENSITY_ANSIE = (  # red, green, blue
+    (
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None, 1.526, 3.046, 4.131, 4.783,
+        5.000, 4.965, 4.861, 4.687, 4.444, 4.131, 3.749, 3.298,
+        2.776, 2.186, 1.526, 0.796,  None,  None,  None,  None,
+         None,
+    ),
+    (
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None, 0.844, 1.946, 2.879, 3.643, 4.237, 4.661, 4.915,
+        5.000, 4.946, 4.783, 4.511, 4.131, 3.643, 3.046, 2.340,
+        1.526, 0.603,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,
+    ),
+    (
+        1.230, 2.587, 3.643, 4.397, 4.849, 5.000, 4.915, 4.661,
+        4.237, 3.643, 2.879, 1.946, 0.844,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,
+    ),
+    )
+
+DENSITY_ANSII = (  # red, green, blue
+    (
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None, 3.046,
+        4.783, 4.889, 4.003, 2.230,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,
+    ),
+    (
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None, 3.046, 4.783,
+        4.889, 4.003, 2.230,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,
+    ),
+    (
+         None,  None,  None, 1.526, 4.131, 5.000, 4.557, 3.227,
+        1.012,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,
+    ),
+    )
+
+DENSITY_ANSIT = (  # red, green, blue
+    (
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None, 1.230, 2.587, 3.643, 4.397, 4.849, 5.000,
+        4.976, 4.903, 4.783, 4.614, 4.397, 4.131, 3.818, 3.456,
+        3.046, 2.587, 2.081, 1.526, 0.922, 0.271,  None,  None,
+         None,
+    ),
+    (
+         None,  None,  None,  None,  None,  None,  None,  None,
+        0.158, 1.230, 2.168, 2.973, 3.643, 4.179, 4.581, 4.849,
+        4.983, 4.986, 4.878, 4.661, 4.335, 3.901, 3.358, 2.706,
+        1.946, 1.078, 0.101,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,
+    ),
+    (
+         None, 1.012, 2.230, 3.227, 4.003, 4.557, 4.889, 5.000,
+        4.933, 4.732, 4.397, 3.928, 3.324, 2.587, 1.716, 0.711,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,
+    ),
+    )
+
+DENSITY_SPI = (  # red, green, blue
+    (
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None, 2.587,
+        4.397, 5.000, 4.732, 3.928, 2.587, 0.711,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,
+    ),
+    (
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None, 2.587, 4.397, 5.000,
+        4.732, 3.928, 2.587, 0.711,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,
+    ),
+    (
+         None,  None,  None,  None, 2.587, 4.397, 5.000, 4.732,
+        3.928, 2.587, 0.711,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,  None,  None,  None,  None,  None,  None,  None,
+         None,
+    ),
+    )
+
+DENSITY_SPECTRAL_PRODUCTS = {
+        constants.DENSITY_STANDARD_DIN: DENSITY_DIN,
+        constants.DENSITY_STANDARD_DINNB: DENSITY_DINNB,
+        constants.DENSITY_STANDARD_ANSIA: DENSITY_ANSIA,
+        constants.DENSITY_STANDARD_ANSIE: DENSITY_ANSIE,
+        constants.DENSITY_STANDARD_ANSII: DENSITY_ANSII,
+        constants.DENSITY_STANDARD_ANSIT: DENSITY_ANSIT,
+        constants.DENSITY_STANDARD_SPI: DENSITY_SPI,
+        }
@@ -0,0 +1,330 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/colordiff.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) delta_e76, delta_e94, delta_e2000, delta_e
+#          (2) class ReferenceLibrary
+#
+# input: --
+# output: --
+#
+# created 2026-10-18
+
+"""
+This module computes color differences between arrays of CIELab values,
+e.g. the tri stimulus values under COLOR_SPACE_CIELab or the result of
+colorimetry.convert, and finds the closest colors of a reference library.
+It needs numpy.
+
+All functions broadcast, so a whole scan can be compared against a chart
+at once:
+
+>>> import colordiff
+>>> differences = colordiff.delta_e2000(chart_lab, scan_lab)
+
+"""
+
+from __future__ import division
+
+import numpy
+
+DELTA_E_76 = "CIE76"
+DELTA_E_94 = "CIE94"
+DELTA_E_2000 = "CIEDE2000"
+
+
+def _split(lab):
+    lab = numpy.asarray(lab, dtype=numpy.float64)
+    return lab[..., 0], lab[..., 1], lab[..., 2]
+
+
+def delta_e76(lab1, lab2):
+    """
+    Returns the CIE 1976 color difference, i.e. the euclidean distance.
+
+    """
+    difference = (numpy.asarray(lab1, dtype=numpy.float64) -
+            numpy.asarray(lab2, dtype=numpy.float64))
+    return numpy.sqrt((difference ** 2).sum(axis=-1))
+
+
+def delta_e94(lab1, lab2, textiles=False):
+    """
+    Returns the CIE 1994 color difference of lab2 from the reference
+    lab1 with the weights for graphic arts or, if textiles is True, for
+    textiles.
+
+    """
+    if textiles:
+        k_l, k_1, k_2 = 2.0, 0.048, 0.014
+    else:
+        k_l, k_1, k_2 = 1.0, 0.045, 0.015
+    l_1, a_1, b_1 = _split(lab1)
+    l_2, a_2, b_2 = _split(lab2)
+    c_1 = numpy.hypot(a_1, b_1)
+    c_2 = numpy.hypot(a_2, b_2)
+    delta_l = l_1 - l_2
+    delta_c = c_1 - c_2
+    delta_h_squared = numpy.maximum((a_1 - a_2) ** 2 + (b_1 - b_2) ** 2 -
+            delta_c ** 2, 0)
+    s_c = 1 + k_1 * c_1
+    s_h = 1 + k_2 * c_1
+    return numpy.sqrt((delta_l / k_l) ** 2 + (delta_c / s_c) ** 2 +
+            delta_h_squared / s_h ** 2)
+
+
+def delta_e2000(lab1, lab2, k_l=1.0, k_c=1.0, k_h=1.0):
+    """
+    Returns the CIEDE2000 color difference (following Sharma, Wu and
+    Dalal, 2005).
+
+    """
+    l_1, a_1, b_1 = _split(lab1)
+    l_2, a_2, b_2 = _split(lab2)
+    c_mean = (numpy.hypot(a_1, b_1) + numpy.hypot(a_2, b_2)) / 2
+    g = 0.5 * (1 - numpy.sqrt(c_mean ** 7 / (c_mean ** 7 + 25.0 ** 7)))
+    a_1 = (1 + g) * a_1
+    a_2 = (1 + g) * a_2
+    c_1 = numpy.hypot(a_1, b_1)
+    c_2 = numpy.hypot(a_2, b_2)
+    h_1 = numpy.degrees(numpy.arctan2(b_1, a_1)) % 360
+    h_2 = numpy.degrees(numpy.arctan2(b_2, a_2)) % 360
+    chroma_product = c_1 * c_2
+    achromatic = chroma_product == 0
+
+    delta_l = l_2 - l_1
+    delta_c = c_2 - c_1
+    delta_h = h_2 - h_1
+    delta_h = numpy.where(delta_h > 180, delta_h - 360, delta_h)
+    delta_h = numpy.where(delta_h < -180, delta_h + 360, delta_h)
+    delta_h = numpy.where(achromatic, 0, delta_h)
+    delta_big_h = 2 * numpy.sqrt(chroma_product) * numpy.sin(
+            numpy.radians(delta_h) / 2)
+
+    l_mean = (l_1 + l_2) / 2
+    c_mean = (c_1 + c_2) / 2
+    h_sum = h_1 + h_2
+    h_mean = numpy.where(numpy.abs(h_1 - h_2) <= 180, h_sum / 2,
+            numpy.where(h_sum < 360, (h_sum + 360) / 2, (h_sum - 360) / 2))
+    h_mean = numpy.where(achromatic, h_sum, h_mean)
+
+    t = (1 - 0.17 * numpy.cos(numpy.radians(h_mean - 30)) +
+            0.24 * numpy.cos(numpy.radians(2 * h_mean)) +
+            0.32 * numpy.cos(numpy.radians(3 * h_mean + 6)) -
+            0.20 * numpy.cos(numpy.radians(4 * h_mean - 63)))
+    delta_theta = 30 * numpy.exp(-((h_mean - 275) / 25) ** 2)
+    r_c = 2 * numpy.sqrt(c_mean ** 7 / (c_mean ** 7 + 25.0 ** 7))
+    s_l = 1 + 0.015 * (l_mean - 50) ** 2 / numpy.sqrt(20 +
+            (l_mean - 50) ** 2)
+    s_c = 1 + 0.045 * c_mean
+    s_h = 1 + 0.015 * c_mean * t
+    r_t = -numpy.sin(numpy.radians(2 * delta_theta)) * r_c
+
+    lightness = delta_l / (k_l * s_l)
+    chroma = delta_c / (k_c * s_c)
+    hue = delta_big_h / (k_h * s_h)
+    return numpy.sqrt(lightness ** 2 + chroma ** 2 + hue ** 2 +
+            r_t * chroma * hue)
+
+
+_FORMULAS = {
+        DELTA_E_76: delta_e76,
+        DELTA_E_94: delta_e94,
+        DELTA_E_2000: delta_e2000,
+        }
+
+
+def delta_e(lab1, lab2, formula=DELTA_E_2000):
+    """
+    Returns the color difference with formula (DELTA_E_76, DELTA_E_94 or
+    DELTA_E_2000).
+
+    """
+    try:
+        return _FORMULAS[formula](lab1, lab2)
+    except KeyError:
+        raise ValueError("unknown color difference formula: " +
+                str(formula))
+
+
+_SHELLS = dict()
+
+
+def _shell(radius):
+    """
+    Returns the offsets of all cells at chebyshev distance radius as array
+    of shape (m, 3).
+
+    """
+    try:
+        return _SHELLS[radius]
+    except KeyError:
+        pass
+    steps = numpy.arange(-radius, radius + 1)
+    cube = numpy.stack(numpy.meshgrid(steps, steps, steps,
+        indexing="ij"), axis=-1).reshape(-1, 3)
+    offsets = cube[numpy.abs(cube).max(axis=1) == radius]
+    if radius < 16:
+        _SHELLS[radius] = offsets
+    return offsets
+
+
+class ReferenceLibrary(object):
+    """
+    Named CIELab colors with a voxel grid index for nearest color queries.
+
+    The colors are sorted into cubic cells of cell_size ΔE76. A query
+    visits the cells in growing shells around the patch, so it only
+    touches the references close to it instead of all of them. As
+    CIE94 and CIEDE2000 are not euclidean, the k-th smallest difference
+    of the ΔE76 neighbours is turned into a ΔE76 radius, which contains
+    every reference with a smaller difference (see _radius), and all
+    references within it are reranked with formula.
+
+    Example:
+
+    >>> library = ReferenceLibrary(names, reference_lab)
+    >>> names, differences = library.match(scan_lab)
+
+    """
+
+    def __init__(self, names, labs, cell_size=5.0, formula=DELTA_E_2000):
+        self.names = numpy.asarray(names)
+        self.labs = numpy.asarray(labs, dtype=numpy.float64).reshape(-1, 3)
+        if len(self.names) != len(self.labs):
+            raise ValueError("names and labs differ in length.")
+        self.cell_size = cell_size
+        self.formula = formula
+        self._max_chroma = numpy.hypot(self.labs[:, 1], self.labs[:, 2]).max()
+        self._max_lightness = numpy.abs(self.labs[:, 0] - 50).max()
+        cells = numpy.floor(self.labs / cell_size).astype(int)
+        order = numpy.lexsort(cells.T[::-1])
+        cells = cells[order]
+        starts = numpy.flatnonzero(numpy.concatenate(([True],
+            numpy.any(cells[1:] != cells[:-1], axis=1))))
+        stops = numpy.append(starts[1:], len(cells))
+        self._cells = dict((tuple(cells[start].tolist()),
+            order[start:stop]) for start, stop in zip(starts, stops))
+
+    def __len__(self):
+        return len(self.labs)
+
+    def _radius(self, lab, difference, formula):
+        """
+        Returns a ΔE76 radius around lab, which contains every reference
+        with a smaller difference than difference.
+
+        """
+        if formula == DELTA_E_76:
+            return difference
+        chroma = numpy.hypot(lab[1], lab[2])
+        if formula == DELTA_E_94:
+            # S_C = S_H weights ΔC and ΔH with the chroma of the reference,
+            # which is at most chroma + radius
+            scale = 0.045 * difference
+            radius = difference * (1 + 0.045 * max(chroma,
+                self._max_chroma))
+            if scale < 1:
+                radius = min(radius, difference * (1 + 0.045 * chroma) /
+                        (1 - scale))
+            return radius
+        if formula != DELTA_E_2000:
+            raise ValueError("unknown color difference formula: " +
+                    str(formula))
+        # a' is scaled by at most 1.5, S_C >= S_H and the rotation term
+        # R_T shrinks the difference by at most sqrt(1 - sqrt(3) / 2); the
+        # mean chroma is at most chroma + radius / 2
+        rotation = numpy.sqrt(1 - numpy.sqrt(3) / 2)
+        lightness = max(self._max_lightness, abs(lab[0] - 50)) ** 2
+        s_l = 1 + 0.015 * lightness / numpy.sqrt(20 + lightness)
+        radius = difference * max(s_l, 1 + 0.0675 * max(chroma,
+            self._max_chroma)) / rotation
+        scale = 0.03375 * difference
+        if scale < rotation:
+            radius = min(radius, difference * max(s_l, 1 + 0.0675 *
+                chroma) / (rotation - scale))
+        return radius
+
+    def _candidates(self, lab, k=None, radius=None):
+        """
+        Returns the indices of all references within radius ΔE76 of lab
+        or, if radius is None, within the ΔE76 of its k-th nearest
+        reference.
+
+        """
+        center = numpy.floor(lab / self.cell_size).astype(int)
+        found = list()
+        distances = list()
+        visited = 0
+        if radius is not None:
+            # cells in the shells up to radius / cell_size + 1
+            visited = (2 * int(radius // self.cell_size) + 3) ** 3
+        shell = 0
+        # lab may lie anywhere in its cell, so references in cells outside
+        # of the visited shells are at least (shell - 1) * cell_size away
+        while radius is None or (shell - 1) * self.cell_size <= radius:
+            if radius is None:
+                visited += len(_shell(shell))
+            if visited > len(self._cells):
+                # far away from most references: scanning all of them is
+                # cheaper than visiting more cells
+                distances = delta_e76(self.labs, lab)
+                if radius is None:
+                    radius = numpy.sort(distances)[k - 1]
+                return numpy.flatnonzero(distances <= radius)
+            offsets = _shell(shell)
+            for cell in (center + offsets).tolist():
+                indices = self._cells.get(tuple(cell))
+                if indices is not None:
+                    found.append(indices)
+                    distances.append(delta_e76(self.labs[indices], lab))
+            if radius is None and sum(len(part) for part in found) >= k:
+                radius = numpy.sort(numpy.concatenate(distances))[k - 1]
+            shell += 1
+        if not found:
+            return numpy.zeros(0, dtype=int)
+        indices = numpy.concatenate(found)
+        distances = numpy.concatenate(distances)
+        return indices[distances <= radius]
+
+    def nearest(self, labs, k=1, formula=None):
+        """
+        Returns (indices, differences) of the k closest references of
+        every lab value, both of shape (n, k), sorted by the difference.
+
+        """
+        if formula is None:
+            formula = self.formula
+        if not 1 <= k <= len(self):
+            raise ValueError("k has to be between 1 and the number of "
+                    "references.")
+        labs = numpy.asarray(labs, dtype=numpy.float64).reshape(-1, 3)
+        indices = numpy.zeros((len(labs), k), dtype=int)
+        differences = numpy.zeros((len(labs), k))
+        for i, lab in enumerate(labs):
+            candidates = self._candidates(lab, k)
+            if formula != DELTA_E_76:
+                kth = numpy.sort(delta_e(self.labs[candidates], lab,
+                    formula))[k - 1]
+                candidates = self._candidates(lab,
+                        radius=self._radius(lab, kth, formula))
+            candidate_differences = delta_e(self.labs[candidates], lab,
+                    formula)
+            best = numpy.argsort(candidate_differences, kind="mergesort")[:k]
+            indices[i] = candidates[best]
+            differences[i] = candidate_differences[best]
+        return indices, differences
+
+    def match(self, labs, formula=None):
+        """
+        Returns (names, differences) of the closest reference of every
+        lab value.
+
+        """
+        indices, differences = self.nearest(labs, 1, formula)
+        return self.names[indices[:, 0]], differences[:, 0]
@@ -0,0 +1,432 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/colorimetry.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) class MatrixCache
+#          (2) weighting_matrix, white_point, precompute
+#          (3) tristimulus, convert, convert_all
+#          (4) xyz_to
+#
+# input: --
+# output: --
+#
+# created 2026-10-18
+
+"""
+This module converts batches of spectra, as returned by I1_GetSpectrum,
+into the color spaces the i1 Pro offers with COLOR_SPACE_KEY, without
+asking the i1 Pro. It needs numpy.
+
+Spectra are arrays of shape (n, SPECTRUM_SIZE) (or (SPECTRUM_SIZE,) for
+a single spectrum) on the grid 380 nm, 390 nm, ..., 730 nm. Reflectance
+spectra are reflectance factors between 0 and 1, emission spectra are
+spectral radiances in W/(sr m^2 nm).
+
+Example:
+
+>>> import colorimetry, constants
+>>> scan = eo.get_scan(("spectrum",))
+>>> lab = colorimetry.convert(scan["spectrum"], constants.COLOR_SPACE_CIELab,
+...         constants.ILLUMINATION_D50, constants.OBSERVER_TWO_DEGREE)
+
+"""
+
+from __future__ import division
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy
+
+try:
+    from . import cietables
+    from . import constants
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import cietables
+    import constants
+
+DEVICE_WAVELENGTHS = numpy.arange(380, 731, 10)
+
+# luminous efficacy in lm/W used for emission measurements
+K_M = 683.0
+
+# reference white for emission measurements (D65 with Y = 100)
+EMISSION_WHITE_ILLUMINATION = constants.ILLUMINATION_D65
+
+# XYZ to linear sRGB (D65) and the Bradford cone response matrix
+_SRGB = numpy.array([[3.2404542, -1.5371385, -0.4985314],
+                     [-0.9692660, 1.8760108, 0.0415560],
+                     [0.0556434, -0.2040259, 1.0572252]])
+_SRGB_WHITE = numpy.array([95.047, 100.0, 108.883])
+_BRADFORD = numpy.array([[0.8951, 0.2664, -0.1614],
+                         [-0.7502, 1.7135, 0.0367],
+                         [0.0389, -0.0685, 1.0296]])
+
+_EPSILON = (6 / 29) ** 3
+
+
+class MatrixCache(object):
+    """
+    Memoizes the matrices returned by build(*key) with least recently used
+    eviction.
+
+    At most max_size matrices are kept in memory. If cache_dir is not
+    None, every built matrix is also saved there as .npy file and loaded
+    from there instead of being built again, e.g. in the next process.
+    Matrices, which are no numpy arrays (e.g. of scipy.sparse), are only
+    kept in memory and are not made read-only.
+
+    Attributes hits and misses count the lookups, which were answered from
+    memory or not.
+
+    """
+
+    def __init__(self, build, max_size=32, cache_dir=None, prefix="matrix"):
+        self.build = build
+        self.max_size = max_size
+        self.cache_dir = cache_dir
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self._matrices = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._matrices)
+
+    def get(self, *key):
+        """
+        Returns the (read-only) matrix for key.
+
+        """
+        with self._lock:
+            try:
+                matrix = self._matrices.pop(key)
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._matrices[key] = matrix
+                return matrix
+        matrix = self._load(key)
+        if matrix is None:
+            matrix = self.build(*key)
+            if isinstance(matrix, numpy.ndarray):
+                self._save(key, matrix)
+        if isinstance(matrix, numpy.ndarray):
+            matrix.flags.writeable = False
+        with self._lock:
+            self._matrices[key] = matrix
+            while len(self._matrices) > self.max_size:
+                self._matrices.popitem(last=False)
+        return matrix
+
+    def clear(self):
+        """
+        Empties the in-memory cache. Files in cache_dir are kept.
+
+        """
+        with self._lock:
+            self._matrices.clear()
+
+    def _path(self, key):
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir,
+                "%s-%s.npy" % (self.prefix, digest))
+
+    def _load(self, key):
+        if self.cache_dir is None:
+            return None
+        try:
+            return numpy.load(self._path(key))
+        except (IOError, OSError, ValueError):
+            return None
+
+    def _save(self, key, matrix):
+        if self.cache_dir is None:
+            return
+        path = self._path(key)
+        temp_path = "%s.%i.tmp" % (path, os.getpid())
+        try:
+            if not os.path.isdir(self.cache_dir):
+                os.makedirs(self.cache_dir)
+            with open(temp_path, "wb") as temp_file:
+                numpy.save(temp_file, matrix)
+            os.rename(temp_path, path)
+        except (IOError, OSError):
+            pass
+
+
+def _grid_key(wavelengths):
+    """
+    Returns wavelengths as hashable tuple of floats.
+
+    """
+    return tuple(float(wavelength) for wavelength in
+            numpy.ravel(wavelengths))
+
+
+def weighting_matrix(illumination=constants.ILLUMINATION_D50,
+        observer=constants.OBSERVER_TWO_DEGREE,
+        wavelengths=DEVICE_WAVELENGTHS):
+    """
+    Returns the weighting matrix W of shape (len(wavelengths), 3), so that
+    the XYZ values of spectra are spectra.dot(W).
+
+    For reflectance (every illumination except ILLUMINATION_EMISSION) the
+    perfect white has Y = 100. For ILLUMINATION_EMISSION, Y is the
+    luminance in cd/m^2.
+
+    The matrices are built once per (illumination, observer, wavelengths)
+    and kept in weighting_matrices. The returned matrix is read-only.
+
+    """
+    return weighting_matrices.get(illumination, observer,
+            _grid_key(wavelengths))
+
+
+def _weighting_matrix(illumination, observer, wavelengths):
+    """
+    Builds the weighting matrix. See weighting_matrix.
+
+    """
+    try:
+        cmfs = cietables.OBSERVERS[observer]
+    except KeyError:
+        raise ValueError("unknown observer: " + str(observer))
+    wavelengths = numpy.asarray(wavelengths, dtype=numpy.float64)
+    table = cietables.WAVELENGTHS
+    weights = numpy.column_stack([numpy.interp(wavelengths, table, cmf,
+        left=0.0, right=0.0) for cmf in cmfs])
+    if len(wavelengths) > 1:
+        weights *= numpy.gradient(wavelengths)[:, numpy.newaxis]
+    if illumination == constants.ILLUMINATION_EMISSION:
+        return weights * K_M
+    try:
+        power = cietables.ILLUMINANTS[illumination]
+    except KeyError:
+        raise ValueError("unknown illumination: " + str(illumination))
+    weights *= numpy.interp(wavelengths, table, power, left=0.0,
+            right=0.0)[:, numpy.newaxis]
+    return weights * (100 / weights[:, 1].sum())
+
+
+# in-memory cache of all weighting matrices; set
+# weighting_matrices.cache_dir to keep them on disk as well
+weighting_matrices = MatrixCache(_weighting_matrix,
+        prefix="weights")
+
+
+def white_point(illumination=constants.ILLUMINATION_D50,
+        observer=constants.OBSERVER_TWO_DEGREE,
+        wavelengths=DEVICE_WAVELENGTHS):
+    """
+    Returns the XYZ values of the reference white (Y = 100).
+
+    For ILLUMINATION_EMISSION this is the white of
+    EMISSION_WHITE_ILLUMINATION.
+
+    """
+    if illumination == constants.ILLUMINATION_EMISSION:
+        illumination = EMISSION_WHITE_ILLUMINATION
+    return weighting_matrix(illumination, observer, wavelengths).sum(axis=0)
+
+
+def tristimulus(spectra, illumination=constants.ILLUMINATION_D50,
+        observer=constants.OBSERVER_TWO_DEGREE,
+        wavelengths=DEVICE_WAVELENGTHS):
+    """
+    Returns the XYZ values of spectra with shape spectra.shape[:-1] + (3,).
+
+    """
+    spectra = numpy.asarray(spectra)
+    weights = weighting_matrix(illumination, observer, wavelengths)
+    if spectra.dtype == numpy.float32:
+        weights = weights.astype(numpy.float32)
+    return spectra.dot(weights)
+
+
+def precompute(wavelengths=DEVICE_WAVELENGTHS):
+    """
+    Builds the weighting matrices of every illumination and observer for
+    wavelengths in advance, e.g. before a time critical measurement loop
+    or to fill weighting_matrices.cache_dir.
+
+    """
+    for observer in cietables.OBSERVERS:
+        weighting_matrix(constants.ILLUMINATION_EMISSION, observer,
+                wavelengths)
+        for illumination in cietables.ILLUMINANTS:
+            weighting_matrix(illumination, observer, wavelengths)
+
+
+def convert(spectra, color_space, illumination=constants.ILLUMINATION_D50,
+        observer=constants.OBSERVER_TWO_DEGREE,
+        wavelengths=DEVICE_WAVELENGTHS):
+    """
+    Converts spectra into color_space (one of the COLOR_SPACE_* constants)
+    and returns an array with shape spectra.shape[:-1] + (3,).
+
+    """
+    xyz = tristimulus(spectra, illumination, observer, wavelengths)
+    white = white_point(illumination, observer, wavelengths)
+    return xyz_to(xyz, color_space, white)
+
+
+def convert_all(spectra, color_spaces=None,
+        illumination=constants.ILLUMINATION_D50,
+        observer=constants.OBSERVER_TWO_DEGREE,
+        wavelengths=DEVICE_WAVELENGTHS):
+    """
+    Converts spectra into all color_spaces at once and returns a dict,
+    which maps every color space to an array. The XYZ values are computed
+    only once. If color_spaces is None, all COLOR_SPACES are returned.
+
+    """
+    if color_spaces is None:
+        color_spaces = COLOR_SPACES
+    xyz = tristimulus(spectra, illumination, observer, wavelengths)
+    white = white_point(illumination, observer, wavelengths)
+    return dict((color_space, xyz_to(xyz, color_space, white))
+            for color_space in color_spaces)
+
+
+def xyz_to(xyz, color_space, white):
+    """
+    Converts XYZ values (last axis) into color_space relative to the XYZ
+    values of the reference white.
+
+    """
+    try:
+        func = _CONVERSIONS[color_space]
+    except KeyError:
+        raise ValueError("conversion to %s is not supported."
+                % str(color_space))
+    xyz = numpy.asarray(xyz)
+    return func(xyz, numpy.asarray(white, dtype=xyz.dtype))
+
+
+def _split(xyz):
+    return xyz[..., 0], xyz[..., 1], xyz[..., 2]
+
+
+def _divide(numerator, denominator):
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        return numpy.where(denominator != 0, numerator / denominator, 0.0)
+
+
+def _lab_f(t):
+    return numpy.where(t > _EPSILON, numpy.cbrt(t),
+            t / (3 * (6 / 29) ** 2) + 4 / 29)
+
+
+def _polar(lightness, a, b):
+    hue = numpy.degrees(numpy.arctan2(b, a)) % 360
+    return numpy.stack((lightness, numpy.hypot(a, b), hue), axis=-1)
+
+
+def _to_xyz(xyz, white):
+    return xyz.copy()
+
+
+def _to_xyy(xyz, white):
+    X, Y, Z = _split(xyz)
+    total = X + Y + Z
+    white_total = white.sum()
+    x = numpy.where(total != 0, _divide(X, total), white[0] / white_total)
+    y = numpy.where(total != 0, _divide(Y, total), white[1] / white_total)
+    return numpy.stack((x, y, Y), axis=-1)
+
+
+def _to_lab(xyz, white):
+    fx, fy, fz = _split(_lab_f(xyz / white))
+    return numpy.stack((116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)),
+            axis=-1)
+
+
+def _to_lch(xyz, white):
+    lab = _to_lab(xyz, white)
+    return _polar(*_split(lab))
+
+
+def _uv1976(xyz):
+    X, Y, Z = _split(xyz)
+    denominator = X + 15 * Y + 3 * Z
+    return _divide(4 * X, denominator), _divide(9 * Y, denominator)
+
+
+def _to_luv(xyz, white):
+    lightness = 116 * _lab_f(xyz[..., 1] / white[1]) - 16
+    u, v = _uv1976(xyz)
+    u_white, v_white = _uv1976(white)
+    return numpy.stack((lightness, 13 * lightness * (u - u_white),
+        13 * lightness * (v - v_white)), axis=-1)
+
+
+def _to_lchuv(xyz, white):
+    return _polar(*_split(_to_luv(xyz, white)))
+
+
+def _to_uvy1960(xyz, white):
+    u, v = _uv1976(xyz)
+    return numpy.stack((u, v * 2 / 3, xyz[..., 1]), axis=-1)
+
+
+def _to_uvy1976(xyz, white):
+    u, v = _uv1976(xyz)
+    return numpy.stack((u, v, xyz[..., 1]), axis=-1)
+
+
+def _to_hunterlab(xyz, white):
+    X, Y, Z = _split(xyz)
+    X_n, Y_n, Z_n = white
+    k_a = 175 / 198.04 * (X_n + Y_n)
+    k_b = 70 / 218.11 * (Y_n + Z_n)
+    root = numpy.sqrt(numpy.maximum(Y / Y_n, 0))
+    return numpy.stack((100 * root,
+        k_a * _divide(X / X_n - Y / Y_n, root),
+        k_b * _divide(Y / Y_n - Z / Z_n, root)), axis=-1)
+
+
+def _to_rxryrz(xyz, white):
+    return 100 * xyz / white
+
+
+def _to_rgb(xyz, white):
+    cone_white = _BRADFORD.dot(white)
+    cone_srgb = _BRADFORD.dot(_SRGB_WHITE)
+    adapt = numpy.linalg.inv(_BRADFORD).dot(
+            numpy.diag(cone_srgb / cone_white)).dot(_BRADFORD)
+    matrix = _SRGB.dot(adapt) / 100
+    linear = xyz.dot(matrix.T.astype(xyz.dtype))
+    magnitude = numpy.abs(linear)
+    encoded = numpy.where(magnitude <= 0.0031308, 12.92 * magnitude,
+            1.055 * magnitude ** (1 / 2.4) - 0.055)
+    return numpy.sign(linear) * encoded
+
+
+_CONVERSIONS = {
+        constants.COLOR_SPACE_CIEXYZ: _to_xyz,
+        constants.COLOR_SPACE_CIExyY: _to_xyy,
+        constants.COLOR_SPACE_CIELab: _to_lab,
+        constants.COLOR_SPACE_CIELCh: _to_lch,
+        constants.COLOR_SPACE_CIELuv: _to_luv,
+        constants.COLOR_SPACE_CIELChuv: _to_lchuv,
+        constants.COLOR_SPACE_CIE_UV_Y1960: _to_uvy1960,
+        constants.COLOR_SPACE_CIE_UV_Y1976: _to_uvy1976,
+        constants.COLOR_SPACE_HunterLab: _to_hunterlab,
+        constants.COLOR_SPACE_RXRYRZ: _to_rxryrz,
+        constants.COLOR_SPACE_RGB: _to_rgb,
+        }
+
+# COLOR_SPACE_LAB_MG and COLOR_SPACE_LCH_MG are not documented in the SDK
+# and therefore not supported.
+COLOR_SPACES = tuple(sorted(_CONVERSIONS))
@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/density.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) status_weights
+#          (2) densities, density
+#
+# input: --
+# output: --
+#
+# created 2026-10-18
+
+"""
+This module computes status densities of batches of reflectance spectra
+relative to a substrate, as I1_GetDensities does, for all density
+standards at once and without asking the i1 Pro. It needs numpy.
+
+The red, green and blue spectral products (cyan, magenta and yellow
+density) of every DENSITY_STANDARD_* are taken from
+cietables.DENSITY_SPECTRAL_PRODUCTS. The black channel is the visual
+density (CIE y-bar times illuminant A) for every standard.
+
+Example:
+
+>>> import density, constants
+>>> scan = eo.get_scan(("spectrum",))
+>>> cmyk = density.densities(scan["spectrum"], substrate,
+...         constants.DENSITY_STANDARD_DIN)
+
+"""
+
+from __future__ import division
+
+import numpy
+
+try:
+    from . import cietables
+    from . import colorimetry
+    from . import constants
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import cietables
+    import colorimetry
+    import constants
+
+# log10 spectral products of the red, green and blue filter, i.e. of the
+# cyan, magenta and yellow density, on cietables.WAVELENGTHS
+FILTERS = cietables.DENSITY_SPECTRAL_PRODUCTS
+
+DENSITY_STANDARDS = tuple(sorted(FILTERS))
+
+# column of every filter mode in the result of densities
+CHANNELS = {
+        constants.DENSITY_FILTER_MODE_CYAN: 0,
+        constants.DENSITY_FILTER_MODE_MAGENTA: 1,
+        constants.DENSITY_FILTER_MODE_YELLOW: 2,
+        constants.DENSITY_FILTER_MODE_BLACK: 3,
+        }
+
+_FILTER_NAMES = numpy.array([constants.DENSITY_FILTER_MODE_CYAN,
+    constants.DENSITY_FILTER_MODE_MAGENTA,
+    constants.DENSITY_FILTER_MODE_YELLOW,
+    constants.DENSITY_FILTER_MODE_BLACK])
+
+# smallest relative reflectance, i.e. densities are at most 5
+_MIN_REFLECTANCE = 1e-5
+
+
+def _spectral_product(log_values):
+    return numpy.array([0.0 if value is None else 10 ** value for value in
+        log_values])
+
+
+def _status_weights(standard, wavelengths):
+    """
+    Builds the weights. See status_weights.
+
+    """
+    try:
+        filters = FILTERS[standard]
+    except KeyError:
+        raise ValueError("unknown density standard: " + str(standard))
+    wavelengths = numpy.asarray(wavelengths, dtype=numpy.float64)
+    table = cietables.WAVELENGTHS
+    responses = [numpy.interp(wavelengths, table, _spectral_product(
+        log_values), left=0.0, right=0.0) for log_values in filters]
+    responses.append(numpy.interp(wavelengths, table,
+        numpy.multiply(cietables.TWO_DEGREE_Y, cietables.ILLUMINANT_A),
+        left=0.0, right=0.0))
+    weights = numpy.column_stack(responses)
+    return weights / weights.sum(axis=0)
+
+
+# in-memory cache of the weights of all standards
+weights_cache = colorimetry.MatrixCache(_status_weights,
+        prefix="density")
+
+
+def status_weights(standard=constants.DENSITY_STANDARD_ANSIT,
+        wavelengths=colorimetry.DEVICE_WAVELENGTHS):
+    """
+    Returns the weights of shape (len(wavelengths), 4), so that the
+    reflectances of cyan, magenta, yellow and black filter are
+    spectra.dot(weights). The returned matrix is read-only.
+
+    """
+    return weights_cache.get(standard, colorimetry._grid_key(wavelengths))
+
+
+def densities(spectra, substrate=None,
+        standard=constants.DENSITY_STANDARD_ANSIT,
+        wavelengths=colorimetry.DEVICE_WAVELENGTHS):
+    """
+    Returns the cyan, magenta, yellow and black densities of spectra
+    (shape (n, 4), or (4,) for a single spectrum) relative to the
+    substrate spectrum.
+
+    Parameters:
+        spectra: array of shape (n, len(wavelengths)) or (len(wavelengths),)
+        substrate: array of shape (len(wavelengths),) or None
+            spectrum of the paper; None means the perfect white
+        standard: one of DENSITY_STANDARDS or a tuple of them
+            for a tuple the result has an additional first axis with one
+            entry per standard
+
+    """
+    spectra = numpy.asarray(spectra, dtype=numpy.float64)
+    if isinstance(standard, (tuple, list)):
+        return numpy.array([densities(spectra, substrate, single,
+            wavelengths) for single in standard])
+    weights = status_weights(standard, wavelengths)
+    reflectance = spectra.dot(weights)
+    if substrate is not None:
+        reflectance = reflectance / numpy.maximum(numpy.asarray(substrate,
+            dtype=numpy.float64).dot(weights), _MIN_REFLECTANCE)
+    return -numpy.log10(numpy.maximum(reflectance, _MIN_REFLECTANCE))
+
+
+def density(spectra, substrate=None,
+        standard=constants.DENSITY_STANDARD_ANSIT,
+        filter_mode=constants.DENSITY_FILTER_MODE_AUTO,
+        wavelengths=colorimetry.DEVICE_WAVELENGTHS, neutral=0.1,
+        return_filter=False):
+    """
+    Returns the density of every spectrum in filter_mode.
+
+    DENSITY_FILTER_MODE_CYAN, _MAGENTA, _YELLOW and _BLACK select the
+    density of one filter. DENSITY_FILTER_MODE_MAX is the highest of the
+    cyan, magenta and yellow density. DENSITY_FILTER_MODE_AUTO takes the
+    filter of the highest density as well, but the black filter, if the
+    cyan, magenta and yellow densities differ by less than neutral (gray
+    patches).
+
+    If return_filter is True, (density, filter) is returned, where filter
+    are the names of the chosen filters (like I1_LAST_AUTO_DENSITY_FILTER).
+
+    """
+    values = densities(spectra, substrate, standard, wavelengths)
+    if filter_mode in CHANNELS:
+        channel = numpy.full(values.shape[:-1], CHANNELS[filter_mode],
+                dtype=int)
+    elif filter_mode in (constants.DENSITY_FILTER_MODE_MAX,
+            constants.DENSITY_FILTER_MODE_AUTO):
+        chromatic = values[..., :3]
+        channel = chromatic.argmax(axis=-1)
+        if filter_mode == constants.DENSITY_FILTER_MODE_AUTO:
+            spread = chromatic.max(axis=-1) - chromatic.min(axis=-1)
+            channel = numpy.where(spread < neutral,
+                    CHANNELS[constants.DENSITY_FILTER_MODE_BLACK], channel)
+    else:
+        raise ValueError("unknown density filter mode: " + str(filter_mode))
+    result = numpy.take_along_axis(values, channel[..., numpy.newaxis],
+            axis=-1)[..., 0]
+    if return_filter:
+        return result, _FILTER_NAMES[channel]
+    return result
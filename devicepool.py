@@ -0,0 +1,296 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/devicepool.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) class DeviceHandle
+#          (2) class DevicePool
+#
+# input: --
+# output: --
+#
+# created 2026-10-18
+
+"""
+This module provides a pool of several i1 Pros, which are addressed by the
+device types EyeOne (default), EyeOne1, ..., EyeOne127.
+
+The dll is loaded once per process and has a single selected device type,
+so the pool uses its i1 Pros one after another: the calls to the i1 Pros
+are serial and only the work between them (e.g. presenting the next
+patch) overlaps. The pool does not start processes; measuring with
+several i1 Pros at the same time needs one process per i1 Pro, each with
+its own EyeOne object, which is up to the caller.
+
+"""
+
+import threading
+import time
+import weakref
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+try:
+    from . import constants
+    from .errors import DeviceNotCalibratedError, EyeOneError
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import constants
+    from errors import DeviceNotCalibratedError, EyeOneError
+
+MAX_DEVICES = 127
+
+# one lock per dll (or backend), as the selected device type is global
+_dll_lock = threading.RLock()
+_backend_locks = weakref.WeakKeyDictionary()
+_locks_lock = threading.Lock()
+
+
+def device_type(number):
+    """
+    Returns the device type string of the i1 Pro number on the USB bus.
+    Number 0 is the default device I1_EYEONE, 1 is I1_EYEONE_1 and so on
+    up to 127 (I1_EYEONE_127).
+
+    """
+    if number == 0:
+        return constants.I1_EYEONE
+    if not 0 < number <= MAX_DEVICES:
+        raise ValueError("device number has to be between 0 and %i."
+                % MAX_DEVICES)
+    return constants.I1_EYEONE + str(number)
+
+
+def device_count(eyeone):
+    """
+    Returns the number of i1 Pros of the backend of eyeone (its attribute
+    devices), 1 for the dummy and None for the dll, whose devices have to
+    be probed.
+
+    """
+    backend = getattr(eyeone, "backend", None)
+    if backend is not None:
+        return getattr(backend, "devices", None)
+    if getattr(eyeone, "eyeone", None) is None:
+        # the dummy accepts every device type
+        return 1
+    return None
+
+
+def device_lock(eyeone):
+    """
+    Returns the lock, which all handles of the dll (or backend) of eyeone
+    hold while they select their device and use it.
+
+    """
+    backend = getattr(eyeone, "backend", None)
+    if backend is None:
+        return _dll_lock
+    with _locks_lock:
+        lock = _backend_locks.get(backend)
+        if lock is None:
+            lock = _backend_locks[backend] = threading.RLock()
+        return lock
+
+
+class DeviceHandle(object):
+    """
+    Addresses one i1 Pro through an EyeOne object.
+
+    All handles of one dll hold the same lock (see device_lock) from
+    selecting their device until the end of the call, so only one i1 Pro
+    of a process is used at a time. The device type is selected with
+    EyeOne.set_option, which skips the call, if the option cache knows it
+    is selected already. All handles of one process should therefore share
+    one EyeOne object, so that the option cache sees every switch,
+    including ones made with set_option or apply_profile outside of the
+    pool.
+
+    Attributes:
+        device_type: string, e.g. constants.I1_EYEONE_1
+        is_calibrated: bool, calibration state of this device
+        measurements: number of measurements done with this handle
+        busy_time: seconds spent in measure
+
+    """
+
+    def __init__(self, eyeone, device_type):
+        self.eyeone = eyeone
+        self.device_type = device_type
+        self.is_calibrated = False
+        self.measurements = 0
+        self.busy_time = 0.0
+        self._lock = device_lock(eyeone)
+
+    def __repr__(self):
+        return "DeviceHandle(%r)" % self.device_type
+
+    def _select(self):
+        error = self.eyeone.set_option(constants.I1_DEVICE_TYPE,
+                self.device_type)
+        if error != constants.eNoError:
+            raise self.eyeone.error(error, "selecting %s failed."
+                    % self.device_type)
+
+    def call(self, name, *args):
+        """
+        Selects this device and calls the function name of the EyeOne
+        object with args.
+
+        """
+        with self._lock:
+            self._select()
+            return getattr(self.eyeone, name)(*args)
+
+    def calibrate(self, **kwargs):
+        """
+        Selects this device and calls EyeOne.calibrate(**kwargs). Returns
+        True, if successful.
+
+        """
+        with self._lock:
+            self._select()
+            self.is_calibrated = self.eyeone.calibrate(**kwargs)
+            return self.is_calibrated
+
+    def measure(self, fields=("spectrum", "tristimulus")):
+        """
+        Selects this device and calls EyeOne.measure(fields).
+
+        """
+        start = time.time()
+        with self._lock:
+            self._select()
+            measurement = self.eyeone.measure(fields)
+        self.busy_time += time.time() - start
+        self.measurements += 1
+        return measurement
+
+
+class DevicePool(object):
+    """
+    Shares work between several i1 Pros of one process.
+
+    The i1 Pros are used one after another (see DeviceHandle), so the pool
+    is no faster than one i1 Pro, unless the work between the measurements
+    takes as long as the measurements.
+
+    Example:
+
+    >>> pool = DevicePool.enumerate(eyeone.EyeOne())
+    >>> pool.calibrate(final_prompt=None)
+    >>> results = pool.map(measure_patch, patches)
+
+    """
+
+    def __init__(self, handles):
+        if not handles:
+            raise ValueError("DevicePool needs at least one device.")
+        self.handles = list(handles)
+
+    def __len__(self):
+        return len(self.handles)
+
+    @classmethod
+    def enumerate(cls, eyeone, max_devices=MAX_DEVICES):
+        """
+        Finds all i1 Pros connected to the dll of eyeone.
+
+        Tries the default device and the alternative devices EyeOne1,
+        EyeOne2, ... in turn and stops at the first alternative device,
+        which is not connected, or at the number of devices of the backend
+        (see device_count). Returns a DevicePool with one DeviceHandle per
+        connected device.
+
+        """
+        count = device_count(eyeone)
+        if count is not None:
+            max_devices = min(max_devices, count - 1)
+        handles = list()
+        for number in range(max_devices + 1):
+            handle = DeviceHandle(eyeone, device_type(number))
+            try:
+                connected = (handle.call("I1_IsConnected") ==
+                        constants.eNoError)
+            except EyeOneError:
+                connected = False
+            if connected:
+                handles.append(handle)
+            elif number > 0:
+                break
+        return cls(handles)
+
+    def calibrate(self, **kwargs):
+        """
+        Calibrates every device, which is not calibrated yet, one after
+        another. kwargs are passed to EyeOne.calibrate. Returns True, if
+        all devices are calibrated.
+
+        """
+        for handle in self.handles:
+            if not handle.is_calibrated:
+                handle.calibrate(**kwargs)
+        return all(handle.is_calibrated for handle in self.handles)
+
+    def map(self, func, patches, calibrated_only=True):
+        """
+        Calls func(handle, patch) for every patch and returns the results
+        in the order of patches.
+
+        Every device has its own worker thread, which takes the next patch
+        from a shared queue as soon as it is done with the previous one.
+        The calls to the i1 Pros are serial (see DeviceHandle), only the
+        rest of func (e.g. presenting the patch) runs in parallel, so map
+        is no faster than one device, if func mostly measures. If
+        calibrated_only is True, only calibrated devices take part. The
+        first exception raised by func is raised again after all workers
+        stopped.
+
+        """
+        handles = [handle for handle in self.handles
+                if handle.is_calibrated or not calibrated_only]
+        if not handles:
+            raise DeviceNotCalibratedError("no calibrated device in "
+                    "DevicePool.")
+        todo = queue.Queue()
+        for item in enumerate(patches):
+            todo.put(item)
+        results = [None] * todo.qsize()
+        errors = list()
+
+        def work(handle):
+            while not errors:
+                try:
+                    index, patch = todo.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    results[index] = func(handle, patch)
+                except Exception as err:
+                    errors.append(err)
+
+        threads = [threading.Thread(target=work, args=(handle,))
+                for handle in handles]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return results
+
+    def measure(self, patches, fields=("spectrum", "tristimulus")):
+        """
+        Measures one sample per patch with EyeOne.measure(fields) on
+        whichever device is free. Returns a list of dicts in the order of
+        patches.
+
+        """
+        return self.map(lambda handle, patch: handle.measure(fields),
+                patches)
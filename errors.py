@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/errors.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) class EyeOneError and one subclass per error code
+#          (2) error_for_code, read_details
+#          (3) class RetryPolicy
+#
+# input: --
+# output: --
+#
+# created 2026-10-18
+
+"""
+This module maps the error codes (enum I1_ErrorType) of the i1 Pro to
+exceptions and provides a retry policy, which recovers from transient
+errors and recalibrates, if the i1 Pro lost its calibration.
+
+"""
+
+import time
+
+try:
+    from . import constants
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import constants
+
+
+class EyeOneError(Exception):
+    """
+    Raised by the convenience methods of EyeOne, if the i1 Pro returns an
+    error code other than eNoError. The code is stored in error_code,
+    I1_LAST_ERROR and I1_EXTENDED_ERROR_INFORMATION (if read) in the
+    dict details.
+
+    """
+    code = None
+
+    def __init__(self, message, error_code=None, details=None):
+        Exception.__init__(self, message)
+        self.error_code = self.code if error_code is None else error_code
+        self.details = dict() if details is None else details
+
+    def __str__(self):
+        message = Exception.__str__(self)
+        if self.details:
+            message += " (%s)" % ", ".join("%s: %s" % item for item in
+                    sorted(self.details.items()))
+        return message
+
+
+class DeviceNotReadyError(EyeOneError):
+    code = constants.eDeviceNotReady
+
+
+class DeviceNotConnectedError(EyeOneError):
+    code = constants.eDeviceNotConnected
+
+
+class DeviceNotCalibratedError(EyeOneError):
+    code = constants.eDeviceNotCalibrated
+
+
+class KeyNotPressedError(EyeOneError):
+    code = constants.eKeyNotPressed
+
+
+class NoSubstrateWhiteError(EyeOneError):
+    code = constants.eNoSubstrateWhite
+
+
+class WrongMeasureModeError(EyeOneError):
+    code = constants.eWrongMeasureMode
+
+
+class StripRecognitionFailedError(EyeOneError):
+    code = constants.eStripRecognitionFailed
+
+
+class NoDataAvailableError(EyeOneError):
+    code = constants.eNoDataAvailable
+
+
+class DeviceExceptionError(EyeOneError):
+    code = constants.eException
+
+
+class InvalidArgumentError(EyeOneError):
+    code = constants.eInvalidArgument
+
+
+class UnknownError(EyeOneError):
+    code = constants.eUnknownError
+
+
+class WrongDeviceTypeError(EyeOneError):
+    code = constants.eWrongDeviceType
+
+
+ERRORS = dict((cls.code, cls) for cls in (DeviceNotReadyError,
+    DeviceNotConnectedError, DeviceNotCalibratedError, KeyNotPressedError,
+    NoSubstrateWhiteError, WrongMeasureModeError,
+    StripRecognitionFailedError, NoDataAvailableError, DeviceExceptionError,
+    InvalidArgumentError, UnknownError, WrongDeviceTypeError))
+
+# codes, after which the same call may succeed, if it is repeated
+TRANSIENT_ERRORS = (constants.eDeviceNotReady, constants.eException)
+
+
+def error_for_code(error_code, message=None, details=None):
+    """
+    Returns an exception of the EyeOneError subclass of error_code.
+
+    >>> raise error_for_code(constants.eDeviceNotReady, "trigger failed.")
+
+    """
+    cls = ERRORS.get(error_code, EyeOneError)
+    if message is None:
+        message = "i1 Pro returned error code %s." % error_code
+    return cls(message, error_code, details)
+
+
+def read_details(eyeone):
+    """
+    Returns a dict with the values of I1_LAST_ERROR and
+    I1_EXTENDED_ERROR_INFORMATION, which are set and not eNoError.
+
+    """
+    details = dict()
+    for option in (constants.I1_LAST_ERROR,
+            constants.I1_EXTENDED_ERROR_INFORMATION):
+        try:
+            value = eyeone.get_option(option)
+        except Exception:
+            continue
+        if value and value not in (constants.UNDEFINED,
+                str(constants.eNoError)):
+            details[option] = value
+    return details
+
+
+class RetryPolicy(object):
+    """
+    Repeats calls, which fail with a transient error, and recalibrates, if
+    they fail with eDeviceNotCalibrated.
+
+    Transient errors (TRANSIENT_ERRORS by default) are retried up to
+    max_retries times; the n-th retry waits min(delay * backoff ** n,
+    max_delay) seconds. On eDeviceNotCalibrated the calibration
+    (a CalibrationManager) is invalidated and calibrated again, at most
+    max_recalibrations times per call. Every other error is raised at
+    once.
+
+    Example:
+
+    >>> policy = RetryPolicy(eo, calibration=manager)
+    >>> measurement = policy.call(eo.measure)
+    >>> policy.check(eo.I1_SetSubstrate, substrate)
+
+    Attributes:
+        retries: number of retries after transient errors
+        recalibrations: number of recalibrations
+
+    """
+
+    def __init__(self, eyeone, calibration=None, transient=TRANSIENT_ERRORS,
+            max_retries=5, delay=0.1, backoff=2.0, max_delay=10.0,
+            max_recalibrations=1, on_retry=None, sleep=time.sleep):
+        self.eyeone = eyeone
+        self.calibration = calibration
+        self.transient = tuple(transient)
+        self.max_retries = max_retries
+        self.delay = delay
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.max_recalibrations = max_recalibrations
+        self.on_retry = on_retry
+        self.sleep = sleep
+        self.retries = 0
+        self.recalibrations = 0
+
+    def call(self, func, *args, **kwargs):
+        """
+        Returns func(*args, **kwargs), which signals errors by raising
+        EyeOneError (e.g. EyeOne.measure).
+
+        """
+        retries = 0
+        recalibrations = 0
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except EyeOneError as err:
+                if (err.error_code in self.transient and
+                        retries < self.max_retries):
+                    delay = min(self.delay * self.backoff ** retries,
+                            self.max_delay)
+                    retries += 1
+                    self.retries += 1
+                    if self.on_retry is not None:
+                        self.on_retry(err, retries, delay)
+                    self.sleep(delay)
+                elif (err.error_code == constants.eDeviceNotCalibrated and
+                        self.calibration is not None and
+                        recalibrations < self.max_recalibrations):
+                    recalibrations += 1
+                    self.recalibrations += 1
+                    if self.on_retry is not None:
+                        self.on_retry(err, recalibrations, 0)
+                    self.calibration.invalidate()
+                    self.calibration.calibrate()
+                else:
+                    raise
+
+    def check(self, func, *args):
+        """
+        Calls an I1_* function, which returns an error code, like call
+        and raises the EyeOneError of the code, if it does not succeed.
+
+        """
+        def checked():
+            error = func(*args)
+            if error != constants.eNoError:
+                raise error_for_code(error, "%s failed." % getattr(func,
+                    "__name__", "call"), read_details(self.eyeone))
+        self.call(checked)
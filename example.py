@@ -38,11 +38,11 @@ else:
 
 # Print version and serial number of eyeone Pro
 print("SDK_Version: " +
-        str(eyeone.I1_GetOption("Version")))
+        eyeone.get_option(constants.I1_VERSION))
 print("Device serial number: " +
-        str(eyeone.I1_GetOption("SerialNumber")) + "\n")
+        eyeone.get_option(constants.I1_SERIAL_NUMBER) + "\n")
 
-if(eyeone.I1_SetOption(constants.I1_MEASUREMENT_MODE,
+if(eyeone.set_option(constants.I1_MEASUREMENT_MODE,
     constants.I1_SINGLE_EMISSION) ==
         constants.eNoError):
     print("Measurement mode set to single emission.")
@@ -50,7 +50,7 @@ else:
     print("Failed to set measurement mode.")
 
 # Set color space
-if(eyeone.I1_SetOption(constants.COLOR_SPACE_KEY,
+if(eyeone.set_option(constants.COLOR_SPACE_KEY,
     constants.COLOR_SPACE_RGB) ==
         constants.eNoError):
     print("Color space set to RGB.")
@@ -62,8 +62,7 @@ else:
 
 print("\nPlease put eyeone Pro on calibration plate and press \
 key to start calibration.")
-while(eyeone.I1_KeyPressed() != constants.eNoError):
-    time.sleep(0.1)
+eyeone.wait_for_key()
 if (eyeone.I1_Calibrate() == constants.eNoError):
     print("Calibration done.")
 else:
@@ -81,8 +80,7 @@ spectrum = (c_float * constants.SPECTRUM_SIZE)()
 # Trigger measurement and retrieve spectrum and color space.
 print("\nPlease put eyeone Pro in measurement position and press \
 key to start measurement.")
-while(eyeone.I1_KeyPressed() != constants.eNoError):
-    time.sleep(0.1)
+eyeone.wait_for_key()
 if(eyeone.I1_TriggerMeasurement() != constants.eNoError):
     print("Measurement failed.")
 if(eyeone.I1_GetSpectrum(spectrum, 0) != constants.eNoError):
@@ -28,13 +28,24 @@ This module provides a class that wraps the i1 Pro dll file.
 
 from __future__ import print_function
 import sys
+import threading
 from ctypes import cdll, c_int, c_long, c_float, c_char_p
-import time
-import random
 #from exceptions import OSError, ImportError, BaseException, KeyError
 # if it fails to load dll
 
-import constants
+try:
+    from . import constants
+    from .errors import EyeOneError, error_for_code, read_details
+    from .instrument import Instrumentation
+    from .keywait import KeyWaiter
+    from .options import OptionCache, VOLATILE_OPTIONS
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import constants
+    from errors import EyeOneError, error_for_code, read_details
+    from instrument import Instrumentation
+    from keywait import KeyWaiter
+    from options import OptionCache, VOLATILE_OPTIONS
 
 ###########################################################
 ### Prototypes of exported functions (eyeone.dll) BEGIN ###
@@ -43,6 +54,185 @@ import constants
 # I don't if it is possible to implement the callback the error handling ,
 # so it is missing. TODO
 
+# functions exported by the dll (and by every backend)
+I1_FUNCTIONS = ("I1_IsConnected", "I1_KeyPressed",
+        "I1_GetNumberOfAvailableSamples", "I1_Calibrate",
+        "I1_TriggerMeasurement", "I1_GetSpectrum", "I1_GetTriStimulus",
+        "I1_GetDensities", "I1_SetSubstrate", "I1_SetOption",
+        "I1_GetOption")
+
+# restype and argtypes of the functions exported by the dll
+PROTOTYPES = {
+        "I1_IsConnected": (c_int, []), #enum I1_ErrorType
+        "I1_KeyPressed": (c_int, []),
+        "I1_GetNumberOfAvailableSamples": (c_long, []),
+        ## trigger measurements / calibrations
+        "I1_Calibrate": (c_int, []),
+        "I1_TriggerMeasurement": (c_int, []),
+        "I1_GetSpectrum": (c_int,
+            [c_float * constants.SPECTRUM_SIZE, c_long]),
+        "I1_GetTriStimulus": (c_int,
+            [c_float * constants.TRISTIMULUS_SIZE, c_long]),
+        "I1_GetDensities": (c_int,
+            [c_float * constants.DENSITY_SIZE, c_long]),
+        "I1_SetSubstrate": (c_int,
+            [c_float * constants.SPECTRUM_SIZE, c_long]),
+        "I1_SetOption": (c_int, [c_char_p, c_char_p]), #option/key, value
+        "I1_GetOption": (c_char_p, [c_char_p]), #value; option/key
+        }
+
+# the dll is loaded once per process and shared by all EyeOne objects
+_dll = None
+_dll_functions = dict()
+_dll_lock = threading.Lock()
+
+
+def shared_dll():
+    """
+    Loads the runtime library (on win32 eyeone.dll) on first call and
+    returns it. Raises OSError, if it cannot be loaded.
+
+    """
+    global _dll
+    if _dll is None:
+        with _dll_lock:
+            if _dll is None:
+                _dll = cdll.EyeOne
+    return _dll
+
+
+def dll_function(name):
+    """
+    Returns the function name of the shared dll with the prototype of
+    PROTOTYPES. The prototype is set on first use.
+
+    """
+    try:
+        return _dll_functions[name]
+    except KeyError:
+        pass
+    restype, argtypes = PROTOTYPES[name]
+    with _dll_lock:
+        func = getattr(_dll, name)
+        func.restype = restype
+        func.argtypes = argtypes
+        _dll_functions[name] = func
+    return func
+
+
+def _numpy():
+    """
+    Imports numpy on first use, so that importing eyeone stays fast.
+
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("this needs numpy.")
+    return numpy
+
+SCAN_FIELDS = {"spectrum": ("I1_GetSpectrum", constants.SPECTRUM_SIZE),
+               "tristimulus": ("I1_GetTriStimulus",
+                   constants.TRISTIMULUS_SIZE),
+               "densities": ("I1_GetDensities", constants.DENSITY_SIZE)}
+
+
+def _to_bytes(value):
+    """
+    Converts a c_char_p or a string to bytes, like ctypes passes it to the
+    dll.
+
+    """
+    if isinstance(value, c_char_p):
+        return value.value
+    if not isinstance(value, bytes):
+        return value.encode("ascii")
+    return value
+
+
+def _to_str(value):
+    """
+    Converts the bytes returned by I1_GetOption to a string.
+
+    """
+    if isinstance(value, bytes) and not isinstance(value, str):
+        return value.decode("ascii", "replace")
+    return value
+
+
+class BufferRing(object):
+    """
+    Ring of preallocated c_float arrays of the same length.
+
+    Every slot holds a ctypes array, which can be passed to the dll, and a
+    read-only numpy view on the same memory. Slots are handed out in turn,
+    so a view is valid until the ring came around to its slot again,
+    unless the slot is pinned. A pinned slot is skipped until it is
+    released.
+
+    """
+    def __init__(self, length, slots=16):
+        numpy = _numpy()
+        if slots < 1:
+            raise ValueError("a BufferRing needs at least one slot.")
+        self.length = length
+        self.arrays = [(c_float * length)() for i in range(slots)]
+        self.views = list()
+        for array in self.arrays:
+            view = numpy.frombuffer(array, dtype=numpy.float32)
+            view.flags.writeable = False
+            self.views.append(view)
+        self.pinned = [False] * slots
+        self._next = 0
+
+    def acquire(self, pin=False):
+        """
+        Returns the number of the next slot, which is not pinned. If pin is
+        True, the slot is pinned until release is called.
+
+        """
+        slots = len(self.arrays)
+        for i in range(slots):
+            slot = (self._next + i) % slots
+            if not self.pinned[slot]:
+                self._next = (slot + 1) % slots
+                self.pinned[slot] = pin
+                return slot
+        raise RuntimeError("all slots of the BufferRing are pinned.")
+
+    def release(self, view):
+        """
+        Unpins the slot the numpy view belongs to, so it can be recycled.
+
+        """
+        for slot, slot_view in enumerate(self.views):
+            if slot_view is view:
+                self.pinned[slot] = False
+                return
+        raise ValueError("view does not belong to this BufferRing.")
+
+
+class MeasurementBuffers(object):
+    """
+    Holds one BufferRing for spectra, tri stimuli and densities each.
+
+    """
+    def __init__(self, slots=16):
+        self.spectrum = BufferRing(constants.SPECTRUM_SIZE, slots)
+        self.tristimulus = BufferRing(constants.TRISTIMULUS_SIZE, slots)
+        self.densities = BufferRing(constants.DENSITY_SIZE, slots)
+
+    def release(self, view):
+        """
+        Unpins the slot of view in whichever ring it belongs to.
+
+        """
+        for ring in (self.spectrum, self.tristimulus, self.densities):
+            if len(view) == ring.length:
+                ring.release(view)
+                return
+        raise ValueError("view does not belong to these buffers.")
+
 
 class EyeOne(object):
     """
@@ -66,6 +256,22 @@ class EyeOne(object):
     Additionally, there are some methods for convenience:
 
         calibrate: calibrates the i1 Pro
+        wait_for_key: waits for the key of the i1 Pro
+        set_option, get_option: like I1_SetOption and I1_GetOption, but
+            skip calls, if the option state is known from option_cache
+        apply_profile: sets a profiles.MeasurementProfile at once
+        enable_instrumentation, disable_instrumentation: record call
+            counts, error codes and latencies of all I1_* functions
+        start_recording, stop_recording: write all I1_* calls to a trace
+            file, which replay.ReplayBackend plays back
+        key_waiter: the KeyWaiter used by wait_for_key; call
+            eo.key_waiter.cancel() from another thread to abort the wait
+        measure: triggers a measurement and fetches it into numpy arrays
+        measure_averaged: averages measurements until they are precise
+        get_scan: fetches all samples of a scan into numpy arrays
+        get_spectrum, get_tri_stimulus, get_densities: fetch one sample
+            into a recycled buffer and return a numpy view on it
+        buffers: the MeasurementBuffers used by the get_* methods
         is_calibrated: bool, which states if the i1 Pro is calibrated
 
     Example:
@@ -84,7 +290,7 @@ class EyeOne(object):
 
     """
 
-    def __init__(self, dummy=False):
+    def __init__(self, dummy=False, backend=None):
         """
         Loads runtime library (on win32 eyeone.dll).
 
@@ -94,83 +300,32 @@ class EyeOne(object):
 
         For now the dummy gives no error codes. So the dummy behaves as a
         i1 Pro without any problems.
+
+        If backend is not None, no runtime library is loaded either, but
+        the I1_* functions of backend are used instead of the ones of the
+        dll, e.g. a simulator.SimulatedBackend.
         """
         self.dummy = dummy
         self.is_calibrated = False
+        self._buffers = None
+        self.key_waiter = KeyWaiter(self)
+        self.option_cache = OptionCache()
+        self.backend = backend
+        self.instrumentation = None
+        self.recorder = None
+
+        if backend is not None:
+            for name in I1_FUNCTIONS:
+                setattr(self, name, getattr(backend, name))
+            return
 
         try:
             if self.dummy is True:
                 raise BaseException()
-            self.eyeone = cdll.EyeOne
-            ## initialize c_functions and set prototypes
-            # I1_IsConnected
-            self.eyeone.I1_IsConnected.restype = c_int #enum I1_ErrorType
-            self.eyeone.I1_IsConnected.argtypes = []
-            self.eyeone.I1_IsConnected.__doc__ = self.I1_IsConnected.__doc__
-            self.I1_IsConnected = self.eyeone.I1_IsConnected
-            # I1_KeyPressed
-            self.eyeone.I1_KeyPressed.restype = c_int #enum I1_ErrorType
-            self.eyeone.I1_KeyPressed.argtypes = []
-            self.eyeone.I1_KeyPressed.__doc__ = self.I1_KeyPressed.__doc__
-            self.I1_KeyPressed = self.eyeone.I1_KeyPressed
-            # I1_GetNumberOfAvailableSamples
-            self.eyeone.I1_GetNumberOfAvailableSamples.restype = c_long
-            self.eyeone.I1_GetNumberOfAvailableSamples.argtypes = []
-            self.eyeone.I1_GetNumberOfAvailableSamples.__doc__ = \
-                    self.I1_GetNumberOfAvailableSamples.__doc__
-            self.I1_GetNumberOfAvailableSamples = \
-                    self.eyeone.I1_GetNumberOfAvailableSamples
-            
-            ## trigger measurements / calibrations
-            # I1_Calibrate
-            self.eyeone.I1_Calibrate.restype = c_int #enum I1_ErrorType
-            self.eyeone.I1_Calibrate.argtypes = []
-            self.eyeone.I1_Calibrate.__doc__ = self.I1_Calibrate.__doc__
-            self.I1_Calibrate = self.eyeone.I1_Calibrate
-            # I1_TriggerMeasurement
-            self.eyeone.I1_TriggerMeasurement.restype = c_int #enum I1_ErrorType
-            self.eyeone.I1_TriggerMeasurement.argtypes = []
-            self.eyeone.I1_TriggerMeasurement.__doc__ = \
-                    self.I1_TriggerMeasurement.__doc__
-            self.I1_TriggerMeasurement = self.eyeone.I1_TriggerMeasurement
-            # I1_GetSpectrum
-            self.eyeone.I1_GetSpectrum.restype = c_int #enum I1_ErrorType
-            self.eyeone.I1_GetSpectrum.argtypes = \
-                    [c_float * constants.SPECTRUM_SIZE, c_long]
-            self.eyeone.I1_GetSpectrum.__doc__ = self.I1_GetSpectrum.__doc__
-            self.I1_GetSpectrum = self.eyeone.I1_GetSpectrum
-            # I1_GetTriStimulus
-            self.eyeone.I1_GetTriStimulus.restype = c_int #enum I1_ErrorType
-            self.eyeone.I1_GetTriStimulus.argtypes = \
-                    [c_float * constants.TRISTIMULUS_SIZE, c_long]
-            self.eyeone.I1_GetTriStimulus.__doc__ = \
-                    self.I1_GetTriStimulus.__doc__
-            self.I1_GetTriStimulus = self.eyeone.I1_GetTriStimulus
-            # I1_GetDensities
-            self.eyeone.I1_GetDensities.restype = c_int #enum I1_ErrorType
-            self.eyeone.I1_GetDensities.argtypes = \
-                    [c_float * constants.DENSITY_SIZE, c_long]
-            self.eyeone.I1_GetDensities.__doc__ = \
-                    self.I1_GetDensities.__doc__
-            self.I1_GetDensities = self.eyeone.I1_GetDensities
-            # I1_SetSubstrate
-            self.eyeone.I1_SetSubstrate.restype = c_int #enum I1_ErrorType
-            self.eyeone.I1_SetSubstrate.argtypes = \
-                    [c_float * constants.SPECTRUM_SIZE, c_long]
-            self.eyeone.I1_SetSubstrate.__doc__ = \
-                    self.I1_SetSubstrate.__doc__
-            self.I1_SetSubstrate = self.eyeone.I1_SetSubstrate
-            # I1_SetOption
-            self.eyeone.I1_SetOption.restype = c_int #enum I1_ErrorType
-            self.eyeone.I1_SetOption.argtypes = \
-                    [c_char_p, c_char_p] #option/key, value
-            self.eyeone.I1_SetOption.__doc__ = self.I1_SetOption.__doc__
-            self.I1_SetOption = self.eyeone.I1_SetOption
-            # I1_GetOption
-            self.eyeone.I1_GetOption.restype = c_char_p #value
-            self.eyeone.I1_GetOption.argtypes = [c_char_p] #option/key
-            self.eyeone.I1_GetOption.__doc__ = self.I1_GetOption.__doc__
-            self.I1_GetOption = self.eyeone.I1_GetOption
+            self.eyeone = shared_dll()
+            # the prototypes are set, when a function is called first
+            for name in I1_FUNCTIONS:
+                setattr(self, name, self._lazy_function(name))
 
         except(OSError, ImportError, BaseException): 
             print('''
@@ -186,11 +341,26 @@ class EyeOne(object):
             self._spectrum = (c_float * constants.SPECTRUM_SIZE)()
             self._density_spectrum_set = False
 
+    def _lazy_function(self, name):
+        """
+        Returns a function, which binds the dll function name on its first
+        call and replaces itself with the dll function.
+
+        """
+        def call(*args):
+            func = dll_function(name)
+            # do not replace wrappers, e.g. of enable_instrumentation
+            if self.__dict__.get(name) is call:
+                setattr(self, name, func)
+            return func(*args)
+        call.__name__ = name
+        return call
+
 
     ######################################################################
     ### function definitions below are only called if object is ##########
     ### initialized with dummy=True ######################################
-    ####### doc-strings are also used for the dll-functions ##############
+    ####### doc-strings also document the dll-functions ##################
     ######################################################################
     def I1_IsConnected(self):
         """
@@ -256,6 +426,7 @@ class EyeOne(object):
         For details, see constants.py
         """
         #only called if self.dummy==True
+        import random
         if self.is_calibrated:
             self._measurement_triggered = True
             self._tri_stimulus[:] = [random.uniform(0, 1) for i in
@@ -400,10 +571,7 @@ class EyeOne(object):
         For details, see constants.py
         """
         # only called if self.dummy==True
-        if not isinstance(value, c_char_p):
-            value = c_char_p(value)
-        if isinstance(option, c_char_p):
-            self.options[option.value] = value
+        self.options[_to_bytes(option)] = _to_bytes(value)
         return constants.eNoError
 
     def I1_GetOption(self, option):
@@ -427,16 +595,17 @@ class EyeOne(object):
         For details, see constants.py
         """
         # only called if self.dummy==True
-        if not isinstance(option, c_char_p):
-            option = c_char_p(option)
         try:
-            return self.options[option.value]
+            return self.options[_to_bytes(option)]
         except KeyError:
+            if _to_str(option) in VOLATILE_OPTIONS:
+                # the dummy does not keep track of them
+                return _to_bytes(constants.UNDEFINED)
             print("WARNING: option might not be there in a real i1 Pro.",
                     file=sys.stderr)
             print('''If option is not set explicitly, I1_GetOption returns
                     "Undefined" in dummy mode.''', file=sys.stderr)
-            return c_char_p("Undefined") 
+            return _to_bytes(constants.UNDEFINED)
 
     def calibrate(self, measurement_mode=constants.I1_SINGLE_EMISSION,
             color_space=constants.COLOR_SPACE_CIExyY, 
@@ -464,13 +633,13 @@ class EyeOne(object):
 
         """
         # set i1 Pro variables
-        if(self.I1_SetOption(constants.I1_MEASUREMENT_MODE,
+        if(self.set_option(constants.I1_MEASUREMENT_MODE,
             measurement_mode) == constants.eNoError):
             print("Measurement mode set to " + measurement_mode + ".")
         else:
             print("Failed to set measurement mode.")
             return False
-        if(self.I1_SetOption(constants.COLOR_SPACE_KEY, color_space) ==
+        if(self.set_option(constants.COLOR_SPACE_KEY, color_space) ==
                 constants.eNoError):
             print("Color space set to " + color_space + ".")
         else:
@@ -479,8 +648,7 @@ class EyeOne(object):
         # calibrate i1 Pro
         print("\nPlease put i1 Pro on calibration plate and "
         + "press key to start calibration.")
-        while(self.I1_KeyPressed() != constants.eNoError):
-            time.sleep(0.01)
+        self.wait_for_key()
         if (self.I1_Calibrate() == constants.eNoError):
             print("Calibration of i1 Pro done.")
         else:
@@ -492,7 +660,395 @@ class EyeOne(object):
             return True
         # prompt for click on button of i1 Pro
         print(final_prompt)
-        while(self.I1_KeyPressed() != constants.eNoError):
-            time.sleep(0.01)
+        self.wait_for_key()
         return True
 
+
+    def set_option(self, option, value):
+        """
+        Sets option to value with I1_SetOption, unless option_cache knows
+        that the i1 Pro has this value already.
+
+        option and value are strings (see constants.py). Returns enum
+        I1_ErrorType like I1_SetOption.
+
+        """
+        if self.option_cache.is_set(option, value):
+            return constants.eNoError
+        error = self.I1_SetOption(_to_bytes(option), _to_bytes(value))
+        self.option_cache.set(option, value, error)
+        return error
+
+    def get_option(self, option):
+        """
+        Returns the value of option as string. The value is read with
+        I1_GetOption, unless it is known from option_cache.
+
+        Options, which change on their own (e.g. I1_LAST_ERROR or
+        I1_LAST_CALIBRATION_TIME), are always read from the i1 Pro.
+
+        """
+        value = self.option_cache.lookup(option)
+        if value is None:
+            value = _to_str(self.I1_GetOption(_to_bytes(option)))
+            self.option_cache.store(option, value)
+        return value
+
+    def error(self, error_code, message):
+        """
+        Returns the EyeOneError subclass of error_code (see
+        errors.error_for_code) with I1_LAST_ERROR and
+        I1_EXTENDED_ERROR_INFORMATION as details.
+
+        """
+        return error_for_code(error_code, message, read_details(self))
+
+    def apply_profile(self, profile):
+        """
+        Sets all options of profile (a profiles.MeasurementProfile).
+
+        Only options, which differ from the state known by option_cache,
+        are set, in the dependency order of the profile. If one set fails,
+        the options set before are restored to their previous values and
+        EyeOneError is raised.
+
+        Returns the number of I1_SetOption calls.
+
+        """
+        previous = dict(self.option_cache.values)
+        done = list()
+        for option, value in profile.diff(previous):
+            error = self.set_option(option, value)
+            if error != constants.eNoError:
+                # read the error details before the roll back resets them
+                exception = self.error(error, "setting %s to %s failed, "
+                        "profile %s rolled back." % (option, value,
+                            profile.name))
+                self._roll_back(done, previous)
+                raise exception
+            done.append(option)
+        return len(done)
+
+    def _roll_back(self, done, previous):
+        """
+        Restores the options done to their previous values, as far as they
+        are known.
+
+        """
+        if constants.I1_DEVICE_TYPE in done:
+            # the other options were set on the other device
+            done = [constants.I1_DEVICE_TYPE]
+        for option in reversed(done):
+            if option in previous:
+                self.set_option(option, previous[option])
+            else:
+                self.option_cache.invalidate(option)
+
+    def enable_instrumentation(self, trace=None):
+        """
+        Wraps all I1_* functions to record call counts, error codes and
+        latency histograms and returns the instrument.Instrumentation.
+
+        trace is None or a callable, which is called after every call with
+        (name, args, result, seconds).
+
+        """
+        if self.instrumentation is not None:
+            self.instrumentation.trace = trace
+            return self.instrumentation
+        self.instrumentation = Instrumentation(trace)
+        for name in I1_FUNCTIONS:
+            setattr(self, name, self.instrumentation.wrap(name,
+                getattr(self, name)))
+        return self.instrumentation
+
+    def disable_instrumentation(self):
+        """
+        Removes the wrappers of enable_instrumentation, so the I1_*
+        functions are called directly again.
+
+        """
+        if self.instrumentation is None:
+            return
+        for name in I1_FUNCTIONS:
+            setattr(self, name, getattr(self, name).wrapped)
+        self.instrumentation = None
+
+    def start_recording(self, path):
+        """
+        Writes every I1_* call (arguments, filled buffers, result and
+        duration) to the trace file path and returns the replay.Recorder.
+        A trace set by enable_instrumentation is still called.
+
+        >>> eo.start_recording("session.trace.gz")
+        >>> eo.measure()
+        >>> eo.stop_recording()
+        >>> replayed = EyeOne(backend=ReplayBackend("session.trace.gz"))
+
+        """
+        try:
+            from .replay import Recorder
+        except (ImportError, ValueError):
+            from replay import Recorder
+        if self.recorder is not None:
+            self.stop_recording()
+        enabled = self.instrumentation is None
+        previous = None if enabled else self.instrumentation.trace
+        self.recorder = Recorder(path, previous)
+        # remember, if the recording enabled the instrumentation
+        self.recorder.enabled_instrumentation = enabled
+        self.enable_instrumentation(self.recorder.record)
+        return self.recorder
+
+    def stop_recording(self):
+        """
+        Stops start_recording, closes the trace file and restores the
+        previous trace. If start_recording enabled the instrumentation, it
+        is disabled again.
+
+        """
+        if self.recorder is None:
+            return
+        if self.recorder.enabled_instrumentation:
+            self.disable_instrumentation()
+        elif self.instrumentation is not None:
+            self.instrumentation.trace = self.recorder.next_trace
+        self.recorder.close()
+        self.recorder = None
+
+    def wait_for_key(self, timeout=None, callback=None, event=None):
+        """
+        Waits until the key of the i1 Pro is pressed and returns a
+        keywait.KeyPress, which reports the detection latency.
+
+        Polling starts fast and slows down after a while. See
+        keywait.KeyWaiter.wait for the parameters and exceptions.
+
+        """
+        return self.key_waiter.wait(timeout, callback, event)
+
+    def get_scan(self, fields=("spectrum", "tristimulus", "densities")):
+        """
+        Fetches all samples of a previously triggered scan at once.
+
+        Parameters:
+            fields: tuple of strings
+                any combination of "spectrum", "tristimulus" and
+                "densities".
+
+        Returns a dict, which maps every field to a contiguous float32
+        numpy array of shape (n, SPECTRUM_SIZE), (n, TRISTIMULUS_SIZE) or
+        (n, DENSITY_SIZE) respectively, where n is the number of available
+        samples.
+
+        The number of samples is read only once and the arrays are
+        allocated in advance. The ctypes arrays handed to the dll share the
+        memory of the numpy arrays, so no sample is copied or converted in
+        python.
+
+        Raises EyeOneError, if a sample cannot be fetched.
+
+        """
+        numpy = _numpy()
+        getters = list()
+        for field in fields:
+            try:
+                getters.append((field,) + SCAN_FIELDS[field])
+            except KeyError:
+                raise ValueError("unknown field: " + str(field))
+        n_samples = self.I1_GetNumberOfAvailableSamples()
+        n_samples = int(getattr(n_samples, "value", n_samples))
+        scan = dict()
+        for field, func_name, size in getters:
+            data = numpy.zeros((n_samples, size), dtype=numpy.float32)
+            scan[field] = data
+            if n_samples == 0:
+                continue
+            # view the whole numpy array as n_samples ctypes arrays
+            rows = ((c_float * size) * n_samples).from_buffer(data)
+            get = getattr(self, func_name)
+            for index in range(n_samples):
+                error = get(rows[index], index)
+                if error != constants.eNoError:
+                    raise self.error(error, "%s failed for sample %i."
+                            % (func_name, index))
+        return scan
+
+    @property
+    def buffers(self):
+        """
+        MeasurementBuffers used by get_spectrum, get_tri_stimulus and
+        get_densities. Created on first use.
+
+        """
+        if self._buffers is None:
+            self._buffers = MeasurementBuffers()
+        return self._buffers
+
+    def _get_into_ring(self, func, ring, index, pin):
+        """
+        Fetches one sample with func into the next slot of ring.
+
+        """
+        slot = ring.acquire(pin)
+        error = func(ring.arrays[slot], index)
+        if error != constants.eNoError:
+            ring.pinned[slot] = False
+            raise self.error(error, "fetching sample %i failed." % index)
+        return ring.views[slot]
+
+    def get_spectrum(self, index=0, pin=False):
+        """
+        Fetches the spectrum of sample index into a buffer of
+        EyeOne.buffers and returns a read-only numpy view on it.
+
+        The buffer is recycled after the following fetches fill the ring
+        (16 by default). If you need the values longer, either copy them or
+        set pin to True and hand the view back with
+        EyeOne.buffers.release(view) when you are done.
+
+        Raises EyeOneError, if the spectrum cannot be fetched.
+
+        """
+        return self._get_into_ring(self.I1_GetSpectrum,
+                self.buffers.spectrum, index, pin)
+
+    def get_tri_stimulus(self, index=0, pin=False):
+        """
+        Fetches the color vector of sample index. See get_spectrum.
+
+        """
+        return self._get_into_ring(self.I1_GetTriStimulus,
+                self.buffers.tristimulus, index, pin)
+
+    def get_densities(self, index=0, pin=False):
+        """
+        Fetches the densities of sample index. See get_spectrum.
+
+        """
+        return self._get_into_ring(self.I1_GetDensities,
+                self.buffers.densities, index, pin)
+
+    def measure(self, fields=("spectrum", "tristimulus")):
+        """
+        Triggers a single measurement and fetches it.
+
+        Parameters:
+            fields: tuple of strings
+                any combination of "spectrum", "tristimulus" and
+                "densities".
+
+        Returns a dict, which maps every field to a new float32 numpy
+        array.
+
+        Raises EyeOneError, if the measurement cannot be triggered or
+        fetched.
+
+        """
+        error = self.I1_TriggerMeasurement()
+        if error != constants.eNoError:
+            raise self.error(error, "triggering measurement failed.")
+        return self.fetch(fields)
+
+    def fetch(self, fields=("spectrum", "tristimulus"), index=0):
+        """
+        Fetches the last measurement (or sample index of a scan) without
+        triggering a new one.
+
+        Returns a dict, which maps every field to a new float32 numpy
+        array. Raises EyeOneError, if a field cannot be fetched.
+
+        """
+        numpy = _numpy()
+        measurement = dict()
+        for field in fields:
+            try:
+                func_name, size = SCAN_FIELDS[field]
+            except KeyError:
+                raise ValueError("unknown field: " + str(field))
+            data = numpy.zeros(size, dtype=numpy.float32)
+            error = getattr(self, func_name)(
+                    (c_float * size).from_buffer(data), index)
+            if error != constants.eNoError:
+                raise self.error(error, func_name + " failed.")
+            measurement[field] = data
+        return measurement
+
+    def measure_averaged(self, target_precision, max_n=50, min_n=2,
+            fields=("spectrum", "tristimulus"), relative=False,
+            floor=0.1):
+        """
+        Repeats measurements until the mean is precise enough.
+
+        Parameters:
+            target_precision: float or dict
+                the measurement stops as soon as the standard error of the
+                mean of every band and channel is below target_precision.
+                A dict maps every field to its own target.
+
+            max_n: int
+                maximal number of measurements
+
+            min_n: int
+                minimal number of measurements (at least 2 are needed to
+                estimate the standard error)
+
+            fields: tuple of strings
+                see measure
+
+            relative: bool
+                if True, the standard error is compared relative to the
+                absolute value of the mean.
+
+            floor: float
+                with relative=True, the mean is at least floor times the
+                largest absolute mean of the field, so that values near
+                zero (e.g. a* and b* of grays) do not prevent convergence
+
+        Mean and variance are kept online per band and channel, so bright
+        patches stop after min_n readings and only noisy (dark) patches
+        take up to max_n.
+
+        The tri stimulus values are averaged in the current color space.
+        The mean of a nonlinear space (CIELab, CIExyY, ...) is biased;
+        measure in CIEXYZ (or average the spectrum) and convert the mean
+        afterwards, e.g. with colorimetry.convert.
+
+        Returns a stats.AveragedMeasurement. Raises EyeOneError, if a
+        measurement fails.
+
+        """
+        numpy = _numpy()
+        try:
+            from .stats import RunningStats, AveragedMeasurement
+        except (ImportError, ValueError):
+            from stats import RunningStats, AveragedMeasurement
+        if not isinstance(target_precision, dict):
+            target_precision = dict((field, target_precision) for field in
+                    fields)
+        running = dict((field, RunningStats(SCAN_FIELDS[field][1])) for
+                field in fields)
+        converged = False
+        for n in range(1, max_n + 1):
+            measurement = self.measure(fields)
+            for field in fields:
+                running[field].add(measurement[field])
+            if n < min_n:
+                continue
+            converged = True
+            for field in fields:
+                error = running[field].standard_error
+                if relative:
+                    mean = numpy.abs(running[field].mean)
+                    with numpy.errstate(divide="ignore", invalid="ignore"):
+                        error = error / numpy.maximum(mean,
+                                floor * mean.max())
+                if not numpy.all(error < target_precision[field]):
+                    converged = False
+                    break
+            if converged:
+                break
+        return AveragedMeasurement(
+                dict((field, running[field].mean) for field in fields),
+                dict((field, running[field].standard_error) for field in
+                    fields), running[fields[0]].n, converged)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/instrument.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) class Instrumentation
+#          (2) class CallStats
+#
+# input: --
+# output: --
+#
+# created 2026-10-18
+
+"""
+This module records call counts, error codes and latency histograms of the
+I1_* functions. Use EyeOne.enable_instrumentation to switch it on; while
+it is off, the functions are not wrapped at all.
+
+"""
+
+import bisect
+import threading
+import time
+
+try:
+    from . import constants
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import constants
+
+ERROR_NAMES = {
+        constants.eNoError: "eNoError",
+        constants.eDeviceNotReady: "eDeviceNotReady",
+        constants.eDeviceNotConnected: "eDeviceNotConnected",
+        constants.eDeviceNotCalibrated: "eDeviceNotCalibrated",
+        constants.eKeyNotPressed: "eKeyNotPressed",
+        constants.eNoSubstrateWhite: "eNoSubstrateWhite",
+        constants.eWrongMeasureMode: "eWrongMeasureMode",
+        constants.eStripRecognitionFailed: "eStripRecognitionFailed",
+        constants.eNoDataAvailable: "eNoDataAvailable",
+        constants.eException: "eException",
+        constants.eInvalidArgument: "eInvalidArgument",
+        constants.eUnknownError: "eUnknownError",
+        constants.eWrongDeviceType: "eWrongDeviceType",
+        }
+
+# these functions do not return an enum I1_ErrorType
+NO_ERROR_CODE = frozenset(["I1_GetNumberOfAvailableSamples",
+    "I1_GetOption"])
+
+# upper bounds of the latency histogram buckets in seconds: 1 us, 2 us,
+# 4 us, ... about 134 s; slower calls end up in the last bucket
+BUCKETS = tuple(1e-6 * 2 ** i for i in range(28))
+
+_timer = getattr(time, "perf_counter", time.time)
+
+
+class CallStats(object):
+    """
+    Statistics of one function.
+
+    """
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.errors = dict()
+        self.histogram = [0] * len(BUCKETS)
+
+    def add(self, seconds, error=None):
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+        if error is not None:
+            self.errors[error] = self.errors.get(error, 0) + 1
+        bucket = min(bisect.bisect_left(BUCKETS, seconds), len(BUCKETS) - 1)
+        self.histogram[bucket] += 1
+
+    def percentile(self, fraction):
+        """
+        Returns the upper bound of the bucket, which contains the given
+        fraction (0 to 1) of the calls, or None if there were no calls.
+
+        """
+        if not self.count:
+            return None
+        needed = fraction * self.count
+        seen = 0
+        for bound, calls in zip(BUCKETS, self.histogram):
+            seen += calls
+            if seen >= needed:
+                return bound
+        return BUCKETS[-1]
+
+    def as_dict(self):
+        return {"count": self.count,
+                "total": self.total,
+                "mean": self.total / self.count if self.count else None,
+                "min": self.min,
+                "max": self.max,
+                "p50": self.percentile(0.5),
+                "p99": self.percentile(0.99),
+                "errors": dict((ERROR_NAMES.get(code, str(code)), calls)
+                    for code, calls in self.errors.items()),
+                "histogram": [(bound, calls) for bound, calls in
+                    zip(BUCKETS, self.histogram) if calls]}
+
+
+class Instrumentation(object):
+    """
+    Wraps functions to record their calls.
+
+    trace is None or a callable, which is called after every call with
+    (name, args, result, seconds).
+
+    Example:
+
+    >>> instrumentation = eo.enable_instrumentation()
+    >>> eo.measure()
+    >>> print(instrumentation.snapshot()["I1_TriggerMeasurement"]["mean"])
+    >>> eo.disable_instrumentation()
+
+    """
+
+    def __init__(self, trace=None):
+        self.trace = trace
+        self.stats = dict()
+        self._lock = threading.Lock()
+
+    def wrap(self, name, func):
+        """
+        Returns a function, which calls func and records the call under
+        name.
+
+        """
+        with self._lock:
+            stats = self.stats.setdefault(name, CallStats())
+        returns_error = name not in NO_ERROR_CODE
+        lock = self._lock
+        timer = _timer
+        def wrapper(*args):
+            start = timer()
+            result = func(*args)
+            seconds = timer() - start
+            with lock:
+                stats.add(seconds, result if returns_error else None)
+            if self.trace is not None:
+                self.trace(name, args, result, seconds)
+            return result
+        wrapper.__doc__ = func.__doc__
+        wrapper.__name__ = name
+        wrapper.wrapped = func
+        return wrapper
+
+    def snapshot(self):
+        """
+        Returns a dict, which maps the name of every called function to a
+        dict with count, total, mean, min, max, p50, p99 (seconds), errors
+        (error name to count) and histogram (list of (upper bound,
+        calls)).
+
+        """
+        with self._lock:
+            return dict((name, stats.as_dict()) for name, stats in
+                    self.stats.items() if stats.count)
+
+    def reset(self):
+        """
+        Forgets all recorded calls.
+
+        """
+        with self._lock:
+            for name in self.stats:
+                self.stats[name].__init__()
@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/keywait.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) class KeyWaiter
+#          (2) class KeyPress
+#
+# input: --
+# output: --
+#
+# created 2026-10-18
+
+"""
+This module provides a cancellable wait for the key of the i1 Pro, which
+polls fast right after a prompt and slows down afterwards.
+
+"""
+
+import threading
+import time
+
+try:
+    from . import constants
+    from .errors import EyeOneError, KeyNotPressedError
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import constants
+    from errors import EyeOneError, KeyNotPressedError
+
+
+class KeyWaitTimeout(KeyNotPressedError):
+    """
+    Raised by KeyWaiter.wait, if the key was not pressed in time.
+
+    """
+    pass
+
+
+class KeyWaitCancelled(EyeOneError):
+    """
+    Raised by KeyWaiter.wait, if the wait was cancelled or the device was
+    disconnected.
+
+    """
+    pass
+
+
+class KeyPress(object):
+    """
+    Result of KeyWaiter.wait.
+
+    Attributes:
+        detected_at: time.time() when the key press was detected
+        latency: (estimated) seconds between key press and detection
+        max_latency: upper bound of latency
+        polls: number of I1_KeyPressed calls during the wait
+        source: "poll", "message" or "event"
+
+    When the key press is detected by polling, it happened somewhere
+    between the last two polls, so latency is half of that interval and
+    max_latency the whole interval. Key presses reported with a timestamp
+    through KeyWaiter.notify have an exact latency; an event wakes the
+    wait at once, so its latency is 0.
+
+    """
+    def __init__(self, detected_at, latency, max_latency, polls, source):
+        self.detected_at = detected_at
+        self.latency = latency
+        self.max_latency = max_latency
+        self.polls = polls
+        self.source = source
+
+    def __repr__(self):
+        return ("KeyPress(source=%r, latency=%.4f, max_latency=%.4f, "
+                "polls=%i)" % (self.source, self.latency, self.max_latency,
+                    self.polls))
+
+
+class KeyWaiter(object):
+    """
+    Waits for the key of an i1 Pro with adaptive polling.
+
+    During the first fast_period seconds after the wait started, the key
+    is polled every fast_interval seconds. Afterwards the interval grows by
+    the factor backoff with every poll until it reaches slow_interval.
+
+    Between two polls the waiter sleeps on a threading.Event, so cancel
+    and notify, which may be called from any other thread, end the sleep
+    immediately. Both only affect the wait, which is running, when they
+    are called; every wait gets a new generation number for this.
+
+    Example:
+
+    >>> waiter = KeyWaiter(eyeone)
+    >>> key_press = waiter.wait(timeout=60)
+    >>> print(key_press.latency)
+
+    Attributes:
+        generation: number of the running or the last wait
+
+    """
+
+    def __init__(self, eyeone, fast_interval=0.002, slow_interval=0.1,
+            fast_period=0.5, backoff=1.5):
+        self.eyeone = eyeone
+        self.fast_interval = fast_interval
+        self.slow_interval = slow_interval
+        self.fast_period = fast_period
+        self.backoff = backoff
+        self.generation = 0
+        self._lock = threading.Lock()
+        # generation, start time and wake event of the running wait
+        self._active = None
+        self._start = None
+        self._wake = None
+        self._cancelled = False
+        self._message = None
+        self._message_time = None
+
+    def intervals(self):
+        """
+        Generates the intervals between successive polls.
+
+        """
+        start = time.time()
+        interval = self.fast_interval
+        while True:
+            if time.time() - start >= self.fast_period:
+                interval = min(interval * self.backoff, self.slow_interval)
+            yield interval
+
+    @property
+    def waiting(self):
+        """
+        True, while a wait is running.
+
+        """
+        return self._active is not None
+
+    def cancel(self, generation=None):
+        """
+        Makes the running wait raise KeyWaitCancelled. Can be called from
+        any thread. If generation is not None, only the wait of this
+        generation is cancelled.
+
+        Returns True, if a wait was cancelled. Without a running wait,
+        nothing happens, so a late cancel never aborts the next wait.
+
+        """
+        with self._lock:
+            if self._active is None or generation not in (None,
+                    self._active):
+                return False
+            self._cancelled = True
+            self._wake.set()
+            return True
+
+    def notify(self, message=constants.eDeviceButtonPressed,
+            timestamp=None):
+        """
+        Reports a device message (enum I1_DeviceMessage) to a running wait.
+        Can be called from any thread, e.g. from a device message handler.
+
+        eDeviceButtonPressed ends the wait successfully;
+        eDeviceDisconnected makes it raise KeyWaitCancelled. Other
+        messages, messages without a running wait and key presses, which
+        happened before the wait started, are ignored. timestamp is the
+        time.time() of the key press, if known.
+
+        Returns True, if the message was passed to the running wait.
+
+        """
+        if message not in (constants.eDeviceButtonPressed,
+                constants.eDeviceDisconnected):
+            return False
+        if timestamp is None:
+            timestamp = time.time()
+        with self._lock:
+            if self._active is None or (timestamp < self._start and
+                    message == constants.eDeviceButtonPressed):
+                return False
+            self._message_time = timestamp
+            self._message = message
+            self._wake.set()
+            return True
+
+    def wait(self, timeout=None, callback=None, event=None, poll=True):
+        """
+        Waits until the key of the i1 Pro is pressed.
+
+        Parameters:
+            timeout: seconds or None
+                raises KeyWaitTimeout after timeout seconds. None waits
+                forever.
+
+            callback: callable or None
+                is called with the KeyPress before wait returns.
+
+            event: threading.Event or None
+                if the event is set by someone else, it counts as key
+                press. The wait sleeps on the event between the polls, so
+                setting it ends the wait immediately; cancel and notify
+                set it to wake the wait and clear it again.
+
+            poll: bool
+                if False, I1_KeyPressed is not called and the wait
+                depends entirely on notify or event.
+
+        Returns a KeyPress. Raises KeyWaitCancelled, if cancel was called
+        or the device was disconnected during the wait.
+
+        """
+        wake = threading.Event() if event is None else event
+        with self._lock:
+            if self._active is not None:
+                raise RuntimeError("another key wait is running.")
+            self.generation += 1
+            self._active = self.generation
+            self._start = start = time.time()
+            self._wake = wake
+            self._cancelled = False
+            self._message = None
+        try:
+            key_press = self._wait(start, timeout, event, poll, wake)
+        finally:
+            with self._lock:
+                if event is not None and (self._cancelled or
+                        self._message is not None):
+                    # set by cancel or notify
+                    event.clear()
+                self._active = None
+                self._wake = None
+                self._cancelled = False
+                self._message = None
+        if callback is not None:
+            callback(key_press)
+        return key_press
+
+    def _wait(self, start, timeout, event, poll, wake):
+        """
+        Polls until the key is pressed and returns the KeyPress.
+
+        """
+        last_poll = start
+        polls = 0
+        source = None
+        for interval in self.intervals():
+            if self._cancelled:
+                raise KeyWaitCancelled("key wait cancelled.")
+            if self._message == constants.eDeviceDisconnected:
+                raise KeyWaitCancelled("i1 Pro disconnected.")
+            now = time.time()
+            if self._message == constants.eDeviceButtonPressed:
+                source = "message"
+                latency = max_latency = now - self._message_time
+                break
+            if event is not None and event.is_set():
+                # the wait sleeps on event, so it is noticed at once
+                source = "event"
+                latency = max_latency = 0.0
+                break
+            if poll:
+                polls += 1
+                if self.eyeone.I1_KeyPressed() == constants.eNoError:
+                    now = time.time()
+                    source = "poll"
+                    latency, max_latency = ((now - last_poll) / 2,
+                            now - last_poll)
+                    break
+            last_poll = now
+            if timeout is not None:
+                left = start + timeout - time.time()
+                if left <= 0:
+                    raise KeyWaitTimeout("key not pressed within %g s."
+                            % timeout)
+                interval = min(interval, left)
+            if wake.wait(interval) and event is None:
+                # cancel and notify set their flag before the event
+                wake.clear()
+        return KeyPress(now, latency, max_latency, polls, source)
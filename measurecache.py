@@ -0,0 +1,290 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/measurecache.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) class MeasurementCache
+#
+# input: sqlite database
+# output: sqlite database
+#
+# created 2026-10-18
+
+"""
+This module provides an on-disk cache of measurements, so that stimuli,
+which were measured under the same conditions before, are not measured
+again.
+
+"""
+
+import sqlite3
+import threading
+import time
+
+import numpy
+
+try:
+    from . import constants
+    from .eyeone import SCAN_FIELDS
+    from .profiles import MeasurementProfile, OPTION_ORDER
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import constants
+    from eyeone import SCAN_FIELDS
+    from profiles import MeasurementProfile, OPTION_ORDER
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS measurements (
+    stimulus TEXT NOT NULL,
+    serial TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    epoch INTEGER NOT NULL,
+    field TEXT NOT NULL,
+    data BLOB NOT NULL,
+    created REAL NOT NULL,
+    used REAL NOT NULL,
+    PRIMARY KEY (stimulus, serial, profile, epoch, field)
+);
+CREATE INDEX IF NOT EXISTS measurements_used ON measurements (used);
+"""
+
+
+# decimals, to which numeric stimuli are rounded in the key
+_KEY_DECIMALS = 9
+
+
+def _stimulus_key(stimulus):
+    """
+    Returns the key of stimulus. Strings are used as they are; numbers
+    and sequences of numbers (tuple, list, numpy array or scalars) give
+    the same key for the same rounded values and shape.
+
+    """
+    if isinstance(stimulus, str):
+        return stimulus
+    try:
+        values = numpy.asarray(stimulus, dtype=numpy.float64)
+    except (TypeError, ValueError):
+        return repr(stimulus)
+    # adding 0.0 turns -0.0 into 0.0
+    values = values.round(_KEY_DECIMALS) + 0.0
+    return "%s:%r" % ("x".join(str(n) for n in values.shape),
+            values.ravel().tolist())
+
+
+class MeasurementCache(object):
+    """
+    Cache of measurements in a sqlite database.
+
+    Measurements are keyed by stimulus, serial number of the i1 Pro,
+    measurement profile (the values of all options in
+    profiles.OPTION_ORDER) and calibration epoch. A recalibration or a
+    changed option therefore never serves old measurements; entries of
+    earlier epochs are deleted as soon as a new epoch is seen.
+
+    Parameters:
+        path: file name of the database (":memory:" for a temporary cache)
+        eyeone: EyeOne
+        calibration: CalibrationManager or None
+            provides the calibration epoch and recalibrates if necessary.
+            Without it, I1_CALIBRATION_COUNT is used as epoch.
+        ttl: seconds or None
+            entries older than ttl are not served anymore
+        max_entries: int
+            if there are more measurements, expired and least recently
+            used ones are evicted down to 90 % of max_entries
+
+    Example:
+
+    >>> cache = MeasurementCache("measurements.db", eo, manager, ttl=86400)
+    >>> for rgb in stimuli:
+    ...     measurement = cache.measure(rgb, present=show_rgb)
+
+    Attributes:
+        hits: number of measurements served from the cache
+        misses: number of measurements, which had to be measured
+
+    """
+
+    def __init__(self, path, eyeone, calibration=None, ttl=None,
+            max_entries=10000):
+        self.path = path
+        self.eyeone = eyeone
+        self.calibration = calibration
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+        self._seen = set()
+        # (option_cache.version, serial, profile) of the last conditions
+        self._options = None
+        self._entries = self._count()
+
+    def __len__(self):
+        with self._lock:
+            return self._count()
+
+    def _count(self):
+        return self._connection.execute("SELECT COUNT(*) FROM (SELECT "
+                "DISTINCT stimulus, serial, profile, epoch FROM "
+                "measurements)").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def conditions(self):
+        """
+        Returns (serial, profile, epoch) of the current state of the i1 Pro.
+
+        Serial and profile are only read again, after an option was set
+        (see OptionCache.version), so the only option read per call is the
+        volatile I1_CALIBRATION_COUNT, if there is no calibration manager.
+
+        """
+        eo = self.eyeone
+        version = eo.option_cache.version
+        options = self._options
+        if options is None or options[0] != version:
+            serial = eo.get_option(constants.I1_SERIAL_NUMBER)
+            profile = MeasurementProfile((option, eo.get_option(option))
+                    for option in OPTION_ORDER).key()
+            options = self._options = (version, serial, profile)
+        serial, profile = options[1:]
+        if self.calibration is not None:
+            epoch = self.calibration.epoch
+        else:
+            try:
+                epoch = int(eo.get_option(constants.I1_CALIBRATION_COUNT))
+            except (TypeError, ValueError):
+                epoch = 0
+        conditions = (serial, profile, epoch)
+        with self._lock:
+            if conditions not in self._seen:
+                self._seen.add(conditions)
+                self._connection.execute("DELETE FROM measurements WHERE "
+                        "serial = ? AND profile = ? AND epoch < ?",
+                        conditions)
+                self._connection.commit()
+                self._entries = self._count()
+        return conditions
+
+    def get(self, stimulus, fields=("spectrum", "tristimulus"),
+            conditions=None):
+        """
+        Returns the cached measurement of stimulus (dict of float32
+        arrays) or None, if not all fields are cached under the current
+        conditions.
+
+        """
+        if conditions is None:
+            conditions = self.conditions()
+        key = (_stimulus_key(stimulus),) + conditions
+        now = time.time()
+        with self._lock:
+            rows = self._connection.execute("SELECT field, data, created "
+                    "FROM measurements WHERE stimulus = ? AND serial = ? AND "
+                    "profile = ? AND epoch = ?", key).fetchall()
+            measurement = dict()
+            for field, data, created in rows:
+                if self.ttl is not None and now - created > self.ttl:
+                    continue
+                measurement[field] = numpy.frombuffer(data,
+                        dtype=numpy.float32).copy()
+            if not all(field in measurement for field in fields):
+                self.misses += 1
+                return None
+            self._connection.execute("UPDATE measurements SET used = ? "
+                    "WHERE stimulus = ? AND serial = ? AND profile = ? AND "
+                    "epoch = ?", (now,) + key)
+            self._connection.commit()
+            self.hits += 1
+        return dict((field, measurement[field]) for field in fields)
+
+    def put(self, stimulus, measurement, conditions=None):
+        """
+        Stores measurement (dict of arrays) of stimulus.
+
+        """
+        if conditions is None:
+            conditions = self.conditions()
+        key = (_stimulus_key(stimulus),) + conditions
+        now = time.time()
+        rows = [key + (field, sqlite3.Binary(numpy.ascontiguousarray(data,
+            dtype=numpy.float32).tobytes()), now, now) for field, data in
+            measurement.items()]
+        with self._lock:
+            new = self._connection.execute("SELECT 1 FROM measurements "
+                    "WHERE stimulus = ? AND serial = ? AND profile = ? AND "
+                    "epoch = ? LIMIT 1", key).fetchone() is None
+            self._connection.executemany("INSERT OR REPLACE INTO "
+                    "measurements VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            if new:
+                self._entries += 1
+            if self._entries > self.max_entries:
+                self._evict()
+            self._connection.commit()
+
+    def _evict(self):
+        """
+        Deletes expired measurements and keeps the 90 % of max_entries
+        most recently used ones, so that not every put has to evict.
+
+        """
+        if self.ttl is not None:
+            self._connection.execute("DELETE FROM measurements WHERE "
+                    "created < ?", (time.time() - self.ttl,))
+        self._connection.execute("DELETE FROM measurements WHERE "
+                "(stimulus, serial, profile, epoch) NOT IN (SELECT "
+                "stimulus, serial, profile, epoch FROM measurements GROUP BY "
+                "stimulus, serial, profile, epoch ORDER BY MAX(used) DESC "
+                "LIMIT ?)", (self.max_entries - self.max_entries // 10,))
+        self._entries = self._count()
+
+    def measure(self, stimulus, present=None,
+            fields=("spectrum", "tristimulus")):
+        """
+        Returns the cached measurement of stimulus or calls
+        present(stimulus), if given, measures and caches it.
+
+        """
+        if self.calibration is not None:
+            self.calibration.ensure()
+        conditions = self.conditions()
+        measurement = self.get(stimulus, fields, conditions)
+        if measurement is not None:
+            return measurement
+        for field in fields:
+            if field not in SCAN_FIELDS:
+                raise ValueError("unknown field: " + str(field))
+        if present is not None:
+            present(stimulus)
+        if self.calibration is not None:
+            measurement = self.calibration.run(self.eyeone.measure, fields)
+            # a recalibration changes the epoch
+            conditions = self.conditions()
+        else:
+            measurement = self.eyeone.measure(fields)
+        self.put(stimulus, measurement, conditions)
+        return measurement
+
+    def invalidate(self, stimulus=None):
+        """
+        Forgets the measurements of stimulus or, if None, all measurements.
+
+        """
+        with self._lock:
+            if stimulus is None:
+                self._connection.execute("DELETE FROM measurements")
+            else:
+                self._connection.execute("DELETE FROM measurements WHERE "
+                        "stimulus = ?", (_stimulus_key(stimulus),))
+            self._connection.commit()
+            self._entries = self._count()
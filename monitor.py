@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/monitor.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) class EmissionMonitor
+#
+# input: --
+# output: MeasurementStore (optional)
+#
+# created 2026-10-18
+
+"""
+This module measures an emitting surface (e.g. a monitor warming up)
+continuously and keeps rolling statistics over a window of the last
+readings, so that it can tell, when the surface is stable.
+
+"""
+
+from __future__ import division
+
+import threading
+import time
+
+import numpy
+
+try:
+    from .eyeone import SCAN_FIELDS
+    from .stats import RollingStats
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    from eyeone import SCAN_FIELDS
+    from stats import RollingStats
+
+
+class EmissionMonitor(object):
+    """
+    Continuous measurement with constant memory.
+
+    Only the last window readings are kept (in the ring buffer of a
+    stats.RollingStats); older readings are dropped, unless a store is
+    given, to which every reading is appended.
+
+    The surface counts as stable, when the window is full and for every
+    channel of field
+
+    * the drift over the window (slope * duration) is at most
+      drift_tolerance times the mean and
+    * the standard deviation is at most noise_tolerance times the mean
+      (if noise_tolerance is not None).
+
+    When it becomes stable, the event stable is set and on_stable(monitor)
+    is called; when it drifts away again, stable is cleared.
+
+    Parameters:
+        eyeone: EyeOne
+            calibrated in an emission mode
+        window: number of readings in the rolling statistics
+        field: "tristimulus", "spectrum" or "densities"
+            the field, which is judged for stability
+        interval: seconds between the starts of two measurements
+        drift_tolerance: float
+        noise_tolerance: float or None
+        on_stable: callable or None
+        store: MeasurementStore or None
+        session: session number of the readings in store
+
+    Example:
+
+    >>> monitor = EmissionMonitor(eo, window=120, interval=5)
+    >>> if monitor.run(timeout=2 * 3600):
+    ...     print("warmed up after %.0f s" % monitor.stable_after)
+
+    """
+
+    def __init__(self, eyeone, window=60, field="tristimulus", interval=0.0,
+            drift_tolerance=0.002, noise_tolerance=None, on_stable=None,
+            store=None, session=0):
+        self.eyeone = eyeone
+        self.field = field
+        self.interval = interval
+        self.drift_tolerance = drift_tolerance
+        self.noise_tolerance = noise_tolerance
+        self.on_stable = on_stable
+        self.store = store
+        self.session = session
+        self.stats = RollingStats(window, SCAN_FIELDS[field][1])
+        self.stable = threading.Event()
+        self.stable_after = None
+        self.readings = 0
+        self._stopped = False
+        self._start = None
+
+    def stop(self):
+        """
+        Ends a running stream or run after the current measurement. Can
+        be called from any thread. A stopped monitor does not measure
+        again until restart is called.
+
+        """
+        self._stopped = True
+
+    def restart(self):
+        """
+        Allows stream and run to measure again after stop.
+
+        """
+        self._stopped = False
+
+    def is_stable(self):
+        """
+        Returns True, if the window is full and within the tolerances.
+
+        """
+        stats = self.stats
+        if not stats.full:
+            return False
+        level = numpy.abs(stats.mean)
+        drift = numpy.abs(stats.slope) * stats.duration
+        if not numpy.all(drift <= self.drift_tolerance * level):
+            return False
+        if self.noise_tolerance is not None:
+            return bool(numpy.all(numpy.sqrt(stats.variance) <=
+                self.noise_tolerance * level))
+        return True
+
+    def _add(self, timestamp, measurement):
+        self.readings += 1
+        self.stats.add(measurement[self.field], timestamp)
+        if self.store is not None:
+            self.store.append(measurement, self.session, timestamp)
+        if self.is_stable():
+            if not self.stable.is_set():
+                self.stable.set()
+                self.stable_after = timestamp - self._start
+                if self.on_stable is not None:
+                    self.on_stable(self)
+        else:
+            self.stable.clear()
+
+    def stream(self, fields=None, max_readings=None, duration=None):
+        """
+        Measures until stop is called, max_readings are taken or duration
+        seconds passed and yields (timestamp, measurement) for every
+        reading. fields defaults to (field,); store gets the same fields
+        (fields and field).
+
+        """
+        if fields is None:
+            fields = (self.field,)
+        elif self.field not in fields:
+            fields = tuple(fields) + (self.field,)
+        self._start = time.time()
+        count = 0
+        while not self._stopped:
+            if max_readings is not None and count >= max_readings:
+                return
+            started = time.time()
+            if duration is not None and started - self._start >= duration:
+                return
+            measurement = self.eyeone.measure(fields)
+            timestamp = time.time()
+            self._add(timestamp, measurement)
+            count += 1
+            yield timestamp, measurement
+            left = started + self.interval - time.time()
+            if left > 0:
+                time.sleep(left)
+
+    def run(self, timeout=None, fields=None):
+        """
+        Measures until the surface is stable or timeout seconds passed.
+        Returns True, if it is stable.
+
+        """
+        for timestamp, measurement in self.stream(fields, duration=timeout):
+            if self.stable.is_set():
+                return True
+        return self.stable.is_set()
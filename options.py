@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/options.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) class OptionCache
+#
+# input: --
+# output: --
+#
+# created 2026-10-18
+
+"""
+This module provides a cache, which shadows the option state of an i1 Pro,
+so that EyeOne.set_option and EyeOne.get_option can skip redundant calls
+to I1_SetOption and I1_GetOption.
+
+"""
+
+import threading
+
+try:
+    from . import constants
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import constants
+
+# options, which change without I1_SetOption and are never cached
+VOLATILE_OPTIONS = frozenset([
+        constants.I1_LAST_ERROR,
+        constants.I1_EXTENDED_ERROR_INFORMATION,
+        constants.I1_IS_CONNECTED,
+        constants.I1_IS_KEY_PRESSED,
+        constants.I1_LAST_CALIBRATION_TIME,
+        constants.I1_CALIBRATION_COUNT,
+        constants.I1_NUMBER_OF_AVAILABLE_SAMPLES,
+        constants.I1_LAST_AUTO_DENSITY_FILTER,
+        constants.I1_RESET,
+        ])
+
+
+class OptionCache(object):
+    """
+    Write-through cache of the option values of one i1 Pro.
+
+    Values are stored as strings, after they were successfully set with
+    I1_SetOption or read with I1_GetOption. A failed set forgets the
+    option, because the state of the device is unknown afterwards.
+    Setting I1_RESET forgets all options; switching I1_DEVICE_TYPE forgets
+    all options of the previous device, because the other device has its
+    own state.
+
+    Attributes:
+        hits: number of calls answered from the cache (saved dll calls)
+        misses: number of calls, which had to go to the dll
+        version: number, which grows with every set and invalidate, so
+            that values derived from the options can be reused, while it
+            stays the same
+
+    """
+
+    def __init__(self):
+        self.values = dict()
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "OptionCache(hits=%i, misses=%i, options=%i)" % (self.hits,
+                self.misses, len(self.values))
+
+    def lookup(self, option):
+        """
+        Returns the cached value of option or None and counts hit or miss.
+
+        """
+        if option in VOLATILE_OPTIONS:
+            return None
+        with self._lock:
+            value = self.values.get(option)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def is_set(self, option, value):
+        """
+        Returns True, if option is known to have value already, so setting
+        it again can be skipped. Counts hit or miss.
+
+        """
+        if option in VOLATILE_OPTIONS:
+            return False
+        with self._lock:
+            if self.values.get(option) == value:
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def store(self, option, value):
+        """
+        Remembers value of option, which was read from the device.
+
+        """
+        if option not in VOLATILE_OPTIONS:
+            with self._lock:
+                self.values[option] = value
+
+    def set(self, option, value, error):
+        """
+        Updates the cache after I1_SetOption(option, value) returned error.
+
+        """
+        with self._lock:
+            self.version += 1
+            if option == constants.I1_RESET:
+                self.values.clear()
+            elif error != constants.eNoError:
+                self.values.pop(option, None)
+            elif option == constants.I1_DEVICE_TYPE:
+                self.values.clear()
+                self.values[option] = value
+            elif option not in VOLATILE_OPTIONS:
+                self.values[option] = value
+
+    def invalidate(self, option=None):
+        """
+        Forgets option or, if option is None, all options.
+
+        """
+        with self._lock:
+            self.version += 1
+            if option is None:
+                self.values.clear()
+            else:
+                self.values.pop(option, None)
@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/pipeline.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) function measure_sequence
+#
+# input: --
+# output: --
+#
+# created 2026-10-18
+
+"""
+This module measures a sequence of stimuli in a pipeline: while the
+measurement of one patch is fetched, converted and saved, the next patch
+is already presented and settles.
+
+"""
+
+import threading
+import time
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+try:
+    from . import constants
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import constants
+
+_DONE = object()
+
+
+class _Stopped(Exception):
+    pass
+
+
+def _put(target, item, failed):
+    """
+    Puts item into the bounded queue target, unless another stage failed.
+
+    """
+    while not failed:
+        try:
+            target.put(item, timeout=0.05)
+            return
+        except queue.Full:
+            pass
+    raise _Stopped()
+
+
+def _get(source, failed):
+    """
+    Gets the next item from source, unless another stage failed.
+
+    """
+    while not failed:
+        try:
+            return source.get(timeout=0.05)
+        except queue.Empty:
+            pass
+    raise _Stopped()
+
+
+def measure_sequence(eyeone, stimuli, present, settle=0.0,
+        fields=("spectrum", "tristimulus"), convert=None, save=None,
+        queue_size=4, lock=None):
+    """
+    Presents and measures every stimulus and returns a list with one
+    measurement dict per stimulus.
+
+    The stages run on three threads:
+
+    1. present(stimulus), wait settle seconds and trigger (calling thread)
+    2. fetch fields of the triggered measurement (fetch thread)
+    3. convert and save (processing thread)
+
+    so presenting and settling of patch n + 1 overlaps with fetching,
+    converting and saving of patch n. The i1 Pro is only used by stage 1
+    and 2, which hand it over to each other, so the next trigger waits
+    for the last fetch, but never for conversion or saving. Up to
+    queue_size fetched measurements wait for stage 3; if it is slower,
+    the triggers are held back (backpressure).
+
+    Parameters:
+        eyeone: EyeOne
+        stimuli: iterable
+        present: callable
+            present(stimulus) shows the stimulus, e.g. sets the display
+            to an rgb value. It is always called in the calling thread.
+        settle: float or callable
+            seconds to wait after present before triggering or
+            settle(stimulus) returning them
+        fields: tuple of strings
+            see EyeOne.fetch
+        convert: callable or None
+            convert(measurement) returns a dict of further values (e.g.
+            converted colors), which are added to the measurement
+        save: callable or None
+            save(index, stimulus, measurement) is called in stimulus order
+        queue_size: int
+            number of fetched measurements waiting for conversion
+        lock: threading.Lock or None
+            held during every use of the i1 Pro, so other threads
+            sharing it (e.g. a DevicePool) are serialized
+
+    Every measurement dict contains the fields and "stimulus". Raises the
+    first exception of any stage, after the pipeline has stopped.
+
+    Example:
+
+    >>> measurements = measure_sequence(eo, rgb_values, display.show,
+    ...         settle=0.2, convert=lambda m: {"Lab": colorimetry.convert(
+    ...             m["spectrum"], constants.COLOR_SPACE_CIELab)},
+    ...         save=lambda i, rgb, m: store.append(m, metadata=repr(rgb)))
+
+    """
+    if lock is None:
+        lock = threading.Lock()
+    if not callable(settle):
+        settle_time = settle
+        settle = lambda stimulus: settle_time
+    # the i1 Pro keeps only the last measurement: the next trigger has to
+    # wait until the fetch thread has read it
+    fetched = threading.Semaphore(1)
+    to_fetch = queue.Queue(maxsize=1)
+    to_process = queue.Queue(maxsize=queue_size)
+    failed = list()
+    results = list()
+
+    def fetch():
+        try:
+            while True:
+                item = _get(to_fetch, failed)
+                if item is _DONE:
+                    break
+                index, stimulus = item
+                try:
+                    with lock:
+                        measurement = eyeone.fetch(fields)
+                finally:
+                    fetched.release()
+                _put(to_process, (index, stimulus, measurement), failed)
+        except _Stopped:
+            return
+        except BaseException as err:
+            failed.append(err)
+            return
+        _put(to_process, _DONE, failed)
+
+    def process():
+        try:
+            while True:
+                item = _get(to_process, failed)
+                if item is _DONE:
+                    break
+                index, stimulus, measurement = item
+                if convert is not None:
+                    measurement.update(convert(measurement))
+                measurement["stimulus"] = stimulus
+                if save is not None:
+                    save(index, stimulus, measurement)
+                results.append(measurement)
+        except _Stopped:
+            pass
+        except BaseException as err:
+            failed.append(err)
+
+    threads = [threading.Thread(target=fetch, name="measure_sequence.fetch"),
+            threading.Thread(target=process,
+                name="measure_sequence.process")]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    try:
+        for index, stimulus in enumerate(stimuli):
+            present(stimulus)
+            settle_until = time.time() + settle(stimulus)
+            while not fetched.acquire(timeout=0.05):
+                if failed:
+                    raise _Stopped()
+            if failed:
+                raise _Stopped()
+            left = settle_until - time.time()
+            if left > 0:
+                time.sleep(left)
+            with lock:
+                error = eyeone.I1_TriggerMeasurement()
+            if error != constants.eNoError:
+                fetched.release()
+                raise eyeone.error(error, "triggering measurement failed.")
+            _put(to_fetch, (index, stimulus), failed)
+        _put(to_fetch, _DONE, failed)
+    except _Stopped:
+        pass
+    except BaseException as err:
+        # stops the other stages
+        failed.append(err)
+    for thread in threads:
+        thread.join()
+    if failed:
+        raise failed[0]
+    return results
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/profiles.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) class MeasurementProfile
+#          (2) predefined profiles DISPLAY, PRINT, SCANNING
+#
+# input: --
+# output: --
+#
+# created 2026-10-18
+
+"""
+This module provides measurement profiles, i.e. named sets of option
+values, which are applied together with EyeOne.apply_profile.
+
+"""
+
+try:
+    from . import constants
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import constants
+
+# options have to be set in this order, because later options depend on
+# earlier ones (e.g. the device type selects the device, the measurement
+# mode decides which conditions are valid); unknown options come last
+OPTION_ORDER = (
+        constants.I1_DEVICE_TYPE,
+        constants.I1_MEASUREMENT_MODE,
+        constants.I1_IS_RECOGNITION_ENABLED,
+        constants.I1_SCREEN_TYPE,
+        constants.I1_PATCH_INTENSITY,
+        constants.I1_INTEGRATION_TIME,
+        constants.I1_IS_ADAPTIVE_MODE_ENABLED,
+        constants.I1_IS_BEEP_ENABLED,
+        constants.ILLUMINATION_KEY,
+        constants.OBSERVER_KEY,
+        constants.WHITE_BASE_KEY,
+        constants.DENSITY_STANDARD_KEY,
+        constants.DENSITY_FILTER_MODE_KEY,
+        constants.COLOR_SPACE_KEY,
+        )
+
+
+def _rank(option):
+    try:
+        return (OPTION_ORDER.index(option), option)
+    except ValueError:
+        return (len(OPTION_ORDER), option)
+
+
+class MeasurementProfile(object):
+    """
+    Immutable set of option values, kept in dependency order.
+
+    Example:
+
+    >>> print_profile = MeasurementProfile({
+    ...         constants.I1_MEASUREMENT_MODE:
+    ...             constants.I1_SINGLE_REFLECTANCE,
+    ...         constants.ILLUMINATION_KEY: constants.ILLUMINATION_D50,
+    ...         constants.COLOR_SPACE_KEY: constants.COLOR_SPACE_CIELab},
+    ...         name="print")
+    >>> eo.apply_profile(print_profile)
+
+    """
+
+    def __init__(self, options, name=None):
+        self.name = name
+        self._options = tuple(sorted(dict(options).items(),
+            key=lambda item: _rank(item[0])))
+
+    def __repr__(self):
+        return "MeasurementProfile(%r, name=%r)" % (dict(self._options),
+                self.name)
+
+    def __eq__(self, other):
+        return (isinstance(other, MeasurementProfile) and
+                self._options == other._options)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._options)
+
+    def __getitem__(self, option):
+        return dict(self._options)[option]
+
+    def items(self):
+        """
+        Returns (option, value) pairs in the order they have to be set.
+
+        """
+        return list(self._options)
+
+    def key(self):
+        """
+        Returns a string, which identifies the option values (but not the
+        name) of this profile.
+
+        """
+        return ";".join("%s=%s" % item for item in self._options)
+
+    def replace(self, options, name=None):
+        """
+        Returns a new profile with options changed.
+
+        """
+        merged = dict(self._options)
+        merged.update(options)
+        return MeasurementProfile(merged, name)
+
+    def diff(self, current):
+        """
+        Returns the (option, value) pairs, which differ from the dict
+        current, in the order they have to be set. If the device type
+        changes, all following options are returned, because the other
+        device has its own state.
+
+        """
+        changes = list()
+        for option, value in self._options:
+            if changes and changes[0][0] == constants.I1_DEVICE_TYPE:
+                changes.append((option, value))
+            elif current.get(option) != value:
+                changes.append((option, value))
+        return changes
+
+
+DISPLAY = MeasurementProfile({
+        constants.I1_MEASUREMENT_MODE: constants.I1_SINGLE_EMISSION,
+        constants.COLOR_SPACE_KEY: constants.COLOR_SPACE_CIExyY,
+        }, name="display")
+
+PRINT = MeasurementProfile({
+        constants.I1_MEASUREMENT_MODE: constants.I1_SINGLE_REFLECTANCE,
+        constants.ILLUMINATION_KEY: constants.ILLUMINATION_D50,
+        constants.OBSERVER_KEY: constants.OBSERVER_TWO_DEGREE,
+        constants.COLOR_SPACE_KEY: constants.COLOR_SPACE_CIELab,
+        }, name="print")
+
+SCANNING = MeasurementProfile({
+        constants.I1_MEASUREMENT_MODE: constants.I1_SCANNING_REFLECTANCE,
+        constants.I1_IS_RECOGNITION_ENABLED: constants.I1_YES,
+        constants.ILLUMINATION_KEY: constants.ILLUMINATION_D50,
+        constants.OBSERVER_KEY: constants.OBSERVER_TWO_DEGREE,
+        constants.COLOR_SPACE_KEY: constants.COLOR_SPACE_CIELab,
+        }, name="scanning")
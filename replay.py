@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/replay.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) class Recorder
+#          (2) class ReplayBackend
+#
+# input: trace file
+# output: trace file
+#
+# created 2026-10-18
+
+"""
+This module records all I1_* calls of an EyeOne into a trace file and
+replays such a trace as backend, so that a session with a real i1 Pro
+can be repeated without it (and without eyeone.dll).
+
+A trace is a gzip compressed file with one json object per line: a header
+and then one object per call with the function name "f", the arguments
+after the call "a" (so buffers contain what the i1 Pro wrote into them),
+the result "r", the start "s" (seconds since the recording started) and
+the duration "t" of the call.
+
+Example:
+
+>>> eo = eyeone.EyeOne()
+>>> eo.start_recording("session.trace.gz")
+>>> run_experiment(eo)
+>>> eo.stop_recording()
+
+and later, on any machine:
+
+>>> eo = eyeone.EyeOne(backend=ReplayBackend("session.trace.gz"))
+>>> run_experiment(eo)
+
+"""
+
+import gzip
+import json
+import threading
+import time
+from collections import deque
+
+try:
+    from . import constants
+    from .eyeone import I1_FUNCTIONS
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import constants
+    from eyeone import I1_FUNCTIONS
+
+FORMAT = "eyeone-trace"
+VERSION = 1
+
+# functions, which are polled and therefore called a different number of
+# times in every run
+POLLED_FUNCTIONS = ("I1_KeyPressed", "I1_IsConnected")
+
+# functions, which fill the buffer passed as first argument
+FILLING_FUNCTIONS = ("I1_GetSpectrum", "I1_GetTriStimulus",
+        "I1_GetDensities")
+
+
+def _encode(value):
+    """
+    Returns value (ctypes array or scalar, bytes, int) as json value.
+
+    """
+    if isinstance(value, bytes):
+        return value.decode("latin-1")
+    if hasattr(value, "_length_"):
+        # float32 has 7 significant digits
+        return [float("%.7g" % item) for item in value]
+    if hasattr(value, "value"):
+        return _encode(value.value)
+    return value
+
+
+class ReplayError(Exception):
+    """
+    Raised by ReplayBackend, if the calls differ from the trace or the
+    trace is exhausted.
+
+    """
+    pass
+
+
+class Recorder(object):
+    """
+    Writes every call reported by an instrument.Instrumentation trace to a
+    trace file. Usually created by EyeOne.start_recording.
+
+    next_trace is called with the same arguments afterwards, e.g. the
+    trace, which was set before the recording started.
+
+    """
+
+    def __init__(self, path, next_trace=None):
+        self.path = path
+        self.next_trace = next_trace
+        self.enabled_instrumentation = False
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._file = gzip.open(path, "wt")
+        self._start = time.time()
+        self._write({"format": FORMAT, "version": VERSION,
+            "created": self._start})
+
+    def _write(self, record):
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def record(self, name, args, result, seconds):
+        """
+        Instrumentation trace, which writes the call to the trace file.
+
+        """
+        record = {"f": name, "a": [_encode(arg) for arg in args],
+                "r": _encode(result), "t": round(seconds, 6),
+                "s": round(time.time() - seconds - self._start, 6)}
+        with self._lock:
+            if not self._file.closed:
+                self._write(record)
+                self.calls += 1
+        if self.next_trace is not None:
+            self.next_trace(name, args, result, seconds)
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def read_trace(path):
+    """
+    Returns the list of call records in the trace file path.
+
+    """
+    with gzip.open(path, "rt") as trace_file:
+        header = json.loads(trace_file.readline())
+        if header.get("format") != FORMAT or header.get("version") != VERSION:
+            raise ValueError("%s is no eyeone trace of version %i."
+                    % (path, VERSION))
+        return [json.loads(line) for line in trace_file if line.strip()]
+
+
+class ReplayBackend(object):
+    """
+    Backend for EyeOne(backend=...), which answers every I1_* call with
+    the next recorded call of the trace.
+
+    Parameters:
+        path: trace file written by EyeOne.start_recording
+        speed: float or None
+            every call starts after its recorded gap to the previous
+            call and takes its recorded duration, both divided by speed;
+            None replays as fast as possible
+        strict: bool
+            if True, a call, which is not the next recorded one (name and,
+            for options, the option), raises ReplayError. Otherwise the
+            next recorded call of the same function is used.
+
+    Polled functions (POLLED_FUNCTIONS) are called a different number of
+    times in every run: recorded polls, which are not asked for, are
+    skipped and once the recorded polls are used up, they answer
+    eNoError (key pressed, connected).
+
+    Attributes:
+        calls: dict, which maps function names to the number of calls
+
+    """
+
+    def __init__(self, path, speed=None, strict=True):
+        self.path = path
+        self.speed = speed
+        self.strict = strict
+        self.calls = dict()
+        self._records = read_trace(path)
+        self._next = 0
+        self._by_name = dict()
+        for index, record in enumerate(self._records):
+            self._by_name.setdefault(record["f"], deque()).append(index)
+        self._used = [False] * len(self._records)
+        self._lock = threading.Lock()
+        # time.time(), at which the recording started, scaled by speed
+        self._origin = None
+
+    def remaining(self):
+        """
+        Returns the number of recorded calls, which were not replayed.
+
+        """
+        return self._used.count(False)
+
+    def _take(self, name, args):
+        """
+        Returns the record, which answers the call name(*args).
+
+        """
+        indices = self._by_name.get(name, deque())
+        while indices and self._used[indices[0]]:
+            indices.popleft()
+        if self.strict:
+            while (self._next < len(self._records) and
+                    (self._used[self._next] or
+                        self._records[self._next]["f"] != name and
+                        self._records[self._next]["f"] in POLLED_FUNCTIONS)):
+                self._used[self._next] = True
+                self._next += 1
+            if self._next < len(self._records):
+                record = self._records[self._next]
+                if record["f"] == name:
+                    index = self._next
+                elif name in POLLED_FUNCTIONS:
+                    return None
+                else:
+                    raise ReplayError("call %i: expected %s, got %s."
+                            % (self._next, record["f"], name))
+            elif name in POLLED_FUNCTIONS:
+                return None
+            else:
+                raise ReplayError("trace exhausted, got %s." % name)
+        elif indices:
+            index = indices[0]
+        elif name in POLLED_FUNCTIONS:
+            return None
+        else:
+            raise ReplayError("no recorded %s left." % name)
+        record = self._records[index]
+        if (self.strict and name in ("I1_SetOption", "I1_GetOption") and
+                record["a"][0] != _encode(args[0])):
+            raise ReplayError("call %i: expected %s(%r), got %s(%r)."
+                    % (index, name, record["a"][0], name, _encode(args[0])))
+        self._used[index] = True
+        return record
+
+    def _replay(self, name, args):
+        with self._lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+            record = self._take(name, args)
+        if record is None:
+            return constants.eNoError
+        if self.speed:
+            self._wait(record)
+        if name in FILLING_FUNCTIONS and record["r"] == constants.eNoError:
+            values = record["a"][0]
+            buffer_ = args[0]
+            for i in range(min(len(buffer_), len(values))):
+                buffer_[i] = values[i]
+        if name == "I1_GetOption" and record["r"] is not None:
+            return record["r"].encode("latin-1")
+        return record["r"]
+
+    def _wait(self, record):
+        """
+        Sleeps until the recorded start of record, as far as the caller did
+        not spend the gap already, and for its recorded duration.
+
+        """
+        now = time.time()
+        with self._lock:
+            if self._origin is None:
+                self._origin = now - record["s"] / self.speed
+            delay = self._origin + record["s"] / self.speed - now
+        time.sleep(max(delay, 0) + record["t"] / self.speed)
+
+
+def _replayed(name):
+    def replay(self, *args):
+        return self._replay(name, args)
+    replay.__name__ = name
+    replay.__doc__ = "Replays the next recorded call of %s." % name
+    return replay
+
+for _name in I1_FUNCTIONS:
+    setattr(ReplayBackend, _name, _replayed(_name))
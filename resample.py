@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/resample.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) operator
+#          (2) resample
+#
+# input: --
+# output: --
+#
+# created 2026-10-18
+
+"""
+This module resamples spectra, e.g. from the 10 nm grid of the i1 Pro to
+1 nm or to the CIE range 360 nm to 830 nm. It needs numpy; scipy is only
+needed for sparse operators.
+
+Every interpolation is linear in the spectral values, so it is expressed
+as a matrix, which is built once per source grid, target grid, method and
+extrapolation and kept in operators. Resampling many spectra is then a
+single matrix product:
+
+>>> import numpy, resample
+>>> spectra_1nm = resample.resample(scan["spectrum"],
+...         numpy.arange(360, 831))
+
+"""
+
+from __future__ import division
+
+import numpy
+
+try:
+    from . import colorimetry
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import colorimetry
+
+LINEAR = "linear"
+SPRAGUE = "sprague"
+CUBIC = "cubic"
+METHODS = (LINEAR, SPRAGUE, CUBIC)
+
+# values outside of the source grid are the first/last value, zero,
+# continue the first/last segment, or raise a ValueError
+EXTRAPOLATE_CONSTANT = "constant"
+EXTRAPOLATE_ZERO = "zero"
+EXTRAPOLATE_LINEAR = "linear"
+EXTRAPOLATE_RAISE = "raise"
+EXTRAPOLATIONS = (EXTRAPOLATE_CONSTANT, EXTRAPOLATE_ZERO,
+        EXTRAPOLATE_LINEAR, EXTRAPOLATE_RAISE)
+
+# coefficients of the two extra points at each end and of the
+# interpolating polynomial (CIE 167:2005)
+_SPRAGUE_ENDS = numpy.array([
+        [884, -1960, 3033, -2648, 1080, -180],
+        [508, -540, 488, -367, 144, -24],
+        [-24, 144, -367, 488, -540, 508],
+        [-180, 1080, -2648, 3033, -1960, 884],
+        ]) / 209
+_SPRAGUE_POLYNOMIAL = numpy.array([
+        [2, -16, 0, 16, -2, 0],
+        [-1, 16, -30, 16, -1, 0],
+        [-9, 39, -70, 66, -33, 7],
+        [13, -64, 126, -124, 61, -12],
+        [-5, 25, -50, 50, -25, 5],
+        ]) / 24
+
+
+def _interval(source, target):
+    """
+    Returns the index of the source interval of every target and the
+    position in it between 0 and 1.
+
+    """
+    index = numpy.clip(numpy.searchsorted(source, target, "right") - 1, 0,
+            len(source) - 2)
+    position = (target - source[index]) / (source[index + 1] -
+            source[index])
+    return index, position
+
+
+def _linear_rows(source, target):
+    index, position = _interval(source, target)
+    rows = numpy.zeros((len(target), len(source)))
+    rows[numpy.arange(len(target)), index] = 1 - position
+    rows[numpy.arange(len(target)), index + 1] += position
+    return rows
+
+
+def _sprague_rows(source, target):
+    n = len(source)
+    if n < 6:
+        raise ValueError("sprague interpolation needs at least 6 points.")
+    steps = numpy.diff(source)
+    if not numpy.allclose(steps, steps[0]):
+        raise ValueError("sprague interpolation needs a uniform grid.")
+    # source values to values with two extra points at each end
+    extend = numpy.zeros((n + 4, n))
+    extend[0, :6] = _SPRAGUE_ENDS[0]
+    extend[1, :6] = _SPRAGUE_ENDS[1]
+    extend[2:n + 2] = numpy.eye(n)
+    extend[n + 2, -6:] = _SPRAGUE_ENDS[2]
+    extend[n + 3, -6:] = _SPRAGUE_ENDS[3]
+    index, position = _interval(source, target)
+    powers = position[:, numpy.newaxis] ** numpy.arange(1, 6)
+    rows = numpy.zeros((len(target), n + 4))
+    everything = numpy.arange(len(target))
+    rows[everything, index + 2] = 1
+    weights = powers.dot(_SPRAGUE_POLYNOMIAL)
+    for offset in range(6):
+        rows[everything, index + offset] += weights[:, offset]
+    return rows.dot(extend)
+
+
+def _cubic_rows(source, target):
+    """
+    Natural cubic spline.
+
+    """
+    n = len(source)
+    if n < 3:
+        return _linear_rows(source, target)
+    steps = numpy.diff(source)
+    # second derivatives = second.dot(values)
+    system = numpy.zeros((n, n))
+    right = numpy.zeros((n, n))
+    system[0, 0] = system[-1, -1] = 1
+    for i in range(1, n - 1):
+        system[i, i - 1] = steps[i - 1] / 6
+        system[i, i] = (steps[i - 1] + steps[i]) / 3
+        system[i, i + 1] = steps[i] / 6
+        right[i, i - 1] = 1 / steps[i - 1]
+        right[i, i] = -1 / steps[i - 1] - 1 / steps[i]
+        right[i, i + 1] = 1 / steps[i]
+    second = numpy.linalg.solve(system, right)
+    index, position = _interval(source, target)
+    everything = numpy.arange(len(target))
+    rows = numpy.zeros((len(target), n))
+    rows[everything, index] = 1 - position
+    rows[everything, index + 1] += position
+    h_squared = steps[index] ** 2 / 6
+    a = 1 - position
+    rows += (((a ** 3 - a) * h_squared)[:, numpy.newaxis] * second[index] +
+            ((position ** 3 - position) * h_squared)[:, numpy.newaxis] *
+            second[index + 1])
+    return rows
+
+
+_ROWS = {
+        LINEAR: _linear_rows,
+        SPRAGUE: _sprague_rows,
+        CUBIC: _cubic_rows,
+        }
+
+
+def _operator(source, target, method, extrapolation):
+    """
+    Builds the operator. See operator.
+
+    """
+    if method not in _ROWS:
+        raise ValueError("unknown interpolation method: " + str(method))
+    if extrapolation not in EXTRAPOLATIONS:
+        raise ValueError("unknown extrapolation: " + str(extrapolation))
+    source = numpy.asarray(source, dtype=numpy.float64)
+    target = numpy.asarray(target, dtype=numpy.float64)
+    if len(source) < 2 or numpy.any(numpy.diff(source) <= 0):
+        raise ValueError("source wavelengths have to increase.")
+    below = target < source[0]
+    above = target > source[-1]
+    if extrapolation == EXTRAPOLATE_RAISE and (below.any() or above.any()):
+        raise ValueError("target wavelengths outside of %g nm to %g nm."
+                % (source[0], source[-1]))
+    inside = ~(below | above)
+    rows = numpy.zeros((len(target), len(source)))
+    rows[inside] = _ROWS[method](source, target[inside])
+    if extrapolation == EXTRAPOLATE_CONSTANT:
+        rows[below, 0] = 1
+        rows[above, -1] = 1
+    elif extrapolation == EXTRAPOLATE_LINEAR:
+        rows[below] = _linear_rows(source, target[below])
+        rows[above] = _linear_rows(source, target[above])
+    return rows.T.copy()
+
+
+# in-memory cache of all operators; set operators.cache_dir to keep them
+# on disk as well
+operators = colorimetry.MatrixCache(_operator, prefix="resample")
+
+
+def _sparse_operator(source, target, method, extrapolation):
+    """
+    Builds the sparse form of the cached dense operator.
+
+    """
+    import scipy.sparse
+    return scipy.sparse.csc_matrix(operators.get(source, target, method,
+        extrapolation))
+
+# in-memory cache of the sparse operators
+sparse_operators = colorimetry.MatrixCache(_sparse_operator,
+        prefix="resample-sparse")
+
+
+def operator(target, source=colorimetry.DEVICE_WAVELENGTHS, method=SPRAGUE,
+        extrapolation=EXTRAPOLATE_CONSTANT, sparse=False):
+    """
+    Returns the matrix of shape (len(source), len(target)), which
+    resamples spectra on source to target with spectra.dot(matrix).
+
+    Parameters:
+        target: wavelengths in nm
+        source: increasing wavelengths in nm
+            SPRAGUE needs a uniform grid with at least 6 points
+        method: LINEAR, SPRAGUE or CUBIC
+        extrapolation: one of EXTRAPOLATIONS
+        sparse: bool
+            if True, the matrix is returned as scipy.sparse.csc_matrix
+            (every target depends on at most 6 source points for LINEAR
+            and SPRAGUE)
+
+    The matrices are cached; the dense ones are read-only, the sparse ones
+    must not be changed either.
+
+    """
+    key = (colorimetry._grid_key(source), colorimetry._grid_key(target),
+            method, extrapolation)
+    if sparse:
+        return sparse_operators.get(*key)
+    return operators.get(*key)
+
+
+def resample(spectra, target, source=colorimetry.DEVICE_WAVELENGTHS,
+        method=SPRAGUE, extrapolation=EXTRAPOLATE_CONSTANT):
+    """
+    Returns spectra (shape (n, len(source)) or (len(source),)) resampled
+    to target. See operator.
+
+    With 36 source bands a dense matrix product is faster than a sparse
+    one, so the dense operator is used here.
+
+    """
+    spectra = numpy.asarray(spectra)
+    matrix = operator(target, source, method, extrapolation)
+    if spectra.dtype == numpy.float32:
+        matrix = matrix.astype(numpy.float32)
+    return spectra.dot(matrix)
@@ -0,0 +1,463 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/simulator.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) class SimulatedBackend
+#
+# input: --
+# output: --
+#
+# created 2026-10-18
+
+"""
+This module provides a simulated i1 Pro, which can be plugged into EyeOne
+as backend. Other than the dummy it takes time like a real device,
+produces plausible spectra, and can be told to fail. It needs numpy.
+
+Example:
+
+>>> import eyeone, simulator
+>>> backend = simulator.SimulatedBackend(seed=42, time_scale=0.0)
+>>> eo = eyeone.EyeOne(backend=backend)
+
+"""
+
+from __future__ import division
+
+import random
+import threading
+import time
+from collections import deque
+
+import numpy
+
+try:
+    from . import colorimetry
+    from . import constants
+    from . import density
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import colorimetry
+    import constants
+    import density
+
+# seconds a call takes on a real i1 Pro; the trigger latencies are the
+# integration times of the measurement modes, scanning adds SCAN_LATENCY
+# per patch
+LATENCIES = {
+        "I1_IsConnected": 0.0005,
+        "I1_KeyPressed": 0.0005,
+        "I1_GetNumberOfAvailableSamples": 0.0005,
+        "I1_Calibrate": 2.5,
+        "I1_GetSpectrum": 0.002,
+        "I1_GetTriStimulus": 0.001,
+        "I1_GetDensities": 0.001,
+        "I1_SetSubstrate": 0.001,
+        "I1_SetOption": 0.0002,
+        "I1_GetOption": 0.0002,
+        constants.I1_SINGLE_EMISSION: 1.0,
+        constants.I1_SINGLE_REFLECTANCE: 0.6,
+        constants.I1_SINGLE_AMBIENT_LIGHT: 1.0,
+        constants.I1_SCANNING_REFLECTANCE: 1.0,
+        constants.I1_SCANNING_AMBIENT_LIGHT: 1.0,
+        }
+SCAN_LATENCY = 0.05
+
+# functions, in which the injectable errors can occur
+ERROR_FUNCTIONS = {
+        constants.eDeviceNotReady: ("I1_Calibrate",
+            "I1_TriggerMeasurement"),
+        constants.eDeviceNotCalibrated: ("I1_TriggerMeasurement",),
+        constants.eStripRecognitionFailed: ("I1_TriggerMeasurement",),
+        constants.eException: ("I1_Calibrate", "I1_TriggerMeasurement"),
+        }
+
+# peak wavelength, width and peak radiance in W/(sr m^2 nm) of the
+# primaries of the simulated display
+PRIMARIES = ((610.0, 18.0, 0.0030), (545.0, 30.0, 0.0020),
+        (450.0, 12.0, 0.0045))
+
+MEASUREMENT_MODES = (constants.I1_SINGLE_EMISSION,
+        constants.I1_SINGLE_REFLECTANCE, constants.I1_SINGLE_AMBIENT_LIGHT,
+        constants.I1_SCANNING_REFLECTANCE,
+        constants.I1_SCANNING_AMBIENT_LIGHT)
+
+_SCANNING_MODES = (constants.I1_SCANNING_REFLECTANCE,
+        constants.I1_SCANNING_AMBIENT_LIGHT)
+_EMISSION_MODES = (constants.I1_SINGLE_EMISSION,
+        constants.I1_SINGLE_AMBIENT_LIGHT,
+        constants.I1_SCANNING_AMBIENT_LIGHT)
+
+
+def _to_str(value):
+    if isinstance(value, bytes) and not isinstance(value, str):
+        return value.decode("ascii")
+    return getattr(value, "value", value)
+
+
+def _to_bytes(value):
+    if not isinstance(value, bytes):
+        return value.encode("ascii")
+    return value
+
+
+class SimulatedBackend(object):
+    """
+    Simulates an i1 Pro with timing and error model.
+
+    Parameters:
+        seed: seed of the random generator; the same seed gives the same
+            spectra and errors
+        time_scale: factor for all latencies; 0 makes every call instant
+        strip_length: number of patches of a simulated scan
+        noise: relative standard deviation of the measurement noise
+        error_rates: dict, which maps error codes of ERROR_FUNCTIONS to
+            the probability of the error per call
+        calibration_lifetime: seconds after which a calibration expires,
+            or None
+        key_delay: seconds between the first I1_KeyPressed poll of a wait
+            and the simulated key press
+        devices: number of simulated i1 Pros; they are selected with
+            I1_DEVICE_TYPE (EyeOne, EyeOne1, ...) and each one has its own
+            options and calibration
+
+    Set display_rgb to a tuple of three values between 0 and 1 to choose
+    the color the simulated display shows in emission mode; if it is None,
+    a random color is shown for every measurement. Errors can also be
+    scheduled for the next calls with inject. Functions, which return a
+    value instead of an error code, report an injected error through
+    I1_LAST_ERROR: I1_GetNumberOfAvailableSamples returns 0 and
+    I1_GetOption None.
+
+    Attribute calls counts the calls per function.
+
+    """
+
+    def __init__(self, seed=None, time_scale=1.0, strip_length=24,
+            noise=0.002, error_rates=None, calibration_lifetime=None,
+            key_delay=0.0, devices=1):
+        self.random = random.Random(seed)
+        self.seed = seed
+        self.time_scale = time_scale
+        self.strip_length = strip_length
+        self.noise = noise
+        self.error_rates = dict(error_rates or {})
+        self.calibration_lifetime = calibration_lifetime
+        self.key_delay = key_delay
+        self.devices = devices
+        self.latencies = dict(LATENCIES)
+        self.display_rgb = None
+        self.calls = dict()
+        self._injected = deque()
+        self._key_wait_start = None
+        self._key_pressed = False
+        self._lock = threading.Lock()
+        # saved state of the i1 Pros, which are not selected
+        self._devices = dict()
+        self._reset()
+
+    def _device_types(self):
+        return [constants.I1_EYEONE] + [constants.I1_EYEONE + str(number)
+                for number in range(1, self.devices)]
+
+    def _reset(self, device_type=constants.I1_EYEONE):
+        """
+        Puts options, calibration and measurement of device_type into the
+        initial state and selects it.
+
+        """
+        number = self._device_types().index(device_type)
+        self.options = {
+                constants.I1_MEASUREMENT_MODE:
+                    constants.I1_SINGLE_REFLECTANCE,
+                constants.COLOR_SPACE_KEY: constants.COLOR_SPACE_CIELab,
+                constants.ILLUMINATION_KEY: constants.ILLUMINATION_D50,
+                constants.OBSERVER_KEY: constants.OBSERVER_TWO_DEGREE,
+                constants.I1_IS_RECOGNITION_ENABLED: constants.I1_NO,
+                constants.I1_DEVICE_TYPE: device_type,
+                constants.I1_VERSION: "3.4.3 simulated",
+                constants.I1_SERIAL_NUMBER: "SIM%06i" % (
+                    ((self.seed or 0) + number) % 1000000),
+                }
+        self._calibrated_mode = None
+        self._calibration_time = None
+        self._calibration_count = 0
+        self._spectra = None
+        self._substrate = None
+        self._last_error = None
+
+    _DEVICE_STATE = ("options", "_calibrated_mode", "_calibration_time",
+            "_calibration_count", "_spectra", "_substrate")
+
+    def _select(self, device_type):
+        """
+        Saves the state of the selected i1 Pro and restores the one of
+        device_type.
+
+        """
+        previous = self.options[constants.I1_DEVICE_TYPE]
+        if device_type == previous:
+            return
+        self._devices[previous] = dict((name, getattr(self, name)) for
+                name in self._DEVICE_STATE)
+        state = self._devices.pop(device_type, None)
+        if state is None:
+            self._reset(device_type)
+        else:
+            for name, value in state.items():
+                setattr(self, name, value)
+
+    def inject(self, error, func_name="I1_TriggerMeasurement", count=1):
+        """
+        Makes the next count calls of func_name return error.
+
+        """
+        for i in range(count):
+            self._injected.append((func_name, error))
+
+    def press_key(self):
+        """
+        Simulates a press of the key of the i1 Pro.
+
+        """
+        self._key_pressed = True
+
+    def _call(self, func_name, latency=None, excluded=()):
+        """
+        Counts the call, sleeps for its latency and returns an error code
+        to inject or None. Errors in excluded only occur, if they were
+        injected explicitly.
+
+        """
+        self.calls[func_name] = self.calls.get(func_name, 0) + 1
+        if latency is None:
+            latency = self.latencies[func_name]
+        if latency and self.time_scale:
+            time.sleep(latency * self.time_scale)
+        error = None
+        if self._injected and self._injected[0][0] == func_name:
+            error = self._injected.popleft()[1]
+        else:
+            for code, rate in sorted(self.error_rates.items()):
+                if (func_name in ERROR_FUNCTIONS.get(code, ()) and
+                        code not in excluded and
+                        self.random.random() < rate):
+                    error = code
+                    break
+        if error is not None:
+            self._last_error = (error, func_name)
+        return error
+
+    def _mode(self):
+        return self.options[constants.I1_MEASUREMENT_MODE]
+
+    def _is_calibrated(self):
+        if self._calibrated_mode != self._mode():
+            return False
+        if self.calibration_lifetime is None:
+            return True
+        return (time.time() - self._calibration_time <
+                self.calibration_lifetime)
+
+    ### spectra ###
+
+    def _emission_spectrum(self):
+        rgb = self.display_rgb
+        if rgb is None:
+            rgb = [self.random.random() for i in range(3)]
+        wavelengths = colorimetry.DEVICE_WAVELENGTHS
+        spectrum = numpy.zeros(constants.SPECTRUM_SIZE)
+        for level, (peak, width, radiance) in zip(rgb, PRIMARIES):
+            spectrum += level * radiance * numpy.exp(
+                    -0.5 * ((wavelengths - peak) / width) ** 2)
+        # black level of the display
+        return spectrum + 2e-6
+
+    def _reflectance_spectrum(self):
+        wavelengths = colorimetry.DEVICE_WAVELENGTHS
+        low = self.random.uniform(0.03, 0.6)
+        high = self.random.uniform(0.03, 0.9)
+        edge = self.random.uniform(420, 680)
+        slope = self.random.uniform(8, 40)
+        spectrum = low + (high - low) / (1 + numpy.exp(
+            (edge - wavelengths) / slope))
+        bump = self.random.uniform(-0.15, 0.15)
+        spectrum += bump * numpy.exp(-0.5 * ((wavelengths -
+            self.random.uniform(400, 700)) / 40) ** 2)
+        return numpy.clip(spectrum, 0.005, 1.0)
+
+    def _add_noise(self, spectra):
+        noise = numpy.array([self.random.gauss(1, self.noise)
+            for i in range(spectra.size)]).reshape(spectra.shape)
+        return spectra * noise
+
+    ### I1_* functions ###
+
+    def I1_IsConnected(self):
+        error = self._call("I1_IsConnected")
+        if error is not None:
+            return error
+        return constants.eNoError
+
+    def I1_KeyPressed(self):
+        error = self._call("I1_KeyPressed")
+        if error is not None:
+            return error
+        now = time.time()
+        if self._key_wait_start is None:
+            self._key_wait_start = now
+        if (self._key_pressed or now - self._key_wait_start >=
+                self.key_delay * self.time_scale):
+            self._key_pressed = False
+            self._key_wait_start = None
+            return constants.eNoError
+        return constants.eKeyNotPressed
+
+    def I1_GetNumberOfAvailableSamples(self):
+        error = self._call("I1_GetNumberOfAvailableSamples")
+        if error is not None or self._spectra is None:
+            return 0
+        return len(self._spectra)
+
+    def I1_Calibrate(self):
+        error = self._call("I1_Calibrate")
+        if error is not None:
+            return error
+        self._calibrated_mode = self._mode()
+        self._calibration_time = time.time()
+        self._calibration_count += 1
+        return constants.eNoError
+
+    def I1_TriggerMeasurement(self):
+        mode = self._mode()
+        if mode not in MEASUREMENT_MODES:
+            self._call("I1_TriggerMeasurement", 0.0)
+            return constants.eWrongMeasureMode
+        latency = self.latencies[mode]
+        if mode in _SCANNING_MODES:
+            latency += SCAN_LATENCY * self.strip_length
+        excluded = ()
+        if (mode not in _SCANNING_MODES or self.options.get(
+                constants.I1_IS_RECOGNITION_ENABLED) != constants.I1_YES):
+            excluded = (constants.eStripRecognitionFailed,)
+        with self._lock:
+            error = self._call("I1_TriggerMeasurement", latency, excluded)
+            self._spectra = None
+            if error == constants.eDeviceNotCalibrated:
+                self._calibrated_mode = None
+            if error is not None:
+                return error
+            if not self._is_calibrated():
+                return constants.eDeviceNotCalibrated
+            n_samples = self.strip_length if mode in _SCANNING_MODES else 1
+            if mode in _EMISSION_MODES:
+                make = self._emission_spectrum
+            else:
+                make = self._reflectance_spectrum
+            spectra = numpy.array([make() for i in range(n_samples)])
+            self._spectra = self._add_noise(spectra)
+            return constants.eNoError
+
+    def _fetch(self, func_name, array, size, index, compute):
+        error = self._call(func_name)
+        if error is not None:
+            return error
+        if len(array) != size:
+            return constants.eInvalidArgument
+        if self._spectra is None or not 0 <= index < len(self._spectra):
+            return constants.eNoDataAvailable
+        array[:] = [float(value) for value in compute(self._spectra[index])]
+        return constants.eNoError
+
+    def I1_GetSpectrum(self, spectrum, index):
+        return self._fetch("I1_GetSpectrum", spectrum,
+                constants.SPECTRUM_SIZE, index, lambda spectrum: spectrum)
+
+    def I1_GetTriStimulus(self, tri_stimulus, index):
+        if self._mode() in _EMISSION_MODES:
+            illumination = constants.ILLUMINATION_EMISSION
+        else:
+            illumination = self.options[constants.ILLUMINATION_KEY]
+        def compute(spectrum):
+            return colorimetry.convert(spectrum,
+                    self.options[constants.COLOR_SPACE_KEY], illumination,
+                    self.options[constants.OBSERVER_KEY])
+        return self._fetch("I1_GetTriStimulus", tri_stimulus,
+                constants.TRISTIMULUS_SIZE, index, compute)
+
+    def I1_GetDensities(self, densities, index):
+        if self._substrate is None:
+            self._call("I1_GetDensities")
+            return constants.eNoSubstrateWhite
+        standard = self.options.get(constants.DENSITY_STANDARD_KEY,
+                constants.DENSITY_STANDARD_ANSIT)
+        if standard not in density.FILTERS:
+            self._call("I1_GetDensities")
+            return constants.eInvalidArgument
+        def compute(spectrum):
+            return density.densities(spectrum, self._substrate, standard)
+        return self._fetch("I1_GetDensities", densities,
+                constants.DENSITY_SIZE, index, compute)
+
+    def I1_SetSubstrate(self, substrate_spectrum):
+        self._call("I1_SetSubstrate")
+        if len(substrate_spectrum) != constants.SPECTRUM_SIZE:
+            return constants.eInvalidArgument
+        self._substrate = numpy.maximum(numpy.array(substrate_spectrum[:]),
+                1e-5)
+        return constants.eNoError
+
+    def I1_SetOption(self, option, value):
+        error = self._call("I1_SetOption")
+        if error is not None:
+            return error
+        option = _to_str(option)
+        value = _to_str(value)
+        if option == constants.I1_RESET:
+            self._devices.clear()
+            self._reset(self.options[constants.I1_DEVICE_TYPE])
+            return constants.eNoError
+        if option == constants.I1_DEVICE_TYPE:
+            if value not in self._device_types():
+                return constants.eDeviceNotConnected
+            self._select(value)
+            return constants.eNoError
+        if option == constants.I1_MEASUREMENT_MODE:
+            if value not in MEASUREMENT_MODES:
+                return constants.eWrongMeasureMode
+            self._spectra = None
+        self.options[option] = value
+        return constants.eNoError
+
+    def I1_GetOption(self, option):
+        if self._call("I1_GetOption") is not None:
+            # NULL
+            return None
+        option = _to_str(option)
+        if option == constants.I1_LAST_CALIBRATION_TIME:
+            if self._calibration_time is None:
+                value = constants.UNDEFINED
+            else:
+                value = str(int(time.time() - self._calibration_time))
+        elif option == constants.I1_CALIBRATION_COUNT:
+            value = str(self._calibration_count)
+        elif option == constants.I1_NUMBER_OF_AVAILABLE_SAMPLES:
+            value = str(0 if self._spectra is None else len(self._spectra))
+        elif option == constants.I1_IS_CONNECTED:
+            value = constants.I1_YES
+        elif option == constants.I1_LAST_ERROR:
+            value = str(self._last_error[0] if self._last_error else
+                    constants.eNoError)
+        elif option == constants.I1_EXTENDED_ERROR_INFORMATION:
+            if self._last_error is None:
+                value = constants.UNDEFINED
+            else:
+                value = "simulated error %i in %s" % self._last_error
+        else:
+            value = self.options.get(option, constants.UNDEFINED)
+        return _to_bytes(value)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/stats.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) class RunningStats
+#          (2) class RollingStats
+#          (3) class AveragedMeasurement
+#
+# input: --
+# output: --
+#
+# created 2026-10-18
+
+"""
+This module provides online statistics for repeated measurements. It
+needs numpy.
+
+"""
+
+from __future__ import division
+
+import numpy
+
+
+class RunningStats(object):
+    """
+    Mean and variance of a stream of equally shaped arrays, updated with
+    Welford's algorithm, so no reading has to be kept.
+
+    """
+
+    def __init__(self, shape):
+        self.n = 0
+        self.mean = numpy.zeros(shape)
+        self._m2 = numpy.zeros(shape)
+
+    def add(self, values):
+        """
+        Adds one reading.
+
+        """
+        self.n += 1
+        delta = values - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (values - self.mean)
+
+    @property
+    def variance(self):
+        """
+        Sample variance (n - 1 in the denominator); infinite for n < 2.
+
+        """
+        if self.n < 2:
+            return numpy.full(self.mean.shape, numpy.inf)
+        return self._m2 / (self.n - 1)
+
+    @property
+    def standard_error(self):
+        """
+        Standard error of the mean; infinite for n < 2.
+
+        """
+        return numpy.sqrt(self.variance / max(self.n, 1))
+
+
+class RollingStats(object):
+    """
+    Mean, variance and linear drift (slope per second) of the last window
+    readings of a stream of equally shaped arrays.
+
+    The readings are kept in a ring buffer and the sums are updated, when
+    a reading enters or leaves the window, so add is O(1) and memory is
+    constant. The sums are recomputed from the buffer once per window to
+    keep rounding errors from accumulating.
+
+    """
+
+    def __init__(self, window, shape):
+        self.window = window
+        self.n = 0
+        self._values = numpy.zeros((window,) + tuple(numpy.atleast_1d(
+            shape)))
+        self._times = numpy.zeros(window)
+        self._next = 0
+        self._added = 0
+        self._t0 = None
+        self._recompute()
+
+    def _recompute(self):
+        values = self._values[:self.n]
+        times = self._times[:self.n]
+        self._sum = values.sum(axis=0)
+        self._sum_sq = (values ** 2).sum(axis=0)
+        self._sum_t = times.sum()
+        self._sum_tt = (times ** 2).sum()
+        self._sum_ty = numpy.tensordot(times, values, axes=(0, 0))
+
+    def add(self, values, timestamp):
+        """
+        Adds one reading taken at timestamp (seconds).
+
+        """
+        if self._t0 is None:
+            # times relative to the first reading keep the sums small
+            self._t0 = timestamp
+        t = timestamp - self._t0
+        values = numpy.asarray(values, dtype=float)
+        if self.n == self.window:
+            old_values = self._values[self._next]
+            old_t = self._times[self._next]
+            self._sum -= old_values
+            self._sum_sq -= old_values ** 2
+            self._sum_t -= old_t
+            self._sum_tt -= old_t ** 2
+            self._sum_ty -= old_t * old_values
+        else:
+            self.n += 1
+        self._values[self._next] = values
+        self._times[self._next] = t
+        self._next = (self._next + 1) % self.window
+        self._sum += values
+        self._sum_sq += values ** 2
+        self._sum_t += t
+        self._sum_tt += t ** 2
+        self._sum_ty += t * values
+        self._added += 1
+        if self._added % self.window == 0:
+            self._recompute()
+
+    @property
+    def full(self):
+        return self.n == self.window
+
+    @property
+    def mean(self):
+        return self._sum / max(self.n, 1)
+
+    @property
+    def variance(self):
+        """
+        Sample variance in the window; infinite for n < 2.
+
+        """
+        if self.n < 2:
+            return numpy.full(self._sum.shape, numpy.inf)
+        return numpy.maximum(self._sum_sq - self._sum ** 2 / self.n,
+                0) / (self.n - 1)
+
+    @property
+    def slope(self):
+        """
+        Least squares slope of the readings over time (per second) in the
+        window; nan for less than two distinct timestamps.
+
+        """
+        denominator = self.n * self._sum_tt - self._sum_t ** 2
+        if self.n < 2 or denominator <= 0:
+            return numpy.full(self._sum.shape, numpy.nan)
+        return (self.n * self._sum_ty - self._sum_t * self._sum) / \
+                denominator
+
+    @property
+    def duration(self):
+        """
+        Seconds between the oldest and the newest reading in the window.
+        O(1), as readings are added in the order of their timestamps.
+
+        """
+        if self.n == 0:
+            return 0.0
+        oldest = self._next if self.full else 0
+        return self._times[self._next - 1] - self._times[oldest]
+
+    def readings(self):
+        """
+        Returns (timestamps, values) of the window, oldest first.
+
+        """
+        order = numpy.roll(numpy.arange(self.n), -self._next if self.full
+                else 0)
+        return self._times[order] + (self._t0 or 0), self._values[order]
+
+
+class AveragedMeasurement(object):
+    """
+    Result of EyeOne.measure_averaged.
+
+    Attributes:
+        mean: dict, which maps every field to the mean of the readings
+        standard_error: dict, which maps every field to the standard error
+            of the mean per band or channel
+        n: number of readings
+        converged: True, if the target precision was reached before max_n
+
+    """
+
+    def __init__(self, mean, standard_error, n, converged):
+        self.mean = mean
+        self.standard_error = standard_error
+        self.n = n
+        self.converged = converged
+
+    def __getitem__(self, field):
+        return self.mean[field]
+
+    def __repr__(self):
+        return "AveragedMeasurement(n=%i, converged=%r)" % (self.n,
+                self.converged)
@@ -0,0 +1,341 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/store.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) class MeasurementStore
+#          (2) RECORD_DTYPE
+#
+# input: store file and its session index
+# output: store file and its session index
+#
+# created 2026-10-18
+
+"""
+This module provides an append-only binary file of measurements with fixed
+size float32 records, which is read as a memory-mapped numpy structured
+array.
+
+File layout: a header of HEADER_SIZE bytes (magic and record size)
+followed by records of RECORD_DTYPE. Every record carries a crc32 of its
+content, so a record torn by a crash is detected and cut off, when the
+file is opened again. Next to the file an index of the sessions is kept
+(<path>.idx), which is rebuilt or extended from the records, if it is
+missing or behind.
+
+"""
+
+import os
+import struct
+import time
+import zlib
+
+import numpy
+
+try:
+    from . import constants
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import constants
+
+MAGIC = b"EYEONE\x00\x01"
+HEADER_SIZE = 64
+METADATA_SIZE = 64
+
+RECORD_DTYPE = numpy.dtype([
+        ("timestamp", "<f8"),
+        ("session", "<u4"),
+        ("crc", "<u4"),
+        ("spectrum", "<f4", (constants.SPECTRUM_SIZE,)),
+        ("tristimulus", "<f4", (constants.TRISTIMULUS_SIZE,)),
+        ("densities", "<f4", (constants.DENSITY_SIZE,)),
+        ("metadata", "S%i" % METADATA_SIZE),
+        ])
+
+INDEX_DTYPE = numpy.dtype([
+        ("session", "<u4"),
+        ("start", "<i8"),
+        ("stop", "<i8"),
+        ("first_time", "<f8"),
+        ("last_time", "<f8"),
+        ])
+
+# records are scanned in chunks of this many records, when the index is
+# built, so the file is never loaded completely
+_CHUNK = 1 << 16
+
+
+def _crc(records):
+    """
+    Returns the crc32 of every record (without the crc field).
+
+    """
+    raw = numpy.ascontiguousarray(records).view(numpy.uint8).reshape(
+            len(records), RECORD_DTYPE.itemsize)
+    offset = RECORD_DTYPE.fields["crc"][1]
+    head, tail = raw[:, :offset], raw[:, offset + 4:]
+    return numpy.array([zlib.crc32(tail[i].tobytes(),
+        zlib.crc32(head[i].tobytes())) & 0xffffffff for i in
+        range(len(records))], dtype=numpy.uint32)
+
+
+class MeasurementStore(object):
+    """
+    Append-only store of measurements.
+
+    Parameters:
+        path: file name
+        sync: bool
+            if True, every append is fsynced, otherwise only flushed
+
+    Example:
+
+    >>> with MeasurementStore("session.i1s") as store:
+    ...     session = store.new_session()
+    ...     for rgb in stimuli:
+    ...         store.append(eo.measure(), session, metadata=repr(rgb))
+    >>> store = MeasurementStore("session.i1s")
+    >>> spectra = store.session(session)["spectrum"]
+
+    """
+
+    def __init__(self, path, sync=False):
+        self.path = path
+        self.sync = sync
+        self._records = None
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, "wb") as store_file:
+                store_file.write(MAGIC + struct.pack("<I",
+                    RECORD_DTYPE.itemsize) + b"\x00" * (HEADER_SIZE -
+                        len(MAGIC) - 4))
+        with open(path, "rb") as store_file:
+            header = store_file.read(HEADER_SIZE)
+        if (header[:len(MAGIC)] != MAGIC or struct.unpack("<I",
+            header[len(MAGIC):len(MAGIC) + 4])[0] != RECORD_DTYPE.itemsize):
+            raise ValueError("%s is no measurement store of this version."
+                    % path)
+        self._n = self._recover()
+        self._file = open(path, "ab")
+        self._index = self._load_index()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self._n
+
+    def _recover(self):
+        """
+        Cuts off torn records at the end of the file and returns the number
+        of complete records.
+
+        """
+        size = os.path.getsize(self.path) - HEADER_SIZE
+        n = size // RECORD_DTYPE.itemsize
+        while n > 0:
+            last = numpy.memmap(self.path, dtype=RECORD_DTYPE, mode="r",
+                    offset=HEADER_SIZE + (n - 1) * RECORD_DTYPE.itemsize,
+                    shape=(1,))
+            valid = _crc(last)[0] == last["crc"][0]
+            del last
+            if valid:
+                break
+            n -= 1
+        if HEADER_SIZE + n * RECORD_DTYPE.itemsize != size + HEADER_SIZE:
+            with open(self.path, "r+b") as store_file:
+                store_file.truncate(HEADER_SIZE + n * RECORD_DTYPE.itemsize)
+        return n
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+            self._save_index()
+        self._records = None
+
+    def flush(self):
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+
+    def extend(self, measurements, session=0, timestamps=None,
+            metadata=None):
+        """
+        Appends several measurements.
+
+        Parameters:
+            measurements: dict
+                maps "spectrum", "tristimulus" and/or "densities" to arrays
+                with one row per measurement; missing fields are NaN
+            session: int
+            timestamps: array or None
+                time.time() of every measurement, default now
+            metadata: list of str/bytes or None
+                at most METADATA_SIZE bytes each
+
+        """
+        n = len(next(iter(measurements.values())))
+        records = numpy.zeros(n, dtype=RECORD_DTYPE)
+        for field in ("spectrum", "tristimulus", "densities"):
+            if field in measurements:
+                records[field] = numpy.asarray(measurements[field]).reshape(
+                        n, -1)
+            else:
+                records[field] = numpy.nan
+        records["timestamp"] = time.time() if timestamps is None else \
+                timestamps
+        records["session"] = session
+        if metadata is not None:
+            encoded = [item.encode("utf-8") if not isinstance(item, bytes)
+                    else item for item in metadata]
+            if any(len(item) > METADATA_SIZE for item in encoded):
+                raise ValueError("metadata is longer than %i bytes."
+                        % METADATA_SIZE)
+            records["metadata"] = encoded
+        records["crc"] = _crc(records)
+        # one write per call, so a crash tears at most the last records
+        self._file.write(records.tobytes())
+        self.flush()
+        self._index_records(records, self._n)
+        self._n += n
+        self._records = None
+
+    def append(self, measurement, session=0, timestamp=None,
+            metadata=None):
+        """
+        Appends a single measurement, e.g. the dict returned by
+        EyeOne.measure.
+
+        """
+        self.extend(dict((field, numpy.asarray(data)[numpy.newaxis]) for
+            field, data in measurement.items()), session,
+            None if timestamp is None else [timestamp],
+            None if metadata is None else [metadata])
+
+    def records(self):
+        """
+        Returns all records as read-only memory-mapped structured array.
+
+        """
+        if self._records is None or len(self._records) != self._n:
+            if self._n == 0:
+                return numpy.zeros(0, dtype=RECORD_DTYPE)
+            self._records = numpy.memmap(self.path, dtype=RECORD_DTYPE,
+                    mode="r", offset=HEADER_SIZE, shape=(self._n,))
+        return self._records
+
+    ### session index ###
+
+    def _load_index(self):
+        index = numpy.zeros(0, dtype=INDEX_DTYPE)
+        try:
+            with open(self.path + ".idx", "rb") as index_file:
+                index = numpy.load(index_file)
+        except (IOError, OSError, ValueError):
+            pass
+        if index.dtype != INDEX_DTYPE:
+            index = numpy.zeros(0, dtype=INDEX_DTYPE)
+        # drop entries of records cut off by _recover
+        index = index[index["start"] < self._n]
+        if len(index):
+            index["stop"][-1] = min(index["stop"][-1], self._n)
+        self._index = [tuple(run) for run in index]
+        covered = int(index["stop"].max()) if len(index) else 0
+        if covered < self._n:
+            records = numpy.memmap(self.path, dtype=RECORD_DTYPE, mode="r",
+                    offset=HEADER_SIZE, shape=(self._n,))
+            for start in range(covered, self._n, _CHUNK):
+                self._index_records(records[start:start + _CHUNK], start)
+            del records
+            self._save_index()
+        return self._index
+
+    def _index_records(self, records, start):
+        """
+        Adds records, which start at record number start, to the index of
+        runs of the same session.
+
+        """
+        sessions = numpy.asarray(records["session"])
+        times = numpy.asarray(records["timestamp"])
+        breaks = numpy.flatnonzero(sessions[1:] != sessions[:-1]) + 1
+        bounds = numpy.concatenate(([0], breaks, [len(records)]))
+        for begin, end in zip(bounds[:-1], bounds[1:]):
+            session = int(sessions[begin])
+            last = self._index[-1] if self._index else None
+            if (last is not None and last[0] == session and
+                    last[2] == start + begin):
+                self._index[-1] = (session, last[1], start + end, last[3],
+                        float(times[end - 1]))
+            else:
+                self._index.append((session, start + begin, start + end,
+                    float(times[begin]), float(times[end - 1])))
+
+    def _save_index(self):
+        temp_path = "%s.idx.%i.tmp" % (self.path, os.getpid())
+        with open(temp_path, "wb") as index_file:
+            numpy.save(index_file, numpy.array(self._index,
+                dtype=INDEX_DTYPE))
+        os.rename(temp_path, self.path + ".idx")
+
+    def sessions(self):
+        """
+        Returns a dict, which maps every session to a list of (start, stop)
+        record ranges.
+
+        """
+        sessions = dict()
+        for session, start, stop, first_time, last_time in self._index:
+            sessions.setdefault(session, list()).append((start, stop))
+        return sessions
+
+    def new_session(self):
+        """
+        Returns a session number, which is not used in the store yet.
+
+        """
+        return max([run[0] for run in self._index] + [-1]) + 1
+
+    def session(self, session):
+        """
+        Returns the records of session. If the session is stored in one
+        piece, this is a memory-mapped view; otherwise a copy.
+
+        """
+        ranges = self.sessions().get(session, [])
+        records = self.records()
+        if len(ranges) == 1:
+            return records[ranges[0][0]:ranges[0][1]]
+        return numpy.concatenate([records[start:stop] for start, stop in
+            ranges] + [numpy.zeros(0, dtype=RECORD_DTYPE)])
+
+    def between(self, start_time, stop_time, session=None):
+        """
+        Returns the records with start_time <= timestamp < stop_time (of
+        session, if given). Only the runs of the index, which overlap the
+        interval, are touched and inside them the records are found by
+        binary search, so the timestamps within a session have to be non
+        decreasing.
+
+        """
+        records = self.records()
+        parts = list()
+        for run_session, start, stop, first_time, last_time in self._index:
+            if session is not None and run_session != session:
+                continue
+            if last_time < start_time or first_time >= stop_time:
+                continue
+            times = records["timestamp"][start:stop]
+            begin = numpy.searchsorted(times, start_time, "left")
+            end = numpy.searchsorted(times, stop_time, "left")
+            parts.append(records[start + begin:start + end])
+        if len(parts) == 1:
+            return parts[0]
+        return numpy.concatenate(parts + [numpy.zeros(0,
+            dtype=RECORD_DTYPE)])
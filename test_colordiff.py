@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# eyeone/test_colordiff.py
+#
+# (c) 2010-2012 Konstantin Sering, Nora Umbach, Dominik Wabersich
+# <colorlab[at]psycho.uni-tuebingen.de>
+#
+# GPL 3.0+ or (cc) by-sa (http://creativecommons.org/licenses/by-sa/3.0/)
+#
+# content: (1) class TestReferenceLibrary
+#
+# input: --
+# output: --
+#
+# created 2026-10-18
+
+"""
+Compares ReferenceLibrary.nearest with a brute force search.
+
+"""
+
+import unittest
+
+import numpy
+
+try:
+    from . import colordiff
+except (ImportError, ValueError):
+    # not imported as package, e.g. when running in the eyeone folder
+    import colordiff
+
+
+class TestReferenceLibrary(unittest.TestCase):
+
+    def test_neighbouring_cell(self):
+        library = colordiff.ReferenceLibrary(["in", "across"],
+                [[4.0, 2.5, 2.5], [5.01, 2.5, 2.5]],
+                formula=colordiff.DELTA_E_76)
+        names, differences = library.match([[4.99, 2.5, 2.5]])
+        self.assertEqual(names[0], "across")
+        self.assertAlmostEqual(differences[0], 0.02)
+
+    def test_brute_force(self):
+        random = numpy.random.RandomState(0)
+        labs = numpy.column_stack((random.uniform(0, 100, 2000),
+            random.normal(0, 40, 2000), random.normal(0, 40, 2000)))
+        queries = numpy.column_stack((random.uniform(0, 100, 500),
+            random.normal(0, 45, 500), random.normal(0, 45, 500)))
+        library = colordiff.ReferenceLibrary(numpy.arange(len(labs)), labs)
+        for formula in (colordiff.DELTA_E_76, colordiff.DELTA_E_94,
+                colordiff.DELTA_E_2000):
+            indices, differences = library.nearest(queries, 3, formula)
+            for query, found in zip(queries, differences):
+                expected = numpy.sort(colordiff.delta_e(labs, query,
+                    formula))[:3]
+                numpy.testing.assert_allclose(found, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()